@@ -0,0 +1,47 @@
+"""Time rounds of large pawn groups on a generated world.
+
+Run from the project root with, e.g.,
+
+    python benchmarks/pawn_group_benchmark.py --pawns 1000000 --rounds 10
+"""
+
+import argparse
+from random import Random
+from time import perf_counter
+
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.compiled_world import CompiledWorld
+from grasp_adventure.v5.pawn_group import PawnGroup, TransitionTable, np
+
+
+def run_benchmark(transitions, num_pawns, num_rounds, strategy, use_numpy, seed):
+    group = PawnGroup.at_location(transitions, "Room 0", num_pawns, use_numpy)
+    start = perf_counter()
+    group.run(num_rounds, strategy, Random(seed))
+    seconds_per_round = (perf_counter() - start) / num_rounds
+    backend = "numpy" if use_numpy else "stdlib"
+    print(f"{strategy:>8} {backend:>8} {seconds_per_round:>16.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the simulation of pawn groups"
+    )
+    parser.add_argument("-s", "--size", type=int, default=10_000)
+    parser.add_argument("-p", "--pawns", type=int, default=1_000_000)
+    parser.add_argument("-r", "--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    world = CompiledWorld.from_descriptions(generate_locations(args.size))
+    transitions = TransitionTable.from_compiled_world(world)
+    print(f"{'strategy':>8} {'backend':>8} {'seconds/round':>16}")
+    for use_numpy in [False, True] if np is not None else [False]:
+        for strategy in ["first", "random"]:
+            run_benchmark(
+                transitions, args.pawns, args.rounds, strategy, use_numpy, args.seed
+            )
+
+
+if __name__ == "__main__":
+    main()
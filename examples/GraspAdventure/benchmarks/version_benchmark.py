@@ -0,0 +1,294 @@
+"""Run the same scenarios against all versions of the game and compare them.
+
+The scenarios are
+
+- `create_world`: create the world from `dungeon_locations`,
+- `move`: move one step along a round trip through the dungeon,
+- `actions`: enumerate the actions available to a player.
+
+Not every version supports every scenario: locations in v1 have no
+connections, and players with a list of available actions only exist from v4
+on. For each version and scenario the time per operation and the memory
+needed by one operation are reported. The memory ("bytes") is the peak of the
+memory allocated during the operation as measured by `tracemalloc`, averaged
+over several operations; it is not the number of allocations, and memory that
+is freed again before the peak is not counted.
+
+Run from the project root with, e.g.,
+
+    python benchmarks/version_benchmark.py --save benchmarks/baseline.json
+
+and compare a later run against the stored baseline with
+
+    python benchmarks/version_benchmark.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from importlib import import_module
+from itertools import cycle
+from typing import Any, Callable
+
+from grasp_adventure.data.locations import dungeon_locations
+
+# Vestibule -> Entrance Hall -> Dark Corridor -> Entrance Hall -> Vestibule
+ROUTE = ["north", "west", "east", "south"]
+
+VERSIONS = ["v1", "v2a", "v2b", "v2c", "v3a", "v3b", "v3c", "v4", "v5"]
+SCENARIOS = ["create_world", "move", "actions"]
+
+Operation = Callable[[], Any]
+
+
+def module(version: str, name: str):
+    return import_module(f"grasp_adventure.{version}.{name}")
+
+
+@dataclass
+class VersionAdapter:
+    """Create the operations of the scenarios for one version.
+
+    Each factory returns a function that performs a single operation, or the
+    factory is `None` if the version doesn't support the scenario."""
+
+    create_world: Callable[[], Operation]
+    move: Callable[[], Operation] | None = None
+    actions: Callable[[], Operation] | None = None
+
+
+def _create_world_with_class_method(version):
+    world_class = module(version, "world").World
+    return lambda: lambda: world_class.from_location_descriptions(dungeon_locations)
+
+
+def _create_world_with_world_factory(version):
+    factory = module(version, "world_factory").WorldFactory
+    return lambda: lambda: factory.create(dungeon_locations)
+
+
+def _create_world_with_game_factory(version):
+    factory_class = module(version, "game_factory").GameFactory
+    return lambda: lambda: factory_class().create_world(dungeon_locations)
+
+
+def _move_v2a():
+    world = module("v2a", "world").World.from_location_descriptions(
+        dungeon_locations
+    )
+    directions = cycle(ROUTE)
+    state = {"location": world[world.initial_location_name]}
+
+    def move():
+        state["location"] = world.connection(state["location"], next(directions))
+
+    return move
+
+
+def _move_by_location_lookup(create_world: Callable[[], Operation]):
+    def factory():
+        world = create_world()()
+        directions = cycle(ROUTE)
+        state = {"location": world[world.initial_location_name]}
+
+        def move():
+            state["location"] = state["location"][next(directions)]
+
+        return move
+
+    return factory
+
+
+def _move_v3a():
+    world = module("v3a", "world_factory").WorldFactory.create(dungeon_locations)
+    pawn = module("v3a", "pawn").Pawn("Pawn", world[world.initial_location_name])
+    directions = cycle(ROUTE)
+    return lambda: pawn.move(next(directions))
+
+
+def _move_v3b():
+    world = module("v3b", "world_factory").WorldFactory.create(dungeon_locations)
+    pawn_module = module("v3b", "pawn")
+    pawn = pawn_module.Pawn("Pawn", world[world.initial_location_name])
+    move_action = pawn_module.Action.MOVE
+    directions = cycle(ROUTE)
+    return lambda: pawn.perform_action(move_action, direction=next(directions))
+
+
+def _move_v3c():
+    world = module("v3c", "world_factory").WorldFactory.create(dungeon_locations)
+    pawn = module("v3c", "pawn").Pawn("Pawn", world[world.initial_location_name])
+    move_action = module("v3c", "action").MoveAction
+    directions = cycle(ROUTE)
+
+    def move():
+        direction = next(directions)
+        pawn.perform(move_action(direction, pawn.location[direction]))
+
+    return move
+
+
+def _create_player(version):
+    factory = module(version, "game_factory").GameFactory()
+    factory.create_world(dungeon_locations)
+    return factory.create_player("Player")
+
+
+def _move_with_player(version):
+    def factory():
+        player = _create_player(version)
+        move_action = module(version, "actions").MoveAction
+        directions = cycle(ROUTE)
+
+        def move():
+            direction = next(directions)
+            move_action(direction, player.location[direction]).execute(player)
+
+        return move
+
+    return factory
+
+
+def _actions_of_player(version):
+    def factory():
+        player = _create_player(version)
+        return lambda: player.actions
+
+    return factory
+
+
+def create_adapters() -> dict[str, VersionAdapter]:
+    create_world_v2b = _create_world_with_class_method("v2b")
+    create_world_v2c = _create_world_with_world_factory("v2c")
+    return {
+        "v1": VersionAdapter(_create_world_with_class_method("v1")),
+        "v2a": VersionAdapter(_create_world_with_class_method("v2a"), _move_v2a),
+        "v2b": VersionAdapter(
+            create_world_v2b, _move_by_location_lookup(create_world_v2b)
+        ),
+        "v2c": VersionAdapter(
+            create_world_v2c, _move_by_location_lookup(create_world_v2c)
+        ),
+        "v3a": VersionAdapter(_create_world_with_world_factory("v3a"), _move_v3a),
+        "v3b": VersionAdapter(_create_world_with_world_factory("v3b"), _move_v3b),
+        "v3c": VersionAdapter(_create_world_with_world_factory("v3c"), _move_v3c),
+        "v4": VersionAdapter(
+            _create_world_with_game_factory("v4"),
+            _move_with_player("v4"),
+            _actions_of_player("v4"),
+        ),
+        "v5": VersionAdapter(
+            _create_world_with_game_factory("v5"),
+            _move_with_player("v5"),
+            _actions_of_player("v5"),
+        ),
+    }
+
+
+def time_per_operation(
+    operation: Operation, repeat: int = 5, number: int | None = None
+) -> float:
+    """Return the time of one operation in seconds.
+
+    The operation is timed `repeat` times in loops of `number` operations; by
+    default `number` is chosen so that a loop takes at least 0.2 seconds."""
+    timer = timeit.Timer(operation)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def bytes_per_operation(operation: Operation, number: int = 100) -> float:
+    """Return the peak of the memory allocated during one operation in bytes,
+    averaged over `number` operations."""
+    operation()  # Fill caches and allocate lazily created objects.
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - current
+    finally:
+        tracemalloc.stop()
+    return total / number
+
+
+def run_benchmarks(
+    versions: list[str],
+    scenarios: list[str],
+    repeat: int = 5,
+    number: int | None = None,
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Run the scenarios that each version supports.
+
+    `repeat` and `number` are passed to `time_per_operation()`; `number` is
+    also the number of operations for `bytes_per_operation()`."""
+    adapters = create_adapters()
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    for version in versions:
+        for scenario in scenarios:
+            factory = getattr(adapters[version], scenario)
+            if factory is None:
+                continue
+            results.setdefault(version, {})[scenario] = {
+                "seconds": time_per_operation(factory(), repeat, number),
+                "bytes": bytes_per_operation(factory(), number or 100),
+            }
+    return results
+
+
+def print_results(results, baseline=None):
+    header = f"{'version':<8} {'scenario':<13} {'time [us]':>10} {'peak [B]':>9}"
+    if baseline is not None:
+        header += f" {'time/base':>10} {'peak/base':>11}"
+    print(header)
+    for version, scenarios in results.items():
+        for scenario, result in scenarios.items():
+            line = (
+                f"{version:<8} {scenario:<13} {result['seconds'] * 1e6:>10.2f} "
+                f"{result['bytes']:>9.0f}"
+            )
+            base = (baseline or {}).get(version, {}).get(scenario)
+            if base is not None:
+                line += (
+                    f" {ratio(result['seconds'], base['seconds']):>10.2f}"
+                    f" {ratio(result['bytes'], base['bytes']):>11.2f}"
+                )
+            print(line)
+
+
+def ratio(value: float, base: float) -> float:
+    return value / base if base else float("nan")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the versions of grasp_adventure against each other"
+    )
+    parser.add_argument("-v", "--versions", nargs="+", default=VERSIONS)
+    parser.add_argument("-s", "--scenarios", nargs="+", default=SCENARIOS)
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="number of timing loops"
+    )
+    parser.add_argument("--save", help="store the results as baseline in this file")
+    parser.add_argument("--compare", help="compare the results with this baseline")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.versions, args.scenarios, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+    print_results(results, baseline)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time the creation of large generated worlds and the simulation of rounds.
+
+Run from the project root with, e.g.,
+
+    python benchmarks/world_benchmark.py --sizes 1000 100000 --rounds 100
+"""
+
+import argparse
+from time import perf_counter
+
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.game import Game
+from grasp_adventure.v5.game_factory import GameFactory
+from grasp_adventure.v5.player import random_action_strategy
+from grasp_adventure.v5.simulation import run_headless
+
+
+def time_call(fun, *args):
+    start = perf_counter()
+    result = fun(*args)
+    return result, perf_counter() - start
+
+
+def run_benchmark(size, num_players, num_rounds, branching, object_density, seed):
+    location_descriptions, generate_time = time_call(
+        list,
+        generate_locations(
+            size, branching=branching, object_density=object_density, seed=seed
+        ),
+    )
+    factory = GameFactory()
+    world, world_time = time_call(factory.create_world, location_descriptions)
+    player_descriptions = [
+        {"name": f"Player {i}", "location": f"Room {i * size // num_players}"}
+        for i in range(num_players)
+    ]
+    players, players_time = time_call(factory.create_players, player_descriptions)
+    for player in players:
+        player.select_action = random_action_strategy
+    report = run_headless(Game(players=players, world=world), num_rounds)
+    print(
+        f"{size:>10} {generate_time:>10.3f} {world_time:>13.3f} "
+        f"{players_time:>15.3f} {report.rounds_per_second:>12.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark world creation and simulation on generated worlds"
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="numbers of rooms in the generated worlds",
+    )
+    parser.add_argument("-p", "--players", type=int, default=100)
+    parser.add_argument("-r", "--rounds", type=int, default=100)
+    parser.add_argument("-b", "--branching", type=float, default=0.3)
+    parser.add_argument("-o", "--object-density", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'rooms':>10} {'generate':>10} {'create_world':>13} "
+        f"{'create_players':>15} {'rounds/s':>12}"
+    )
+    for size in args.sizes:
+        run_benchmark(
+            size,
+            args.players,
+            args.rounds,
+            args.branching,
+            args.object_density,
+            args.seed,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,28 @@
 import argparse
+import asyncio
 
 
 def say_hi(name="world"):
     print(f"Hello, {name}!")
 
 
+def serve(host="127.0.0.1", port=8765, world_path=None):
+    from grasp_adventure.data.locations import dungeon_locations
+    from grasp_adventure.v5.compiled_world import CompiledWorld
+    from grasp_adventure.v5.server import GameServer
+    from grasp_adventure.v5.world_loader import read_location_file
+
+    if world_path is None:
+        location_descriptions = dungeon_locations
+    else:
+        location_descriptions = read_location_file(world_path)
+    world = CompiledWorld.from_descriptions(location_descriptions)
+    try:
+        asyncio.run(GameServer(world).serve_forever(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="grasp-adventure",
@@ -14,8 +32,19 @@ def main():
     parser.add_argument(
         "-n", "--name", default="world", help="the name of the person to greet"
     )
+    parser.add_argument(
+        "--serve", action="store_true", help="serve games over a local socket"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the host to serve on")
+    parser.add_argument("--port", type=int, default=8765, help="the port to serve on")
+    parser.add_argument(
+        "--world", help="a JSON Lines or binary file with location descriptions"
+    )
     args = parser.parse_args()
-    say_hi(args.name)
+    if args.serve:
+        serve(args.host, args.port, args.world)
+    else:
+        say_hi(args.name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+from math import ceil, isqrt
+from random import Random
+from typing import Any, Iterator, Sequence
+
+from .objects import object_descriptions
+
+_adjectives = [
+    "small",
+    "large",
+    "dark",
+    "brightly lit",
+    "damp",
+    "dusty",
+    "cold",
+    "narrow",
+]
+_kinds = ["room", "corridor", "hall", "chamber", "cave", "cellar"]
+
+
+def generate_locations(
+    num_locations: int,
+    *,
+    width: int | None = None,
+    branching: float = 0.3,
+    object_density: float = 0.05,
+    object_names: Sequence[str] = tuple(object_descriptions),
+    seed: int = 0,
+) -> Iterator[dict[str, Any]]:
+    """Generate location descriptions for a world with `num_locations` rooms.
+
+    The rooms are laid out in rows of `width` rooms (by default the world is
+    roughly square). Neighboring rooms in a row are connected east/west; each
+    pair of neighboring rows is connected north/south at one randomly chosen
+    column and additionally at every other column with probability `branching`.
+    Therefore all rooms are reachable from each other and all exits are
+    symmetric. Each room contains one of the `object_names` with probability
+    `object_density`.
+
+    The descriptions have the same format as the ones in
+    `grasp_adventure.data.locations`. They are generated lazily, one row at a
+    time, and depend only on the arguments; in particular the same `seed`
+    always produces the same world.
+
+    >>> locations = list(generate_locations(4, width=2, branching=0.0))
+    >>> [location["name"] for location in locations]
+    ['Room 0', 'Room 1', 'Room 2', 'Room 3']
+    >>> sorted(locations[0]["connections"].items())
+    [('east', 'Room 1'), ('north', 'Room 2')]
+    """
+    if num_locations <= 0:
+        return
+    if width is None:
+        width = max(1, isqrt(num_locations))
+    num_rows = ceil(num_locations / width)
+
+    def row_length(row: int) -> int:
+        return min(width, num_locations - row * width)
+
+    def vertical_links(row: int, rng: Random) -> set[int]:
+        """Columns at which `row` is connected to the row above it."""
+        if row + 1 >= num_rows:
+            return set()
+        columns = row_length(row + 1)
+        links = {rng.randrange(columns)}
+        links.update(column for column in range(columns) if rng.random() < branching)
+        return links
+
+    links_below: set[int] = set()
+    for row in range(num_rows):
+        rng = Random(f"{seed}:{row}")
+        links_above = vertical_links(row, rng)
+        for column in range(row_length(row)):
+            index = row * width + column
+            connections = {}
+            if column in links_above:
+                connections["north"] = f"Room {index + width}"
+            if column in links_below:
+                connections["south"] = f"Room {index - width}"
+            if column > 0:
+                connections["west"] = f"Room {index - 1}"
+            if column + 1 < row_length(row):
+                connections["east"] = f"Room {index + 1}"
+            description = {
+                "name": f"Room {index}",
+                "description": (
+                    f"You are in a {rng.choice(_adjectives)} {rng.choice(_kinds)}"
+                ),
+                "connections": connections,
+            }
+            if object_names and rng.random() < object_density:
+                description["objects"] = [rng.choice(object_names)]
+            yield description
+        links_below = links_above
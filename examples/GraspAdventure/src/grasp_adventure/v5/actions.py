@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .player import Player
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoveAction(Action):
     direction: str
     target: Location
@@ -21,7 +21,7 @@ class MoveAction(Action):
         instigator.location = self.target
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkipTurnAction(Action):
     @property
     def description(self) -> str:
@@ -32,7 +32,10 @@ class SkipTurnAction(Action):
         pass
 
 
-@dataclass
+SKIP_TURN_ACTION = SkipTurnAction()
+
+
+@dataclass(frozen=True)
 class InspectAction(Action):
     object: GameObject
 
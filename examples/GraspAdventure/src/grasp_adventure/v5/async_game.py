@@ -0,0 +1,84 @@
+"""Play games with an asyncio event loop.
+
+Strategies may be ordinary functions or coroutine functions. In every round the
+decisions of all players are gathered concurrently, based on the state at the
+start of the round, and then executed in the order of the players. A player
+whose strategy does not decide within the turn timeout skips the turn.
+
+In an instrumented game the selection time reported for a player is the time
+from the start of the round until its decision, which includes the time spent
+waiting for the strategies of other players.
+"""
+
+import asyncio
+import inspect
+from time import perf_counter_ns
+
+from .actions import SKIP_TURN_ACTION
+from .base_classes import Action
+from .game import Game
+from .player import Player
+
+
+async def select_action_async(player: Player, timeout: float | None = None) -> Action:
+    """Ask the strategy of `player` for an action.
+
+    If the strategy is a coroutine function and does not return within
+    `timeout` seconds, `SKIP_TURN_ACTION` is returned instead."""
+    action = player.select_action(player)
+    if inspect.isawaitable(action):
+        try:
+            action = await asyncio.wait_for(action, timeout)
+        except asyncio.TimeoutError:
+            action = SKIP_TURN_ACTION
+    return action
+
+
+async def _select_action_timed(
+    player: Player, timeout: float | None, start: int
+) -> tuple[Action, int]:
+    action = await select_action_async(player, timeout)
+    return action, perf_counter_ns() - start
+
+
+async def run_round_async(game: Game, turn_timeout: float | None = None):
+    """Play one round of `game`, gathering the decisions of all players
+    concurrently."""
+    game.start_round()
+    start = perf_counter_ns()
+    selections = await asyncio.gather(
+        *(
+            _select_action_timed(player, turn_timeout, start)
+            for player in game.players
+        )
+    )
+    for player, (action, selection_ns) in zip(game.players, selections):
+        origin = player.location
+        player.execute_action(action, selection_ns)
+        game.notify_action_executed(player, action, origin)
+    game.finish_round()
+
+
+async def play_async(game: Game, num_rounds: int, turn_timeout: float | None = None):
+    for _ in range(num_rounds):
+        await run_round_async(game, turn_timeout)
+
+
+async def async_interactive_action_strategy(player: Player) -> Action:
+    """Like `interactive_action_strategy`, but without blocking the event loop.
+
+    The input is read in a worker thread. If the turn times out, the thread
+    keeps waiting for the input, which is then discarded."""
+    actions = player.actions
+    print(f"Available actions for {player.description}:")
+    for i, action in enumerate(actions, 1):
+        print(f"{i}: {action.description}")
+    while True:
+        try:
+            choice = int(await asyncio.to_thread(input, "Your choice: "))
+            if 0 < choice <= len(actions):
+                return actions[choice - 1]
+            else:
+                print(f"Please enter a number between 1 and {len(actions)}!")
+        except ValueError:
+            print("Please enter a valid number!")
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from .game import Game
+    from .location import Location
     from .player import Player
 
 
@@ -21,3 +23,22 @@ class GameObject(ABC):
     @property
     def description(self):
         return str(self)
+
+
+class GameObserver:
+    """Base class for objects that want to be notified about the progress of a game.
+
+    All notifications do nothing by default, so subclasses only have to override
+    the methods they are interested in."""
+
+    def round_started(self, game: "Game") -> None:
+        pass
+
+    def action_executed(
+        self, game: "Game", player: "Player", action: Action, origin: "Location"
+    ) -> None:
+        """Called after `player` has executed `action` in location `origin`."""
+        pass
+
+    def round_finished(self, game: "Game") -> None:
+        pass
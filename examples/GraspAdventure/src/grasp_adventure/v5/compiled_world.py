@@ -0,0 +1,278 @@
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable, Iterator
+
+from .actions import SKIP_TURN_ACTION, InspectAction, MoveAction
+from .base_classes import Action, GameObject
+from .location import LocationDescription
+from .world import World
+
+
+class CompiledWorld:
+    """A compact, read-only representation of a world.
+
+    Locations and directions are identified by dense integer ids. The
+    connections are stored as adjacency arrays in compressed sparse row (CSR)
+    format: the connections of the location with id `i` are at the positions
+    `offsets[i]` to `offsets[i + 1]` of the arrays `direction_ids` and
+    `target_ids`. Equal descriptions are stored only once. The objects in the
+    locations are stored in the same way: the objects in location `i` are
+    `objects[j]` for the ids `j` at the positions `object_offsets[i]` to
+    `object_offsets[i + 1]` of `object_ids`.
+
+    The API of `World` and `Location` is available through `LocationView`
+    objects, which are created on demand:
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> world = CompiledWorld.from_descriptions(simple_locations)
+    >>> world["Room 1"]
+    LocationView(name='Room 1')
+    >>> world["Room 1"]["north"]
+    LocationView(name='Room 2')
+    >>> world.initial_location.description
+    'A small room'
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        description_ids: array,
+        descriptions: list[str],
+        directions: list[str],
+        offsets: array,
+        direction_ids: array,
+        target_ids: array,
+        initial_location_id: int = 0,
+        location_ids: dict[str, int] | None = None,
+        objects: list[GameObject] | None = None,
+        object_offsets: array | None = None,
+        object_ids: array | None = None,
+    ):
+        self.names = names
+        self.description_ids = description_ids
+        self.descriptions = descriptions
+        self.directions = directions
+        self.offsets = offsets
+        self.direction_ids = direction_ids
+        self.target_ids = target_ids
+        self.initial_location_id = initial_location_id
+        if location_ids is None:
+            location_ids = {name: i for i, name in enumerate(names)}
+        self.location_ids = location_ids
+        self.objects = [] if objects is None else objects
+        if object_offsets is None:
+            object_offsets = array("q", [0]) * (len(names) + 1)
+        self.object_offsets = object_offsets
+        self.object_ids = array("i") if object_ids is None else object_ids
+        self._direction_id_map = {d: i for i, d in enumerate(directions)}
+
+    @classmethod
+    def from_descriptions(
+        cls,
+        location_descriptions: Iterable[LocationDescription],
+        create_object: Callable[[Hashable], GameObject] | None = None,
+    ) -> "CompiledWorld":
+        """Compile a world in a single pass over its location descriptions.
+
+        The location descriptions may be an arbitrary iterable, e.g., a generator
+        reading them from a file. Connections to locations that have not been
+        described yet are recorded and patched once the target is defined.
+
+        Every object listed in the descriptions is created once by calling
+        `create_object` with its name; by default the objects are created by a
+        new `GameFactory`, just as for the worlds created by a factory."""
+        if create_object is None:
+            from .game_factory import GameFactory
+
+            create_object = GameFactory().create_object
+        location_ids: dict[str, int] = {}
+        names: list[str] = []
+        description_ids = array("i")
+        description_id_map: dict[str, int] = {}
+        direction_id_map: dict[str, int] = {}
+        offsets = array("q", [0])
+        direction_ids = array("H")
+        target_ids = array("i")
+        objects: list[GameObject] = []
+        object_id_map: dict[Hashable, int] = {}
+        object_offsets = array("q", [0])
+        object_ids = array("i")
+        pending: dict[str, list[int]] = {}
+
+        for data in location_descriptions:
+            name = data["name"]
+            if name in location_ids:
+                raise ValueError(f"Duplicate location name: {name!r}.")
+            location_id = len(names)
+            location_ids[name] = location_id
+            names.append(name)
+            for edge_index in pending.pop(name, ()):
+                target_ids[edge_index] = location_id
+            description = data.get("description", "")
+            description_ids.append(
+                description_id_map.setdefault(description, len(description_id_map))
+            )
+            for direction, target_name in data.get("connections", {}).items():
+                direction_ids.append(
+                    direction_id_map.setdefault(direction, len(direction_id_map))
+                )
+                target_id = location_ids.get(target_name)
+                if target_id is None:
+                    pending.setdefault(target_name, []).append(len(target_ids))
+                    target_id = -1
+                target_ids.append(target_id)
+            offsets.append(len(target_ids))
+            for object_name in data.get("objects", ()):
+                object_id = object_id_map.get(object_name)
+                if object_id is None:
+                    object_id = object_id_map[object_name] = len(objects)
+                    objects.append(create_object(object_name))
+                object_ids.append(object_id)
+            object_offsets.append(len(object_ids))
+
+        if pending:
+            unknown = ", ".join(repr(name) for name in pending)
+            raise ValueError(f"Connections to unknown locations: {unknown}.")
+        return cls(
+            names=names,
+            description_ids=description_ids,
+            descriptions=list(description_id_map),
+            directions=list(direction_id_map),
+            offsets=offsets,
+            direction_ids=direction_ids,
+            target_ids=target_ids,
+            location_ids=location_ids,
+            objects=objects,
+            object_offsets=object_offsets,
+            object_ids=object_ids,
+        )
+
+    @classmethod
+    def from_world(cls, world: World) -> "CompiledWorld":
+        """Compile an existing world.
+
+        The initial location of `world` becomes the initial location of the
+        compiled world; the compiled world contains the same objects."""
+        objects = {
+            id(game_object): game_object
+            for location in world.locations.values()
+            for game_object in location.objects
+        }
+        compiled_world = cls.from_descriptions(
+            (
+                {
+                    "name": location.name,
+                    "description": location.description,
+                    "connections": {
+                        direction: target.name
+                        for direction, target in location.connections.items()
+                    },
+                    "objects": [id(game_object) for game_object in location.objects],
+                }
+                for location in world.locations.values()
+            ),
+            objects.__getitem__,
+        )
+        compiled_world.initial_location_id = compiled_world.location_ids[
+            world.initial_location_name
+        ]
+        return compiled_world
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self) -> Iterator["LocationView"]:
+        return (LocationView(self, i) for i in range(len(self.names)))
+
+    def __getitem__(self, location_name: str) -> "LocationView":
+        """Get a location by name."""
+        return LocationView(self, self.location_ids[location_name])
+
+    @property
+    def initial_location_name(self) -> str:
+        return self.names[self.initial_location_id]
+
+    @property
+    def initial_location(self) -> "LocationView":
+        return LocationView(self, self.initial_location_id)
+
+    @property
+    def description(self):
+        return "Nothing noteworthy is happening in the world."
+
+    def neighbor_ids(self, location_id: int) -> array:
+        """Return the ids of all locations connected to `location_id`."""
+        start, end = self.offsets[location_id], self.offsets[location_id + 1]
+        return self.target_ids[start:end]
+
+    def location_objects(self, location_id: int) -> list[GameObject]:
+        """Return the objects in location `location_id`."""
+        objects = self.objects
+        start = self.object_offsets[location_id]
+        end = self.object_offsets[location_id + 1]
+        return [objects[object_id] for object_id in self.object_ids[start:end]]
+
+    def connection_id(self, location_id: int, direction: str) -> int | None:
+        """Return the id of the location in `direction`, or `None`."""
+        direction_id = self._direction_id_map.get(direction)
+        if direction_id is not None:
+            for edge_index in range(
+                self.offsets[location_id], self.offsets[location_id + 1]
+            ):
+                if self.direction_ids[edge_index] == direction_id:
+                    return self.target_ids[edge_index]
+        return None
+
+
+@dataclass(frozen=True)
+class LocationView:
+    """A location of a `CompiledWorld` with the same interface as `Location`."""
+
+    world: CompiledWorld
+    id: int
+
+    def __repr__(self):
+        return f"LocationView(name={self.name!r})"
+
+    @property
+    def name(self) -> str:
+        return self.world.names[self.id]
+
+    @property
+    def description(self) -> str:
+        return self.world.descriptions[self.world.description_ids[self.id]]
+
+    @property
+    def connections(self) -> dict[str, "LocationView"]:
+        world = self.world
+        return {
+            world.directions[world.direction_ids[i]]: LocationView(
+                world, world.target_ids[i]
+            )
+            for i in range(world.offsets[self.id], world.offsets[self.id + 1])
+        }
+
+    @property
+    def objects(self) -> list[GameObject]:
+        return self.world.location_objects(self.id)
+
+    def __getitem__(self, direction: str) -> "LocationView | None":
+        target_id = self.world.connection_id(self.id, direction)
+        if target_id is None:
+            return None
+        return LocationView(self.world, target_id)
+
+    @property
+    def move_actions(self) -> tuple[Action, ...]:
+        return tuple(
+            MoveAction(direction, location)
+            for direction, location in self.connections.items()
+        )
+
+    @property
+    def turn_actions(self) -> tuple[Action, ...]:
+        return (
+            *self.move_actions,
+            *(InspectAction(game_object) for game_object in self.objects),
+            SKIP_TURN_ACTION,
+        )
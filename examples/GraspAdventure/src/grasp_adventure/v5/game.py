@@ -1,29 +1,180 @@
-from dataclasses import dataclass
-from io import StringIO
+from dataclasses import dataclass, field, replace
+from typing import IO
 
+from .base_classes import Action, GameObserver
+from .instrumentation import Instrumentation
+from .location import Location
+from .pawn import Pawn
 from .player import Player
+from .random_streams import RandomStream, derive_seed
 from .world import World
 
 
+@dataclass(frozen=True)
+class GameSnapshot:
+    """The mutable state of a game at one point in time.
+
+    The world is not part of the snapshot: no action changes it, so all
+    snapshots and forks of a game share the same world."""
+
+    round_number: int
+    player_locations: tuple[Location, ...]
+    player_rng_states: tuple[tuple | None, ...] = ()
+
+
 @dataclass
 class Game:
     players: list[Player]
     world: World
+    observers: list[GameObserver] = field(default_factory=list)
+    round_number: int = 0
+    seed: int | None = None
+    instrumentation: Instrumentation | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    _description_keys: list[tuple[str, Location] | None] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _description_lines: list[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _world_description: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _description: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.seed is not None:
+            self.reseed(self.seed)
+
+    def reseed(self, seed: int):
+        """Give every player a new random stream derived from `seed`.
+
+        The stream of a player depends only on `seed` and the position of the
+        player, so a game with the same seed and players is repeatable."""
+        self.seed = seed
+        for i, player in enumerate(self.players):
+            player.rng = RandomStream(derive_seed(seed, "player", i))
 
     @property
-    def description(self):
-        io = StringIO()
-        for player in self.players:
-            print(player.description, file=io)
-        print(self.world.description, file=io)
-        return io.getvalue()
+    def description(self) -> str:
+        """One line per player, followed by the description of the world.
+
+        Only the lines of players whose name or location has changed since
+        the last call are rendered again; if nothing has changed, the previous
+        result is returned."""
+        keys = self._description_keys
+        lines = self._description_lines
+        num_players = len(self.players)
+        if len(keys) != num_players:
+            del keys[num_players:], lines[num_players:]
+            keys.extend([None] * (num_players - len(keys)))
+            lines.extend([""] * (num_players - len(lines)))
+            self._description = None
+        for i, player in enumerate(self.players):
+            key = keys[i]
+            name, location = player.name, player.location
+            if key is None or key[0] is not name or key[1] is not location:
+                keys[i] = (name, location)
+                lines[i] = f"{player.description}\n"
+                self._description = None
+        world_description = self.world.description
+        if world_description != self._world_description:
+            self._world_description = world_description
+            self._description = None
+        if self._description is None:
+            self._description = "".join(lines) + f"{world_description}\n"
+        return self._description
+
+    def write_description(self, file: IO[str]):
+        """Write the description to `file`, e.g., a reused `StringIO` buffer."""
+        file.write(self.description)
 
     def play_round(self):
-        for player in self.players:
-            player.take_turn()
+        self.run_round()
         self.print_round_header()
         print(self.description)
 
+    def run_round(self):
+        """Let every player take a turn without producing any output."""
+        self.start_round()
+        for player in self.players:
+            origin = player.location
+            action = player.take_turn()
+            self.notify_action_executed(player, action, origin)
+        self.finish_round()
+
+    def instrument(self, instrumentation: Instrumentation | None):
+        """Report the timing of rounds and turns to `instrumentation`.
+
+        Pass `None` to disable the instrumentation."""
+        self.instrumentation = instrumentation
+        for player in self.players:
+            player.instrumentation = instrumentation
+
+    def start_round(self):
+        self.round_number += 1
+        if self.instrumentation is not None:
+            self.instrumentation.round_started(self)
+        for observer in self.observers:
+            observer.round_started(self)
+
+    def notify_action_executed(self, player: Player, action: Action, origin: Location):
+        for observer in self.observers:
+            observer.action_executed(self, player, action, origin)
+
+    def finish_round(self):
+        for observer in self.observers:
+            observer.round_finished(self)
+        if self.instrumentation is not None:
+            self.instrumentation.round_finished(self)
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture the state of the game; restore it with `restore()`."""
+        return GameSnapshot(
+            self.round_number,
+            tuple(player.location for player in self.players),
+            tuple(
+                None if player.rng is None else player.rng.getstate()
+                for player in self.players
+            ),
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        for player, location in zip(self.players, snapshot.player_locations):
+            player.location = location
+        for player, rng_state in zip(self.players, snapshot.player_rng_states):
+            if rng_state is not None and player.rng is not None:
+                player.rng.setstate(rng_state)
+        self.round_number = snapshot.round_number
+
+    def fork(self) -> "Game":
+        """Return an independent copy of this game that shares the world.
+
+        Only the players and their pawns are copied, so the cost of a fork does
+        not depend on the size of the world. Observers and instrumentation are
+        not copied. The random streams of the players are copied, so the fork
+        makes the same random choices as the original game."""
+        fork = Game(
+            players=[
+                replace(
+                    player,
+                    pawn=Pawn(player.location),
+                    instrumentation=None,
+                    rng=None if player.rng is None else player.rng.copy(),
+                )
+                for player in self.players
+            ],
+            world=self.world,
+            round_number=self.round_number,
+        )
+        # Assigned after creation, so that the copied streams are not reseeded.
+        fork.seed = self.seed
+        return fork
+
     @staticmethod
     def print_round_header():
         header = "Playing a round."
@@ -1,22 +1,34 @@
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Collection, Iterable, Mapping
+from os import PathLike
+from typing import Any, Callable
 
+from grasp_adventure.data.objects import (
+    object_descriptions as default_object_descriptions,
+)
+
+from .base_classes import GameObject
 from .game import Game
-from .location import Location, LocationDescriptions
+from .game_objects import object_classes as default_object_classes
+from .location import Location, LocationDescription, LocationDescriptions
 from .pawn import Pawn
 from .player import Player
+from .validation import LocationValidator, validate_locations
 from .world import World
+from .world_loader import read_location_file
 
 
 class GameFactory:
     def __init__(
         self, object_descriptions: dict[str, Any] | None = None, object_classes=None
     ):
+        # Copy the defaults, so that changing one factory does not affect others.
         self.object_descriptions: dict[str, Any] = (
-            {} if object_descriptions is None else object_descriptions
+            dict(default_object_descriptions)
+            if object_descriptions is None
+            else object_descriptions
         )
         self.object_classes: dict[str, type] = (
-            {} if object_classes is None else object_classes
+            dict(default_object_classes) if object_classes is None else object_classes
         )
         self.objects = {}
         self.world: World | None = None
@@ -51,9 +63,17 @@ class GameFactory:
         self,
         location_descriptions: LocationDescriptions,
     ) -> World:
-        """Create a World from a description of its locations."""
+        """Create a World from a description of its locations.
+
+        Raises `InvalidLocationDescriptions` if the descriptions contain errors;
+        see `grasp_adventure.v5.validation`."""
         if self.world is None:
-            locations = GameFactory._create_locations(location_descriptions)
+            validate_locations(
+                location_descriptions, self.object_descriptions
+            ).raise_for_errors()
+            locations = GameFactory._create_locations(
+                location_descriptions, self.create_object
+            )
             self.world = World(
                 locations=locations,
                 initial_location_name=location_descriptions[0]["name"],
@@ -62,6 +82,31 @@ class GameFactory:
         else:
             raise ValueError("The world has already been created.")
 
+    def create_world_from_stream(
+        self, location_descriptions: Iterable[LocationDescription]
+    ) -> World:
+        """Create a World in a single pass over its location descriptions.
+
+        In contrast to `create_world()` the descriptions can be an arbitrary
+        iterable; they are not retained after their location has been created.
+        """
+        if self.world is None:
+            locations, initial_location_name = self._create_locations_in_one_pass(
+                location_descriptions, self.create_object, self.object_descriptions
+            )
+            self.world = World(
+                locations=locations, initial_location_name=initial_location_name
+            )
+            return self.world
+        else:
+            raise ValueError("The world has already been created.")
+
+    def load_world(self, path: str | PathLike) -> World:
+        """Create a World from a JSON Lines or binary location file.
+
+        See `grasp_adventure.v5.world_loader` for the file formats."""
+        return self.create_world_from_stream(read_location_file(path))
+
     def create_object(self, object_name):
         """Create an object from the stored object descriptions.
 
@@ -82,10 +127,11 @@ class GameFactory:
     @staticmethod
     def _create_locations(
         location_descriptions: LocationDescriptions,
+        create_object: Callable[[str], GameObject] | None = None,
     ) -> dict[str, Location]:
         """Create a World from a description of its locations."""
         locations = {
-            data["name"]: Location.from_description(data)
+            data["name"]: Location.from_description(data, create_object)
             for data in location_descriptions
         }
         GameFactory._build_connections_for_all_locations(
@@ -105,3 +151,47 @@ class GameFactory:
                 ).items()
             }
             locations[location_description["name"]].connections = connections
+
+    @staticmethod
+    def _create_locations_in_one_pass(
+        location_descriptions: Iterable[LocationDescription],
+        create_object: Callable[[str], GameObject] | None = None,
+        object_names: Collection[str] | None = None,
+    ) -> tuple[dict[str, Location], str]:
+        """Create and connect locations while iterating over their descriptions.
+
+        Connections to locations that have not been created yet are remembered
+        as forward references and resolved when the target is created. Until
+        then the connection is `None`, so that the order of the connections is
+        the same as in the description. Invalid descriptions are skipped; once
+        all descriptions have been read, `InvalidLocationDescriptions` is
+        raised if there were any errors. Objects not in `object_names` are
+        errors, unless `object_names` is `None`."""
+        validator = LocationValidator(object_names)
+        locations: dict[str, Location] = {}
+        forward_references: dict[str, list[tuple[dict[str, Location], str]]] = {}
+        initial_location_name = None
+        for location_description in location_descriptions:
+            if not validator.add(location_description):
+                continue
+            location = Location.from_description(location_description, create_object)
+            name = location.name
+            locations[name] = location
+            if initial_location_name is None:
+                initial_location_name = name
+            for connections, direction in forward_references.pop(name, ()):
+                connections[direction] = location
+            connections = {}
+            for direction, target_name in location_description.get(
+                "connections", {}
+            ).items():
+                target = locations.get(target_name)
+                if target is None:
+                    forward_references.setdefault(target_name, []).append(
+                        (connections, direction)
+                    )
+                connections[direction] = target
+            location.connections = connections
+        validator.result().raise_for_errors()
+        assert initial_location_name is not None
+        return locations, initial_location_name
@@ -0,0 +1,181 @@
+"""Record the actions of a game and replay it to an arbitrary round.
+
+A `GameLog` stores, for every round and every player, the index of the executed
+action in the `turn_actions` of the player's location. All entries have the same
+width, so the actions of any round can be found without decoding the preceding
+rounds. In addition, the locations of all players are stored every
+`snapshot_interval` rounds. To replay a game to a given round the players are
+moved to the locations of the closest preceding snapshot and the remaining
+actions are executed; strategies are not invoked at all.
+"""
+
+import json
+import struct
+from array import array
+from dataclasses import dataclass, field
+from typing import Sequence
+
+from .base_classes import Action, GameObserver
+from .game import Game
+from .location import Location
+from .player import Player
+
+LOG_MAGIC = b"GAL\x01"
+_header_length = struct.Struct("<I")
+
+
+@dataclass
+class GameLog:
+    player_names: list[str]
+    location_names: list[str]
+    seed: int | None = None
+    snapshot_interval: int = 1000
+    action_typecode: str = "B"
+    actions: array = field(default_factory=lambda: array("B"))
+    snapshots: array = field(default_factory=lambda: array("i"))
+
+    @property
+    def num_players(self) -> int:
+        return len(self.player_names)
+
+    @property
+    def num_rounds(self) -> int:
+        return len(self.actions) // self.num_players
+
+    @property
+    def num_snapshots(self) -> int:
+        return len(self.snapshots) // self.num_players
+
+    def actions_in_round(self, round_number: int) -> Sequence[int]:
+        """Return the action indices of all players in round `round_number`.
+
+        Rounds are numbered starting from 1."""
+        start = (round_number - 1) * self.num_players
+        return self.actions[start : start + self.num_players]
+
+    def snapshot(self, index: int) -> Sequence[int]:
+        """Return the location ids of the players at the `index`-th snapshot.
+
+        The snapshot is taken after `index * snapshot_interval` rounds."""
+        start = index * self.num_players
+        return self.snapshots[start : start + self.num_players]
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps(
+            {
+                "player_names": self.player_names,
+                "location_names": self.location_names,
+                "seed": self.seed,
+                "snapshot_interval": self.snapshot_interval,
+                "action_typecode": self.action_typecode,
+                "num_actions": len(self.actions),
+            }
+        ).encode("utf-8")
+        return b"".join(
+            [
+                LOG_MAGIC,
+                _header_length.pack(len(header)),
+                header,
+                self.actions.tobytes(),
+                self.snapshots.tobytes(),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameLog":
+        if data[: len(LOG_MAGIC)] != LOG_MAGIC:
+            raise ValueError("Not a game log.")
+        offset = len(LOG_MAGIC)
+        (header_length,) = _header_length.unpack_from(data, offset)
+        offset += _header_length.size
+        header = json.loads(data[offset : offset + header_length])
+        offset += header_length
+        actions = array(header["action_typecode"])
+        actions_end = offset + header["num_actions"] * actions.itemsize
+        actions.frombytes(data[offset:actions_end])
+        snapshots = array("i")
+        snapshots.frombytes(data[actions_end:])
+        return cls(
+            player_names=header["player_names"],
+            location_names=header["location_names"],
+            seed=header["seed"],
+            snapshot_interval=header["snapshot_interval"],
+            action_typecode=header["action_typecode"],
+            actions=actions,
+            snapshots=snapshots,
+        )
+
+
+class GameRecorder(GameObserver):
+    """Record the actions of all players of a game in a `GameLog`.
+
+    The recorder registers itself as observer of `game`; recording starts with
+    the next round, and rounds in the log are counted from that point. `seed`
+    should be the seed of the random numbers used by the strategies, so that a
+    game can be reproduced completely; it defaults to the seed of `game`, which
+    matches the recording if the game has been (re)seeded before its first
+    round."""
+
+    def __init__(
+        self, game: Game, seed: int | None = None, snapshot_interval: int = 1000
+    ):
+        if seed is None:
+            seed = game.seed
+        locations = game.world.locations
+        max_num_actions = max(
+            (len(location.turn_actions) for location in locations.values()), default=0
+        )
+        typecode = "B" if max_num_actions <= 0xFF else "H"
+        self.log = GameLog(
+            player_names=[player.name for player in game.players],
+            location_names=list(locations),
+            seed=seed,
+            snapshot_interval=snapshot_interval,
+            action_typecode=typecode,
+            actions=array(typecode),
+        )
+        self._location_ids = {name: i for i, name in enumerate(locations)}
+        self._take_snapshot(game)
+        game.observers.append(self)
+
+    def _take_snapshot(self, game: Game):
+        self.log.snapshots.extend(
+            self._location_ids[player.location.name] for player in game.players
+        )
+
+    def action_executed(
+        self, game: Game, player: Player, action: Action, origin: Location
+    ) -> None:
+        actions = origin.turn_actions
+        for index, available_action in enumerate(actions):
+            if available_action is action:
+                break
+        else:
+            index = actions.index(action)
+        self.log.actions.append(index)
+
+    def round_finished(self, game: Game) -> None:
+        if self.log.num_rounds % self.log.snapshot_interval == 0:
+            self._take_snapshot(game)
+
+
+def replay(game: Game, log: GameLog, round_number: int):
+    """Move the players of `game` to their locations after `round_number` rounds.
+
+    `round_number` is counted from the start of the recording. `game` has to be
+    played on the same world as the recorded game; its players are matched to
+    the recorded players by position."""
+    if not 0 <= round_number <= log.num_rounds:
+        raise ValueError(
+            f"Round {round_number} is not in the log (0 to {log.num_rounds})."
+        )
+    snapshot_index = round_number // log.snapshot_interval
+    world = game.world
+    players = game.players
+    for player, location_id in zip(players, log.snapshot(snapshot_index)):
+        player.location = world[log.location_names[location_id]]
+    first_round = snapshot_index * log.snapshot_interval + 1
+    for current_round in range(first_round, round_number + 1):
+        for player, action_index in zip(players, log.actions_in_round(current_round)):
+            player.location.turn_actions[action_index].execute(player)
+    game.round_number = round_number
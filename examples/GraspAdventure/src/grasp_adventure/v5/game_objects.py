@@ -19,3 +19,9 @@ class TreasureChest(GameObject):
 class Torch(GameObject):
     def __str__(self):
         return "a torch"
+
+
+object_classes: dict[str, type[GameObject]] = {
+    "Torch": Torch,
+    "TreasureChest": TreasureChest,
+}
@@ -0,0 +1,164 @@
+"""Measure where the time of a game is spent.
+
+Instrumentation is enabled by assigning an `Instrumentation` object to a game
+with `Game.instrument()`. Without instrumentation the game only checks that
+`Game.instrumentation` and `Player.instrumentation` are `None`.
+"""
+
+from time import perf_counter_ns
+from typing import IO, TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .base_classes import Action
+    from .game import Game
+    from .player import Player
+
+
+class Instrumentation:
+    """Hook points of an instrumented game; all hooks do nothing by default.
+
+    Durations are measured in nanoseconds."""
+
+    def round_started(self, game: "Game") -> None:
+        pass
+
+    def round_finished(self, game: "Game") -> None:
+        pass
+
+    def turn_taken(
+        self,
+        player: "Player",
+        action: "Action",
+        selection_ns: int,
+        execution_ns: int,
+    ) -> None:
+        pass
+
+
+class Log2Histogram:
+    """A histogram of non-negative integers with buckets of exponential size.
+
+    Bucket `i` counts the values `v` with `v.bit_length() == i`, i.e., bucket 0
+    contains 0 and bucket `i > 0` contains the values from `2**(i-1)` to
+    `2**i - 1`.
+
+    >>> histogram = Log2Histogram()
+    >>> for value in [0, 1, 2, 3, 100, 1000]:
+    ...     histogram.add(value)
+    >>> histogram.buckets
+    [1, 1, 2, 0, 0, 0, 0, 1, 0, 0, 1]
+    >>> histogram.count, histogram.total
+    (6, 1106)
+    >>> histogram.quantile(0.5)
+    3
+    """
+
+    def __init__(self):
+        self.buckets: list[int] = []
+        self.count = 0
+        self.total = 0
+
+    def add(self, value: int):
+        index = value.bit_length()
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([0] * (index + 1 - len(buckets)))
+        buckets[index] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> int:
+        """Return an upper bound for the `q`-quantile of the values."""
+        threshold = q * self.count
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+            if count and cumulative >= threshold:
+                return (1 << index) - 1
+        return 0
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        """Iterate over the non-empty buckets as (lower, upper, count)."""
+        for index, count in enumerate(self.buckets):
+            if count:
+                yield (1 << index) >> 1, (1 << index) - 1, count
+
+
+class Profiler(Instrumentation):
+    """Collect histograms of the durations of rounds, strategies and actions.
+
+    In addition, the total time is recorded per call stack: the time spent in
+    each strategy and in the execution of each action class inside rounds.
+    `write_folded()` exports these times in the "folded stacks" format that is
+    read by flame graph tools such as `flamegraph.pl` or speedscope; the time
+    of a round that is not spent in strategies or actions is attributed to the
+    engine itself.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(dungeon_locations, ["Player 1"])
+    >>> profiler = Profiler()
+    >>> game.instrument(profiler)
+    >>> for _ in range(10):
+    ...     game.run_round()
+    >>> profiler.histograms["round"].count
+    10
+    >>> sorted(profiler.stack_totals)
+    [('run_round',), ('run_round', 'MoveAction.execute'), \
+('run_round', 'first_action_strategy')]
+    """
+
+    def __init__(self):
+        self.histograms: dict[str, Log2Histogram] = {
+            "round": Log2Histogram(),
+            "select_action": Log2Histogram(),
+            "execute_action": Log2Histogram(),
+        }
+        self.stack_totals: dict[tuple[str, ...], int] = {}
+        self._round_start = 0
+
+    def round_started(self, game: "Game") -> None:
+        self._round_start = perf_counter_ns()
+
+    def round_finished(self, game: "Game") -> None:
+        duration = perf_counter_ns() - self._round_start
+        self.histograms["round"].add(duration)
+        self._add_to_stack(("run_round",), duration)
+
+    def turn_taken(
+        self,
+        player: "Player",
+        action: "Action",
+        selection_ns: int,
+        execution_ns: int,
+    ) -> None:
+        self.histograms["select_action"].add(selection_ns)
+        self.histograms["execute_action"].add(execution_ns)
+        strategy = player.select_action
+        strategy_name = getattr(strategy, "__qualname__", type(strategy).__name__)
+        self._add_to_stack(("run_round", strategy_name), selection_ns)
+        self._add_to_stack(
+            ("run_round", f"{type(action).__name__}.execute"), execution_ns
+        )
+
+    def _add_to_stack(self, stack: tuple[str, ...], duration: int):
+        self.stack_totals[stack] = self.stack_totals.get(stack, 0) + duration
+
+    def folded_stacks(self) -> dict[tuple[str, ...], int]:
+        """Return the self time of every stack, i.e., its total time minus the
+        total time of its direct children."""
+        result = dict(self.stack_totals)
+        for stack, total in self.stack_totals.items():
+            parent = stack[:-1]
+            if parent in result:
+                result[parent] -= total
+        return {stack: max(duration, 0) for stack, duration in result.items()}
+
+    def write_folded(self, file: IO[str]):
+        """Write the self times in the folded stacks format, one stack per line."""
+        for stack, duration in self.folded_stacks().items():
+            file.write(f"{';'.join(stack)} {duration}\n")
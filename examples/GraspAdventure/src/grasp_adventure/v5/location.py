@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence
 
-from .base_classes import Action
+from .base_classes import Action, GameObject
 
 LocationDescription = Mapping[str, Any]
 LocationDescriptions = Sequence[LocationDescription]
@@ -12,19 +12,149 @@ class Location:
     name: str
     description: str = ""
     connections: dict[str, "Location"] = field(default_factory=dict)
+    objects: list[GameObject] = field(default_factory=list)
+    _move_actions: tuple[Action, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _turn_actions: tuple[Action, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _observers: list[Callable[["Location"], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _object_observers: list[Callable[["Location"], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     @classmethod
-    def from_description(cls, data: LocationDescription) -> "Location":
-        return cls(data["name"], data.get("description", ""))
+    def from_description(
+        cls,
+        data: LocationDescription,
+        create_object: Callable[[str], GameObject] | None = None,
+    ) -> "Location":
+        """Create a location from its description.
+
+        The objects listed in the description are only created if a
+        `create_object` function is provided."""
+        objects = []
+        if create_object is not None:
+            objects = [create_object(name) for name in data.get("objects", ())]
+        return cls(data["name"], data.get("description", ""), objects=objects)
+
+    @classmethod
+    def _create_unobserved(
+        cls, name: str, description: str, objects: list[GameObject]
+    ) -> "Location":
+        """Create a location without connections, bypassing `__init__()`.
+
+        The result is the same as that of `cls(name, description,
+        objects=objects)`, but faster, since the dataclass `__init__()` and the
+        property setters are skipped. Used to create many locations at once.
+
+        Every field has to be listed here; a test compares the keys with the
+        fields of the dataclass."""
+        location = object.__new__(cls)
+        location.__dict__ = {
+            "name": name,
+            "description": description,
+            "_connections": {},
+            "_objects": objects,
+            "_move_actions": None,
+            "_turn_actions": None,
+            "_observers": [],
+            "_object_observers": [],
+        }
+        return location
 
     def __getitem__(self, direction: str) -> "Location | None":
         return self.connections.get(direction)
 
+    def add_observer(self, observer: Callable[["Location"], None]):
+        """Register a function that is called when the connections change."""
+        self._observers.append(observer)
+
+    def connections_changed(self):
+        """Discard the cached actions and notify the observers.
+
+        This happens automatically when `connections` is assigned; call this
+        method after modifying `connections` in place."""
+        self._move_actions = None
+        self._turn_actions = None
+        # The observers don't exist yet while the dataclass is initialized.
+        for observer in getattr(self, "_observers", ()):
+            observer(self)
+
+    def add_object_observer(self, observer: Callable[["Location"], None]):
+        """Register a function that is called when the objects change."""
+        self._object_observers.append(observer)
+
+    def add_object(self, game_object: GameObject):
+        self.objects.append(game_object)
+        self.objects_changed()
+
+    def remove_object(self, game_object: GameObject):
+        self.objects.remove(game_object)
+        self.objects_changed()
+
+    def objects_changed(self):
+        """Discard the cached turn actions and notify the object observers.
+
+        This happens automatically when `objects` is assigned or changed with
+        `add_object()` or `remove_object()`; call this method after modifying
+        `objects` in place."""
+        self._turn_actions = None
+        for observer in getattr(self, "_object_observers", ()):
+            observer(self)
+
+    @property
+    def move_actions(self) -> tuple[Action, ...]:
+        if self._move_actions is None:
+            from .actions import MoveAction
+
+            self._move_actions = tuple(
+                MoveAction(direction, location)
+                for direction, location in self.connections.items()
+            )
+        return self._move_actions
+
     @property
-    def move_actions(self) -> list[Action]:
-        from .actions import MoveAction
+    def turn_actions(self) -> tuple[Action, ...]:
+        """All actions a player can take in this location."""
+        if self._turn_actions is None:
+            from .actions import SKIP_TURN_ACTION, InspectAction
+
+            self._turn_actions = (
+                *self.move_actions,
+                *(InspectAction(game_object) for game_object in self.objects),
+                SKIP_TURN_ACTION,
+            )
+        return self._turn_actions
+
+
+# `connections` and `objects` are dataclass fields, so that they are arguments
+# of `__init__()` and part of `repr()` and `==`, but they are stored in
+# `_connections` and `_objects`: assigning them has to discard the cached
+# actions and notify the observers, which a property setter does without
+# slowing down the assignment of all other attributes.
+
+
+def _get_connections(self: Location) -> dict[str, Location]:
+    return self._connections
+
+
+def _set_connections(self: Location, connections: dict[str, Location]):
+    self._connections = connections
+    self.connections_changed()
+
+
+def _get_objects(self: Location) -> list[GameObject]:
+    return self._objects
+
+
+def _set_objects(self: Location, objects: list[GameObject]):
+    self._objects = objects
+    self.objects_changed()
+
 
-        return [
-            MoveAction(direction, location)
-            for direction, location in self.connections.items()
-        ]
+Location.connections = property(_get_connections, _set_connections)  # type: ignore
+Location.objects = property(_get_objects, _set_objects)  # type: ignore
@@ -0,0 +1,104 @@
+from typing import TYPE_CHECKING, Iterable
+
+from .base_classes import GameObject
+
+if TYPE_CHECKING:
+    from .location import Location
+    from .world_graph import WorldGraph
+
+
+class ObjectIndex:
+    """The objects of a world, indexed by location and by class.
+
+    Locations are identified by their names. The index of a single location is
+    updated when its objects change.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> from grasp_adventure.v5.game_objects import TreasureChest
+    >>> world = GameFactory().create_world(dungeon_locations)
+    >>> index = ObjectIndex(world.locations.values())
+    >>> index.objects_at("Treasure Chamber")
+    (TreasureChest(gold=200),)
+    >>> index.locations_containing(TreasureChest)
+    ['Treasure Chamber']
+    >>> index.nearest(world.graph, "Vestibule", TreasureChest)
+    ('Treasure Chamber', 3)
+    """
+
+    def __init__(self, locations: Iterable["Location"] = ()):
+        self._by_location: dict[str, tuple[GameObject, ...]] = {}
+        # For each class, the names of the locations containing an instance of
+        # exactly this class, with the number of instances.
+        self._by_class: dict[type, dict[str, int]] = {}
+        # Cached results of `locations_containing_set()`.
+        self._containing_sets: dict[type, frozenset[str]] = {}
+        for location in locations:
+            self.update_location(location)
+
+    def update_location(self, location: "Location"):
+        """Update the index after the objects of `location` have changed."""
+        name = location.name
+        self._containing_sets.clear()
+        for game_object in self._by_location.pop(name, ()):
+            counts = self._by_class[type(game_object)]
+            counts[name] -= 1
+            if counts[name] == 0:
+                del counts[name]
+        if location.objects:
+            self._by_location[name] = tuple(location.objects)
+            for game_object in location.objects:
+                counts = self._by_class.setdefault(type(game_object), {})
+                counts[name] = counts.get(name, 0) + 1
+
+    def objects_at(self, location_name: str) -> tuple[GameObject, ...]:
+        return self._by_location.get(location_name, ())
+
+    def locations_containing(self, object_class: type) -> list[str]:
+        """Return the names of all locations containing an `object_class`.
+
+        Instances of subclasses of `object_class` are included."""
+        result: dict[str, None] = {}
+        for cls, counts in self._by_class.items():
+            if issubclass(cls, object_class):
+                result.update(dict.fromkeys(counts))
+        return list(result)
+
+    def locations_containing_set(self, object_class: type) -> frozenset[str]:
+        """Return the result of `locations_containing()` as a frozenset.
+
+        The set is cached until the objects of a location change, so repeated
+        calls return the same object.
+
+        >>> from grasp_adventure.data.locations import dungeon_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> from grasp_adventure.v5.game_objects import Torch
+        >>> world = GameFactory().create_world(dungeon_locations)
+        >>> index = ObjectIndex(world.locations.values())
+        >>> torches = index.locations_containing_set(Torch)
+        >>> torches == {"Brightly Lit Corridor"}
+        True
+        >>> index.locations_containing_set(Torch) is torches
+        True
+        """
+        result = self._containing_sets.get(object_class)
+        if result is None:
+            result = frozenset(self.locations_containing(object_class))
+            self._containing_sets[object_class] = result
+        return result
+
+    def nearest(
+        self, graph: "WorldGraph", start: str, object_class: type
+    ) -> tuple[str, int] | None:
+        """Return the closest location containing an `object_class` and its
+        distance from `start`, or `None` if no such location is reachable."""
+        distances = graph.distances_from(start)
+        candidates = [
+            (distances[name], name)
+            for name in self.locations_containing(object_class)
+            if name in distances
+        ]
+        if not candidates:
+            return None
+        distance, name = min(candidates)
+        return name, distance
@@ -9,5 +9,5 @@ class Pawn:
     location: Location
 
     @property
-    def actions(self) -> list[Action]:
+    def actions(self) -> tuple[Action, ...]:
         return self.location.move_actions
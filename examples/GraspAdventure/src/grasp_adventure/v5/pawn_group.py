@@ -0,0 +1,241 @@
+"""Move large numbers of pawns with the first-action or random-action strategy.
+
+A `PawnGroup` stores the locations of its pawns as ids in a single integer
+array. A round is played for all pawns at once: the new locations are looked up
+in a precomputed `TransitionTable`, using `map()` over arrays instead of calling
+methods of `Player` and `Action` objects for every pawn.
+
+If NumPy is installed, the lookups are performed by NumPy, which is
+considerably faster for large groups; install it with
+
+    pip install grasp_adventure[vectorized]
+
+The NumPy backend draws the random numbers for `step_random()` from a NumPy
+generator seeded from the given random number generator, so the same seed leads
+to different (but equally distributed) trajectories with and without NumPy. Pass
+`use_numpy=False` to get the same trajectories on every installation.
+"""
+
+from array import array
+from collections import Counter
+from itertools import islice
+from operator import add, mul
+from random import Random, random
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from .compiled_world import CompiledWorld
+from .random_streams import RandomStream
+from .world import World
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:
+    from .pawn import Pawn
+
+
+class TransitionTable:
+    """The locations that the turn actions of each location lead to.
+
+    For the location with id `i`, `targets[offsets[i]:offsets[i + 1]]` contains
+    one entry per turn action, in the same order as `Location.turn_actions`:
+    the target of each move action, followed by `i` itself for every action
+    that does not move the pawn (inspecting objects and skipping the turn).
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> world = CompiledWorld.from_descriptions(simple_locations)
+    >>> table = TransitionTable.from_compiled_world(world)
+    >>> list(table.targets), list(table.offsets)
+    ([1, 0, 0, 1], [0, 2, 4])
+    """
+
+    def __init__(
+        self,
+        world: CompiledWorld,
+        num_stay_actions: Sequence[int] | None = None,
+    ):
+        self.world = world
+        num_locations = len(world)
+        if num_stay_actions is None:
+            num_stay_actions = [1] * num_locations
+        offsets = array("q", [0])
+        targets = array("i")
+        for location_id in range(num_locations):
+            targets.extend(world.neighbor_ids(location_id))
+            targets.extend([location_id] * num_stay_actions[location_id])
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+        self.num_actions = array(
+            "i", (offsets[i + 1] - offsets[i] for i in range(num_locations))
+        )
+        self.first_targets = array(
+            "i", (targets[offsets[i]] for i in range(num_locations))
+        )
+
+    @classmethod
+    def from_compiled_world(cls, world: CompiledWorld) -> "TransitionTable":
+        """Create the transition table of a compiled world, including inspect
+        actions."""
+        object_offsets = world.object_offsets
+        return cls(
+            world,
+            [
+                1 + object_offsets[i + 1] - object_offsets[i]
+                for i in range(len(world))
+            ],
+        )
+
+    @classmethod
+    def from_world(cls, world: World) -> "TransitionTable":
+        """Create the transition table of a world, including inspect actions."""
+        return cls.from_compiled_world(CompiledWorld.from_world(world))
+
+
+class PawnGroup:
+    """The locations of many pawns moving in the same world.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> world = CompiledWorld.from_descriptions(dungeon_locations)
+    >>> group = PawnGroup.at_location(
+    ...     TransitionTable.from_compiled_world(world), "Vestibule", 1000
+    ... )
+    >>> group.step_first()
+    >>> group.count_by_location()
+    {'Entrance Hall': 1000}
+    """
+
+    def __init__(
+        self,
+        transitions: TransitionTable,
+        location_ids: Iterable[int],
+        use_numpy: bool | None = None,
+    ):
+        self.transitions = transitions
+        self.location_ids = array("i", location_ids)
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy to be installed.")
+
+    @classmethod
+    def at_location(
+        cls,
+        transitions: TransitionTable,
+        location_name: str,
+        num_pawns: int,
+        use_numpy: bool | None = None,
+    ) -> "PawnGroup":
+        location_id = transitions.world.location_ids[location_name]
+        return cls(transitions, array("i", [location_id]) * num_pawns, use_numpy)
+
+    @classmethod
+    def from_pawns(
+        cls,
+        transitions: TransitionTable,
+        pawns: Iterable["Pawn"],
+        use_numpy: bool | None = None,
+    ) -> "PawnGroup":
+        location_ids = transitions.world.location_ids
+        return cls(
+            transitions,
+            (location_ids[pawn.location.name] for pawn in pawns),
+            use_numpy,
+        )
+
+    def __len__(self):
+        return len(self.location_ids)
+
+    def location_names(self) -> list[str]:
+        return list(map(self.transitions.world.names.__getitem__, self.location_ids))
+
+    def count_by_location(self) -> dict[str, int]:
+        """Return the number of pawns in each occupied location."""
+        names = self.transitions.world.names
+        return {
+            names[location_id]: count
+            for location_id, count in sorted(Counter(self.location_ids).items())
+        }
+
+    def update_pawns(self, pawns: Sequence["Pawn"], world: World | CompiledWorld):
+        """Move `pawns` to the locations of the pawns in this group."""
+        for pawn, name in zip(pawns, self.location_names(), strict=True):
+            pawn.location = world[name]
+
+    def step_first(self):
+        """Let every pawn perform the first of its turn actions."""
+        if self.use_numpy:
+            location_ids = np.frombuffer(self.location_ids, dtype=np.int32)
+            first_targets = np.frombuffer(
+                self.transitions.first_targets, dtype=np.int32
+            )
+            np.take(first_targets, location_ids, out=location_ids)
+            return
+        self.location_ids = array(
+            "i", map(self.transitions.first_targets.__getitem__, self.location_ids)
+        )
+
+    def step_random(self, rng: Random | RandomStream | None = None):
+        """Let every pawn perform one of its turn actions, chosen at random.
+
+        As with `random_action_strategy` all actions are equally likely. The
+        random numbers are drawn from `rng` (e.g., the `RandomStream` of a
+        player) or, by default, from the global random number generator of the
+        `random` module. The NumPy backend draws a single number from it to
+        seed NumPy's generator."""
+        if self.use_numpy:
+            self._step_random_numpy(rng)
+            return
+        transitions = self.transitions
+        location_ids = self.location_ids
+        random_float = random if rng is None else rng.random
+        # The index of the chosen action is int(random() * num_actions).
+        chosen_actions = map(
+            int,
+            map(
+                mul,
+                islice(iter(random_float, None), len(location_ids)),
+                map(transitions.num_actions.__getitem__, location_ids),
+            ),
+        )
+        self.location_ids = array(
+            "i",
+            map(
+                transitions.targets.__getitem__,
+                map(
+                    add,
+                    map(transitions.offsets.__getitem__, location_ids),
+                    chosen_actions,
+                ),
+            ),
+        )
+
+    def _step_random_numpy(self, rng: Random | RandomStream | None):
+        transitions = self.transitions
+        seed = int((random() if rng is None else rng.random()) * 2**53)
+        location_ids = np.frombuffer(self.location_ids, dtype=np.int32)
+        num_actions = np.frombuffer(transitions.num_actions, dtype=np.int32)
+        offsets = np.frombuffer(transitions.offsets, dtype=np.int64)
+        targets = np.frombuffer(transitions.targets, dtype=np.int32)
+        chosen_actions = np.random.default_rng(seed).random(len(location_ids))
+        chosen_actions *= num_actions[location_ids]
+        indices = offsets[location_ids] + chosen_actions.astype(np.int64)
+        np.take(targets, indices, out=location_ids)
+
+    def run(
+        self,
+        num_rounds: int,
+        strategy: str = "first",
+        rng: Random | RandomStream | None = None,
+    ):
+        """Play `num_rounds` rounds with the "first" or "random" strategy."""
+        if strategy == "first":
+            for _ in range(num_rounds):
+                self.step_first()
+        elif strategy == "random":
+            for _ in range(num_rounds):
+                self.step_random(rng)
+        else:
+            raise ValueError(f"Unknown strategy: {strategy!r}.")
+
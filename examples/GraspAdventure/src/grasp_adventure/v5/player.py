@@ -1,10 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from random import choice
-from typing import Callable
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Callable, Iterable
 
+from .actions import SKIP_TURN_ACTION
 from .base_classes import Action
+from .instrumentation import Instrumentation
 from .location import Location
 from .pawn import Pawn
+from .random_streams import RandomStream
+
+if TYPE_CHECKING:
+    from .world import World
 
 
 def first_action_strategy(player: "Player"):
@@ -16,23 +23,60 @@ def first_action_strategy(player: "Player"):
     if actions:
         return actions[0]
     else:
-        from .actions import SkipTurnAction
-
-        return SkipTurnAction()
+        return SKIP_TURN_ACTION
 
 
 def random_action_strategy(player: "Player"):
     """Return a random choice from the available actions.
 
-    If no action is available, return a wait action."""
+    The choice is drawn from the player's random stream, if it has one, and
+    otherwise from the global random number generator. If no action is
+    available, return a wait action."""
 
     actions = player.actions
     if actions:
-        return choice(actions)
+        rng = player.rng
+        return choice(actions) if rng is None else rng.choice(actions)
     else:
-        from .actions import SkipTurnAction
+        return SKIP_TURN_ACTION
+
 
-        return SkipTurnAction()
+def goal_directed_strategy(
+    world: "World", targets: str | Iterable[str] | type
+) -> Callable[["Player"], Action]:
+    """Return a strategy that moves a player towards the closest of `targets`.
+
+    `targets` are location names or a class of game objects; in the latter case
+    the player moves towards the closest location containing such an object.
+
+    The players follow a shortest path. The routing table for the targets is
+    computed once and shared by all players using the same world and targets;
+    it is recomputed only if the connections of the world change. Once a player
+    has reached a target, or if no target is reachable, the player waits."""
+
+    if isinstance(targets, type):
+        object_class = targets
+
+        def current_targets() -> frozenset[str]:
+            return world.object_index.locations_containing_set(object_class)
+
+    else:
+        names = frozenset([targets] if isinstance(targets, str) else targets)
+
+        def current_targets() -> frozenset[str]:
+            return names
+
+    def strategy(player: "Player") -> Action:
+        location = player.location
+        routing_table = world.graph.routing_table(current_targets())
+        next_location_name = routing_table.get(location.name)
+        if next_location_name is not None:
+            for action in location.move_actions:
+                if action.target.name == next_location_name:
+                    return action
+        return SKIP_TURN_ACTION
+
+    return strategy
 
 
 def interactive_action_strategy(player: "Player"):
@@ -55,6 +99,10 @@ class Player:
     name: str
     pawn: Pawn
     select_action: Callable[["Player"], Action] = first_action_strategy
+    instrumentation: Instrumentation | None = field(
+        default=None, repr=False, compare=False
+    )
+    rng: RandomStream | None = field(default=None, repr=False, compare=False)
 
     @property
     def location(self) -> Location:
@@ -69,11 +117,30 @@ class Player:
         return f"{self.name} at {self.location.name}"
 
     @property
-    def actions(self) -> list[Action]:
-        from .actions import SkipTurnAction
-
-        return [*self.pawn.actions, SkipTurnAction()]
-
-    def take_turn(self):
+    def actions(self) -> tuple[Action, ...]:
+        return self.location.turn_actions
+
+    def take_turn(self) -> Action:
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            action = self.select_action(self)
+            action.execute(self)
+            return action
+        start = perf_counter_ns()
         action = self.select_action(self)
+        self.execute_action(action, perf_counter_ns() - start)
+        return action
+
+    def execute_action(self, action: Action, selection_ns: int = 0):
+        """Execute `action` and report the turn to the instrumentation.
+
+        `selection_ns` is the time it took to select the action."""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            action.execute(self)
+            return
+        start = perf_counter_ns()
         action.execute(self)
+        instrumentation.turn_taken(
+            self, action, selection_ns, perf_counter_ns() - start
+        )
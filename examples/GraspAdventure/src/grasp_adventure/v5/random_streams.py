@@ -0,0 +1,69 @@
+"""Independent, reproducible streams of random numbers.
+
+Every game has a seed, from which a separate `RandomStream` is derived for each
+player (see `Game.reseed()`). The streams of different players and different
+games are independent of each other and of the global random number generator,
+so games played in parallel, e.g., in worker processes, are reproducible.
+"""
+
+import hashlib
+from random import Random
+from typing import Any, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def derive_seed(seed: int, *keys: Any) -> int:
+    """Derive a 64-bit seed for a sub-stream identified by `keys`.
+
+    >>> derive_seed(42, "player", 0) == derive_seed(42, "player", 0)
+    True
+    >>> derive_seed(42, "player", 0) == derive_seed(42, "player", 1)
+    False
+    """
+    data = ":".join(map(str, (seed, *keys))).encode("utf-8")
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "little")
+
+
+def spawn_seeds(seed: int, count: int) -> list[int]:
+    """Return `count` independent seeds derived from `seed`, e.g., one per game
+    of a tournament."""
+    return [derive_seed(seed, "spawn", i) for i in range(count)]
+
+
+class RandomStream:
+    """A seeded random number generator for one player.
+
+    `choice()` maps a single draw of `random()` to an index, so the choices
+    only depend on the seed and the lengths of the sequences.
+
+    >>> stream = RandomStream(42)
+    >>> [stream.choice("abc") for _ in range(5)] == [
+    ...     other.choice("abc") for other in [RandomStream(42)] for _ in range(5)
+    ... ]
+    True
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._random = Random(seed)
+
+    def random(self) -> float:
+        """Return a random float in the interval [0, 1)."""
+        return self._random.random()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Return a random element of the non-empty sequence `seq`."""
+        return seq[int(self._random.random() * len(seq))]
+
+    def getstate(self) -> tuple:
+        return self._random.getstate()
+
+    def setstate(self, state: tuple):
+        self._random.setstate(state)
+
+    def copy(self) -> "RandomStream":
+        """Return a stream that produces the same numbers as this one."""
+        result = RandomStream(self.seed)
+        result.setstate(self.getstate())
+        return result
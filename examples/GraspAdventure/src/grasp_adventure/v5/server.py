@@ -0,0 +1,113 @@
+"""Host many single-player game sessions in one process.
+
+All sessions share one read-only `CompiledWorld`; a session only consists of a
+`Player`, its `Pawn` and a small `Game` object. Clients connect over TCP and
+send line-based commands:
+
+- `look`: describe the current location
+- `actions`: list the available actions
+- a number: perform the action with that number
+- `quit`: end the session
+"""
+
+import asyncio
+from itertools import count
+
+from .base_classes import Action
+from .compiled_world import CompiledWorld
+from .game import Game
+from .pawn import Pawn
+from .player import Player
+
+HELP_TEXT = "Commands: look, actions, <number of an action>, quit"
+
+
+class GameSession:
+    __slots__ = ("game", "player", "next_action")
+
+    def __init__(self, world: CompiledWorld, player_name: str):
+        self.player = Player(
+            name=player_name,
+            pawn=Pawn(world.initial_location),
+            select_action=self._select_action,
+        )
+        self.game = Game(players=[self.player], world=world)
+        self.next_action: Action | None = None
+
+    def _select_action(self, player: Player) -> Action:
+        assert self.next_action is not None
+        return self.next_action
+
+    def look(self) -> str:
+        location = self.player.location
+        return f"{self.player.description}. {location.description}."
+
+    def list_actions(self) -> str:
+        return "\n".join(
+            f"{i}: {action.description}"
+            for i, action in enumerate(self.player.actions, 1)
+        )
+
+    def handle_command(self, command: str) -> str:
+        command = command.strip().lower()
+        if command == "look":
+            return self.look()
+        if command == "actions":
+            return self.list_actions()
+        if command.isdigit():
+            actions = self.player.actions
+            try:
+                choice = int(command)
+            except ValueError:
+                # Digits such as "²" are not accepted by int().
+                choice = 0
+            if not 0 < choice <= len(actions):
+                return f"Please enter a number between 1 and {len(actions)}!"
+            self.next_action = actions[choice - 1]
+            self.game.run_round()
+            self.next_action = None
+            return self.look()
+        return HELP_TEXT
+
+
+class GameServer:
+    def __init__(self, world: CompiledWorld):
+        self.world = world
+        self.sessions: dict[int, GameSession] = {}
+        self._session_ids = count(1)
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        session_id = next(self._session_ids)
+        session = GameSession(self.world, f"Player {session_id}")
+        self.sessions[session_id] = session
+        try:
+            await self._send(writer, f"Welcome, {session.player.name}!\n{HELP_TEXT}")
+            await self._send(writer, session.look())
+            while line := await reader.readline():
+                command = line.decode("utf-8", errors="replace")
+                if command.strip().lower() == "quit":
+                    await self._send(writer, "Goodbye!")
+                    break
+                await self._send(writer, session.handle_command(command))
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session_id]
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: str):
+        writer.write(f"{message}\n".encode("utf-8"))
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765):
+        server = await self.start(host, port)
+        async with server:
+            for socket in server.sockets:
+                print(f"Serving on {socket.getsockname()}")
+            await server.serve_forever()
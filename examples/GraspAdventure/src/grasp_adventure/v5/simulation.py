@@ -0,0 +1,73 @@
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterator
+
+from .base_classes import Action, GameObserver
+from .game import Game
+from .location import Location
+from .player import Player
+
+
+@dataclass(frozen=True)
+class RoundEvent:
+    round_number: int
+    player_name: str
+    action: Action
+
+
+class EventRingBuffer(GameObserver):
+    """Record the most recent actions of a game.
+
+    Only the last `capacity` events are kept, older events are discarded."""
+
+    def __init__(self, capacity: int = 1024):
+        self.events: deque[RoundEvent] = deque(maxlen=capacity)
+
+    def __len__(self):
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[RoundEvent]:
+        return iter(self.events)
+
+    def action_executed(
+        self, game: Game, player: Player, action: Action, origin: Location
+    ) -> None:
+        self.events.append(RoundEvent(game.round_number, player.name, action))
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    num_rounds: int
+    elapsed_seconds: float
+
+    @property
+    def rounds_per_second(self) -> float:
+        """The number of rounds simulated per second.
+
+        >>> SimulationReport(num_rounds=1000, elapsed_seconds=0.5).rounds_per_second
+        2000.0
+        """
+        if self.elapsed_seconds <= 0:
+            return float("inf")
+        return self.num_rounds / self.elapsed_seconds
+
+
+def run_headless(
+    game: Game, num_rounds: int, events: EventRingBuffer | None = None
+) -> SimulationReport:
+    """Play `num_rounds` rounds of `game` without printing anything.
+
+    If `events` is given, the actions of all players are recorded in it."""
+    if events is not None:
+        game.observers.append(events)
+    try:
+        run_round = game.run_round
+        start = perf_counter()
+        for _ in range(num_rounds):
+            run_round()
+        elapsed = perf_counter() - start
+    finally:
+        if events is not None:
+            game.observers.remove(events)
+    return SimulationReport(num_rounds=num_rounds, elapsed_seconds=elapsed)
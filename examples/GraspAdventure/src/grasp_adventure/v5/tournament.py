@@ -0,0 +1,242 @@
+"""Play many independent games in parallel and aggregate their results.
+
+Every worker process builds the world and the players once, when it starts;
+the tasks sent to the workers consist only of a seed. Before each game the
+players are moved back to their initial locations and the game is reseeded,
+which gives every player its own random stream, so every game is reproducible
+and independent of the worker that plays it. Use `spawn_seeds()` to derive the
+seeds of many games from a single seed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from math import sqrt
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from .actions import MoveAction
+from .base_classes import Action, GameObserver
+from .game import Game
+from .game_factory import GameFactory
+from .location import Location, LocationDescriptions
+from .player import (
+    Player,
+    first_action_strategy,
+    goal_directed_strategy,
+    random_action_strategy,
+)
+from .world import World
+
+strategy_factories: dict[str, Callable[..., Callable[[Player], Action]]] = {
+    "first": lambda world: first_action_strategy,
+    "random": lambda world: random_action_strategy,
+    "goal": goal_directed_strategy,
+}
+
+
+@dataclass(frozen=True)
+class StrategyConfig:
+    """Describes one player of the games in a tournament.
+
+    `strategy` is a key of `strategy_factories`; the factory is called with the
+    world and `options` as keyword arguments."""
+
+    name: str
+    strategy: str = "first"
+    location: str | None = None
+    options: Mapping[str, Any] = field(default_factory=dict)
+
+    def create_strategy(self, world: World) -> Callable[[Player], Action]:
+        return strategy_factories[self.strategy](world, **self.options)
+
+
+@dataclass(frozen=True)
+class PlayerResult:
+    name: str
+    moves: int
+    locations_visited: int
+    final_location: str
+
+
+@dataclass(frozen=True)
+class GameResult:
+    seed: int
+    player_results: tuple[PlayerResult, ...]
+
+
+class RunningStatistics:
+    """Mean, variance and range of a stream of numbers (Welford's algorithm).
+
+    >>> stats = RunningStatistics()
+    >>> for value in [2, 4, 4, 4, 5, 5, 7, 9]:
+    ...     stats.add(value)
+    >>> stats.count, stats.mean, stats.stdev, stats.min, stats.max
+    (8, 5.0, 2.138..., 2, 9)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._sum_of_squares = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._sum_of_squares += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def variance(self) -> float:
+        """The sample variance of the values added so far."""
+        if self.count < 2:
+            return 0.0
+        return self._sum_of_squares / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        return sqrt(self.variance)
+
+    def __repr__(self):
+        return (
+            f"RunningStatistics(count={self.count}, mean={self.mean:.3f}, "
+            f"stdev={self.stdev:.3f}, min={self.min}, max={self.max})"
+        )
+
+
+class TournamentStatistics:
+    """Statistics of the results of each player over all games."""
+
+    metrics = ("moves", "locations_visited")
+
+    def __init__(self):
+        self.num_games = 0
+        self.players: dict[str, dict[str, RunningStatistics]] = {}
+        self.final_locations: dict[str, dict[str, int]] = {}
+
+    def add(self, game_result: GameResult):
+        self.num_games += 1
+        for result in game_result.player_results:
+            player_stats = self.players.setdefault(
+                result.name, {metric: RunningStatistics() for metric in self.metrics}
+            )
+            for metric in self.metrics:
+                player_stats[metric].add(getattr(result, metric))
+            final_locations = self.final_locations.setdefault(result.name, {})
+            final_locations[result.final_location] = (
+                final_locations.get(result.final_location, 0) + 1
+            )
+
+
+class _MoveCounter(GameObserver):
+    def __init__(self, players: Sequence[Player]):
+        self.moves = {player.name: 0 for player in players}
+        self.visited = {player.name: {player.location.name} for player in players}
+
+    def action_executed(
+        self, game: Game, player: Player, action: Action, origin: Location
+    ) -> None:
+        if isinstance(action, MoveAction):
+            self.moves[player.name] += 1
+            self.visited[player.name].add(action.target.name)
+
+
+class _TournamentGame:
+    """A game that can be replayed with different seeds."""
+
+    def __init__(
+        self,
+        location_descriptions: LocationDescriptions,
+        strategy_configs: Sequence[StrategyConfig],
+        num_rounds: int,
+    ):
+        factory = GameFactory()
+        self.game = factory.create_game(
+            location_descriptions,
+            [
+                {"name": config.name, "location": config.location}
+                for config in strategy_configs
+            ],
+        )
+        for player, config in zip(self.game.players, strategy_configs):
+            player.select_action = config.create_strategy(self.game.world)
+        self.initial_locations = [player.location for player in self.game.players]
+        self.num_rounds = num_rounds
+
+    def play(self, seed: int) -> GameResult:
+        game = self.game
+        for player, location in zip(game.players, self.initial_locations):
+            player.location = location
+        game.round_number = 0
+        game.reseed(seed)
+        counter = _MoveCounter(game.players)
+        game.observers = [counter]
+        for _ in range(self.num_rounds):
+            game.run_round()
+        return GameResult(
+            seed=seed,
+            player_results=tuple(
+                PlayerResult(
+                    name=player.name,
+                    moves=counter.moves[player.name],
+                    locations_visited=len(counter.visited[player.name]),
+                    final_location=player.location.name,
+                )
+                for player in game.players
+            ),
+        )
+
+
+_worker_game: _TournamentGame | None = None
+
+
+def _initialize_worker(location_descriptions, strategy_configs, num_rounds):
+    global _worker_game
+    _worker_game = _TournamentGame(location_descriptions, strategy_configs, num_rounds)
+
+
+def _play_game_in_worker(seed: int) -> GameResult:
+    assert _worker_game is not None
+    return _worker_game.play(seed)
+
+
+def play_games(
+    location_descriptions: LocationDescriptions,
+    strategy_configs: Sequence[StrategyConfig],
+    seeds: Iterable[int],
+    num_rounds: int = 100,
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> Iterator[GameResult]:
+    """Play one game per seed and yield the results in the order of the seeds.
+
+    The games are distributed over a pool of `max_workers` processes (by
+    default one per CPU); if `max_workers` is 0 they are played in the current
+    process."""
+    args = (list(location_descriptions), list(strategy_configs), num_rounds)
+    if max_workers == 0:
+        game = _TournamentGame(*args)
+        yield from map(game.play, seeds)
+        return
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_initialize_worker, initargs=args
+    ) as executor:
+        yield from executor.map(_play_game_in_worker, seeds, chunksize=chunksize)
+
+
+def run_tournament(
+    location_descriptions: LocationDescriptions,
+    strategy_configs: Sequence[StrategyConfig],
+    seeds: Iterable[int],
+    num_rounds: int = 100,
+    max_workers: int | None = None,
+) -> TournamentStatistics:
+    """Play one game per seed and aggregate the results while they arrive."""
+    statistics = TournamentStatistics()
+    for result in play_games(
+        location_descriptions, strategy_configs, seeds, num_rounds, max_workers
+    ):
+        statistics.add(result)
+    return statistics
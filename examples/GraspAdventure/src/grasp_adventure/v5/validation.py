@@ -0,0 +1,326 @@
+"""Check location descriptions before a world is created from them.
+
+Errors prevent the creation of a world:
+
+- a description that is not a mapping, or whose values have the wrong type
+  (e.g., `connections` that are not a mapping of directions to names),
+- a location without a name,
+- several locations with the same name,
+- a connection to an unknown location,
+- an unknown object, if the known object names are given,
+- no locations at all.
+
+Warnings point to likely mistakes in a level:
+
+- orphan locations, which no connection leads to (except for the initial
+  location),
+- asymmetric exits, i.e., connections from A to B without a connection back.
+"""
+
+import hashlib
+import json
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from io import BytesIO, StringIO
+from os import PathLike
+from typing import Callable
+
+from .location import LocationDescription
+from .world_loader import BINARY_MAGIC, read_binary, read_jsonl
+
+
+@dataclass(frozen=True)
+class LocationProblem:
+    location: str | None
+    message: str
+    is_error: bool = True
+
+    def __str__(self):
+        kind = "Error" if self.is_error else "Warning"
+        if self.location is None:
+            return f"{kind}: {self.message}"
+        return f"{kind} in {self.location!r}: {self.message}"
+
+
+class InvalidLocationDescriptions(ValueError):
+    def __init__(self, problems: Iterable[LocationProblem]):
+        self.problems = tuple(problems)
+        super().__init__(
+            "Invalid location descriptions:\n"
+            + "\n".join(str(problem) for problem in self.problems)
+        )
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    problems: tuple[LocationProblem, ...]
+
+    @property
+    def errors(self) -> tuple[LocationProblem, ...]:
+        return tuple(problem for problem in self.problems if problem.is_error)
+
+    @property
+    def warnings(self) -> tuple[LocationProblem, ...]:
+        return tuple(problem for problem in self.problems if not problem.is_error)
+
+    @property
+    def is_valid(self) -> bool:
+        """`True` if there are no errors; warnings are allowed."""
+        return not self.errors
+
+    def raise_for_errors(self):
+        if not self.is_valid:
+            raise InvalidLocationDescriptions(self.errors)
+
+
+class LocationValidator:
+    """Validate location descriptions in a single pass.
+
+    Pass each description to `add()`; `result()` returns the problems found.
+    Only the names and connections are retained, not the descriptions. If
+    `object_names` is given, objects with other names are reported as errors.
+
+    >>> validator = LocationValidator()
+    >>> validator.add({"name": "Room 1", "connections": {"north": "Room 2"}})
+    True
+    >>> validator.add({"name": "Room 2", "connections": {"west": "Room 3"}})
+    True
+    >>> for problem in validator.result().problems:
+    ...     print(problem)
+    Warning in 'Room 1': connection 'north' to 'Room 2' has no way back
+    Error in 'Room 2': connection 'west' leads to unknown location 'Room 3'
+    """
+
+    def __init__(self, object_names: Collection[str] | None = None):
+        self.object_names = object_names
+        self.connections: dict[str, dict[str, str]] = {}
+        self.num_descriptions = 0
+        self._problems: list[LocationProblem] = []
+
+    def add(self, location_description: LocationDescription) -> bool:
+        """Check a single description.
+
+        Return `False` if no location can be created from the description.
+        Its name is still recorded, unless it is missing or has already been
+        used, so that connections to the location are not reported."""
+        self.num_descriptions += 1
+        if not isinstance(location_description, (dict, Mapping)):
+            self._problems.append(
+                LocationProblem(
+                    f"<location {self.num_descriptions}>",
+                    "description is not a mapping",
+                )
+            )
+            return False
+        name = location_description.get("name")
+        if not isinstance(name, str) or not name:
+            self._problems.append(
+                LocationProblem(
+                    f"<location {self.num_descriptions}>", "location has no name"
+                )
+            )
+            return False
+        if name in self.connections:
+            self._problems.append(
+                LocationProblem(name, "name is used by more than one location")
+            )
+            return False
+        num_problems = len(self._problems)
+        if not isinstance(location_description.get("description", ""), str):
+            self._problems.append(LocationProblem(name, "description is not a string"))
+        self.connections[name] = self._check_connections(
+            name, location_description.get("connections", {})
+        )
+        self._check_objects(name, location_description.get("objects", ()))
+        return len(self._problems) == num_problems
+
+    def _check_connections(self, name: str, connections) -> dict[str, str]:
+        """Return the valid connections; report the others."""
+        if not isinstance(connections, (dict, Mapping)):
+            self._problems.append(
+                LocationProblem(
+                    name, "connections are not a mapping of directions to names"
+                )
+            )
+            return {}
+        valid_connections = {}
+        for direction, target in connections.items():
+            if isinstance(direction, str) and isinstance(target, str):
+                valid_connections[direction] = target
+            else:
+                self._problems.append(
+                    LocationProblem(
+                        name,
+                        f"connection {direction!r} to {target!r} is not a pair of "
+                        "strings",
+                    )
+                )
+        return valid_connections
+
+    def _check_objects(self, name: str, objects):
+        if not isinstance(objects, (list, tuple)) and (
+            isinstance(objects, (str, Mapping)) or not isinstance(objects, Iterable)
+        ):
+            self._problems.append(
+                LocationProblem(name, "objects are not a list of names")
+            )
+            return
+        known_names = self.object_names
+        for object_name in objects:
+            if not isinstance(object_name, str):
+                self._problems.append(
+                    LocationProblem(name, f"object {object_name!r} is not a name")
+                )
+            elif known_names is not None and object_name not in known_names:
+                self._problems.append(
+                    LocationProblem(name, f"unknown object {object_name!r}")
+                )
+
+    def result(self) -> ValidationResult:
+        problems = list(self._problems)
+        connections = self.connections
+        if not connections:
+            problems.append(LocationProblem(None, "there are no locations"))
+        targets: set[str] = set()
+        for name, exits in connections.items():
+            for direction, target in exits.items():
+                target_exits = connections.get(target)
+                if target_exits is None:
+                    problems.append(
+                        LocationProblem(
+                            name,
+                            f"connection {direction!r} leads to unknown location "
+                            f"{target!r}",
+                        )
+                    )
+                    continue
+                targets.add(target)
+                if name not in target_exits.values():
+                    problems.append(
+                        LocationProblem(
+                            name,
+                            f"connection {direction!r} to {target!r} has no way back",
+                            is_error=False,
+                        )
+                    )
+        for i, name in enumerate(connections):
+            # The first location is the initial location.
+            if i > 0 and name not in targets:
+                problems.append(
+                    LocationProblem(
+                        name, "no connection leads to this location", is_error=False
+                    )
+                )
+        return ValidationResult(tuple(problems))
+
+
+def validate_locations(
+    location_descriptions: Iterable[LocationDescription],
+    object_names: Collection[str] | None = None,
+) -> ValidationResult:
+    """Validate location descriptions in a single pass.
+
+    If `object_names` is given, objects with other names are errors."""
+    validator = LocationValidator(object_names)
+    for location_description in location_descriptions:
+        validator.add(location_description)
+    return validator.result()
+
+
+def content_hash(location_descriptions: Iterable[LocationDescription]) -> str:
+    """Return the SHA-256 hash of the canonical JSON form of the descriptions.
+
+    Raise `TypeError` if the descriptions cannot be converted to JSON, e.g.,
+    because they contain sets, or if JSON would change the outcome of their
+    validation: it turns the direction `1` into `"1"`.
+
+    >>> content_hash([{"name": "Room 1", "connections": {1: "Room 1"}}])
+    Traceback (most recent call last):
+    ...
+    TypeError: direction 1 is not a string
+    """
+    location_descriptions = list(location_descriptions)
+    for location_description in location_descriptions:
+        if isinstance(location_description, dict):
+            connections = location_description.get("connections")
+            if isinstance(connections, dict):
+                for direction in connections:
+                    if type(direction) is not str:
+                        raise TypeError(f"direction {direction!r} is not a string")
+    data = json.dumps(location_descriptions, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """Remember the results of validations by the content hash of the
+    descriptions, so that unchanged levels are validated only once.
+
+    Computing the hash of descriptions in memory takes about as long as
+    validating them; for files, `validate_file()` hashes the raw content and
+    does not even parse unchanged files. Descriptions without a content hash
+    (see `content_hash()`) are validated without using the cache.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> cache = ValidationCache()
+    >>> cache.validate(dungeon_locations).is_valid
+    True
+    >>> cache.validate([dict(d) for d in dungeon_locations]) is cache.validate(
+    ...     dungeon_locations
+    ... )
+    True
+    """
+
+    max_size = 4096
+
+    def __init__(self):
+        self._results: dict[str, ValidationResult] = {}
+
+    def __len__(self):
+        return len(self._results)
+
+    def validate(
+        self,
+        location_descriptions: Iterable[LocationDescription],
+        object_names: Collection[str] | None = None,
+    ) -> ValidationResult:
+        location_descriptions = list(location_descriptions)
+        try:
+            key = content_hash(location_descriptions)
+        except (TypeError, ValueError):
+            return validate_locations(location_descriptions, object_names)
+        return self._validate(key, lambda: location_descriptions, object_names)
+
+    def validate_file(
+        self, path: str | PathLike, object_names: Collection[str] | None = None
+    ) -> ValidationResult:
+        """Validate a JSON Lines or binary location file (see `world_loader`)."""
+        with open(path, "rb") as file:
+            data = file.read()
+
+        def read_descriptions():
+            if data.startswith(BINARY_MAGIC):
+                return read_binary(BytesIO(data))
+            return read_jsonl(StringIO(data.decode("utf-8")))
+
+        return self._validate(
+            hashlib.sha256(data).hexdigest(), read_descriptions, object_names
+        )
+
+    def _validate(
+        self,
+        key: str,
+        read_descriptions: Callable[[], Iterable[LocationDescription]],
+        object_names: Collection[str] | None,
+    ) -> ValidationResult:
+        if object_names is not None:
+            try:
+                key += ":" + content_hash([{"objects": sorted(object_names)}])
+            except (TypeError, ValueError):
+                return validate_locations(read_descriptions(), object_names)
+        result = self._results.get(key)
+        if result is None:
+            result = validate_locations(read_descriptions(), object_names)
+            if len(self._results) >= self.max_size:
+                self._results.clear()
+            self._results[key] = result
+        return result
@@ -1,12 +1,26 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from .base_classes import GameObject
 from .location import Location
+from .object_index import ObjectIndex
+from .world_graph import WorldGraph
 
 
 @dataclass
 class World:
     locations: dict[str, Location]
     initial_location_name: str
+    _graph: WorldGraph | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _object_index: ObjectIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for location in self.locations.values():
+            location.add_observer(self._connections_changed)
+            location.add_object_observer(self._objects_changed)
 
     def __getitem__(self, location_name: str):
         """Get a location by name."""
@@ -19,3 +33,67 @@ class World:
     @property
     def description(self):
         return "Nothing noteworthy is happening in the world."
+
+    @property
+    def graph(self) -> WorldGraph:
+        """The graph of connections, used to answer path queries."""
+        if self._graph is None:
+            self._graph = WorldGraph(self.locations.values())
+        return self._graph
+
+    @property
+    def object_index(self) -> ObjectIndex:
+        """The objects in all locations, used to answer object queries."""
+        if self._object_index is None:
+            self._object_index = ObjectIndex(self.locations.values())
+        return self._object_index
+
+    def _connections_changed(self, location: Location):
+        if self._graph is not None:
+            self._graph.update_location(location)
+
+    def _objects_changed(self, location: Location):
+        if self._object_index is not None:
+            self._object_index.update_location(location)
+
+    def shortest_path(self, start: str, end: str) -> list[str] | None:
+        """Return the names of the locations on a shortest path from start to end.
+
+        >>> from grasp_adventure.data.locations import simple_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> world = GameFactory().create_world(simple_locations)
+        >>> world.shortest_path("Room 1", "Room 2")
+        ['Room 1', 'Room 2']
+        """
+        return self.graph.shortest_path(start, end)
+
+    def distance(self, start: str, end: str) -> int | None:
+        return self.graph.distance(start, end)
+
+    def all_pairs_distances(self) -> dict[str, dict[str, int]]:
+        return self.graph.all_pairs_distances()
+
+    def is_reachable(self, start: str, end: str) -> bool:
+        return self.graph.is_reachable(start, end)
+
+    def connected_components(self) -> list[set[str]]:
+        return self.graph.connected_components()
+
+    def objects_at(self, location_name: str) -> tuple[GameObject, ...]:
+        return self.object_index.objects_at(location_name)
+
+    def locations_containing(self, object_class: type) -> list[str]:
+        return self.object_index.locations_containing(object_class)
+
+    def nearest_object(self, start: str, object_class: type) -> tuple[str, int] | None:
+        """Return the closest location containing an `object_class` and its
+        distance from `start`.
+
+        >>> from grasp_adventure.data.locations import dungeon_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> from grasp_adventure.v5.game_objects import Torch
+        >>> world = GameFactory().create_world(dungeon_locations)
+        >>> world.nearest_object("Vestibule", Torch)
+        ('Brightly Lit Corridor', 2)
+        """
+        return self.object_index.nearest(self.graph, start, object_class)
@@ -0,0 +1,199 @@
+from collections import deque
+from typing import TYPE_CHECKING, Collection, Iterable
+
+if TYPE_CHECKING:
+    from .location import Location
+
+
+class WorldGraph:
+    """The connections between the locations of a world, prepared for path queries.
+
+    Locations are identified by their names. The adjacency lists are updated
+    incrementally when the connections of a single location change; the results
+    of searches are cached until the next change.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> world = GameFactory().create_world(dungeon_locations)
+    >>> graph = WorldGraph(world.locations.values())
+    >>> graph.shortest_path("Vestibule", "Treasure Chamber")
+    ['Vestibule', 'Entrance Hall', 'Dark Corridor', 'Treasure Chamber']
+    >>> graph.distances_from("Dark Corridor")["Vestibule"]
+    2
+    """
+
+    max_cached_searches = 1024
+
+    def __init__(self, locations: Iterable["Location"] = ()):
+        self.successors: dict[str, tuple[str, ...]] = {}
+        # Insertion-ordered sets, so that ties are broken deterministically.
+        self.predecessors: dict[str, dict[str, None]] = {}
+        self.version = 0
+        self._searches: dict[str, tuple[dict[str, int], dict[str, str]]] = {}
+        self._routing_tables: dict[frozenset[str], dict[str, str]] = {}
+        self._component_parents: dict[str, str] | None = None
+        for location in locations:
+            self.update_location(location)
+
+    def update_location(self, location: "Location"):
+        """Update the connections starting at `location`."""
+        name = location.name
+        old_successors = self.successors.get(name, ())
+        new_successors = tuple(
+            dict.fromkeys(target.name for target in location.connections.values())
+        )
+        if name in self.successors and old_successors == new_successors:
+            return
+        self.successors[name] = new_successors
+        self.predecessors.setdefault(name, {})
+        for successor in old_successors:
+            self.predecessors[successor].pop(name, None)
+        for successor in new_successors:
+            self.predecessors.setdefault(successor, {})[name] = None
+        self._graph_changed(name, old_successors, new_successors)
+
+    def _graph_changed(self, name, old_successors, new_successors):
+        self.version += 1
+        self._searches.clear()
+        self._routing_tables.clear()
+        if self._component_parents is None:
+            return
+        if set(old_successors) - set(new_successors):
+            # Removing connections may split a component: start over.
+            self._component_parents = None
+        else:
+            self._component_parents.setdefault(name, name)
+            for successor in new_successors:
+                self._union(name, successor)
+
+    def __contains__(self, name: str):
+        return name in self.successors
+
+    def _search(self, start: str) -> tuple[dict[str, int], dict[str, str]]:
+        """Breadth-first search from `start`; return distances and predecessors."""
+        result = self._searches.get(start)
+        if result is None:
+            if start not in self.successors:
+                raise KeyError(start)
+            distances = {start: 0}
+            parents: dict[str, str] = {}
+            queue = deque([start])
+            successors = self.successors
+            while queue:
+                name = queue.popleft()
+                distance = distances[name] + 1
+                for successor in successors.get(name, ()):
+                    if successor not in distances:
+                        distances[successor] = distance
+                        parents[successor] = name
+                        queue.append(successor)
+            if len(self._searches) >= self.max_cached_searches:
+                self._searches.clear()
+            result = self._searches[start] = (distances, parents)
+        return result
+
+    def distances_from(self, start: str) -> dict[str, int]:
+        """Return the number of moves from `start` to each reachable location."""
+        return self._search(start)[0]
+
+    def distance(self, start: str, end: str) -> int | None:
+        """Return the number of moves from `start` to `end` or `None`."""
+        return self.distances_from(start).get(end)
+
+    def is_reachable(self, start: str, end: str) -> bool:
+        return end in self.distances_from(start)
+
+    def shortest_path(self, start: str, end: str) -> list[str] | None:
+        """Return the names of the locations on a shortest path or `None`."""
+        distances, parents = self._search(start)
+        if end not in distances:
+            return None
+        path = [end]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def routing_table(self, targets: Collection[str]) -> dict[str, str]:
+        """Return the next location on a shortest path to the closest target.
+
+        The result maps the name of every location from which one of the
+        `targets` can be reached to the name of the next location on the way;
+        the targets themselves are not included. It is computed by a single
+        backward search from all targets and cached until the graph changes.
+
+        >>> from grasp_adventure.data.locations import dungeon_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> world = GameFactory().create_world(dungeon_locations)
+        >>> graph = WorldGraph(world.locations.values())
+        >>> graph.routing_table(["Dark Corridor"])["Vestibule"]
+        'Entrance Hall'
+        """
+        targets = frozenset(targets)
+        table = self._routing_tables.get(targets)
+        if table is None:
+            table = {}
+            visited = set(targets)
+            # Sorted, so that the table does not depend on the hash seed.
+            queue = deque(sorted(targets))
+            predecessors = self.predecessors
+            while queue:
+                name = queue.popleft()
+                for predecessor in predecessors.get(name, ()):
+                    if predecessor not in visited:
+                        visited.add(predecessor)
+                        table[predecessor] = name
+                        queue.append(predecessor)
+            if len(self._routing_tables) >= self.max_cached_searches:
+                self._routing_tables.clear()
+            self._routing_tables[targets] = table
+        return table
+
+    def all_pairs_distances(self) -> dict[str, dict[str, int]]:
+        """Return the distances between all pairs of connected locations.
+
+        This performs a search from every location, so it should only be used
+        for small worlds."""
+        return {name: dict(self.distances_from(name)) for name in self.successors}
+
+    def connected_components(self) -> list[set[str]]:
+        """Return the sets of locations that are connected to each other.
+
+        The direction of the connections is ignored."""
+        parents = self._components()
+        components: dict[str, set[str]] = {}
+        for name in parents:
+            components.setdefault(self._find(name), set()).add(name)
+        return list(components.values())
+
+    def are_connected(self, name1: str, name2: str) -> bool:
+        """Return whether `name1` and `name2` are in the same component."""
+        self._components()
+        return self._find(name1) == self._find(name2)
+
+    def _components(self) -> dict[str, str]:
+        if self._component_parents is None:
+            self._component_parents = {name: name for name in self.successors}
+            for name, successors in self.successors.items():
+                for successor in successors:
+                    self._union(name, successor)
+        return self._component_parents
+
+    def _find(self, name: str) -> str:
+        parents = self._component_parents
+        assert parents is not None
+        root = name
+        while parents[root] != root:
+            root = parents[root]
+        while parents[name] != root:
+            parents[name], name = root, parents[name]
+        return root
+
+    def _union(self, name1: str, name2: str):
+        parents = self._component_parents
+        assert parents is not None
+        parents.setdefault(name1, name1)
+        parents.setdefault(name2, name2)
+        root1, root2 = self._find(name1), self._find(name2)
+        if root1 != root2:
+            parents[root2] = root1
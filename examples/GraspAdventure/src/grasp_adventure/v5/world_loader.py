@@ -0,0 +1,127 @@
+"""Read and write location descriptions as streams.
+
+Two formats are supported:
+
+- JSON Lines: one JSON object per line, in the format used by
+  `grasp_adventure.data.locations`.
+- A compact binary format: the magic bytes `BINARY_MAGIC`, followed by one
+  record per location. Each record consists of the name and the description, the
+  number of connections followed by (direction, target name) pairs, and the
+  number of objects followed by their names. Strings are stored as UTF-8 bytes
+  prefixed with their length as 32-bit unsigned integer, counts as 16-bit
+  unsigned integers (all little-endian).
+
+Both readers return iterators, so that arbitrarily large files can be processed
+one location at a time.
+"""
+
+import json
+import struct
+import sys
+from os import PathLike
+from typing import IO, Any, Iterable, Iterator
+
+from .location import LocationDescription
+
+BINARY_MAGIC = b"GAW\x01"
+
+_length = struct.Struct("<I")
+_count = struct.Struct("<H")
+
+
+def write_jsonl(location_descriptions: Iterable[LocationDescription], file: IO[str]):
+    for location_description in location_descriptions:
+        file.write(json.dumps(location_description))
+        file.write("\n")
+
+
+def read_jsonl(file: IO[str]) -> Iterator[dict[str, Any]]:
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_binary(
+    location_descriptions: Iterable[LocationDescription], file: IO[bytes]
+):
+    def write_string(s: str):
+        data = s.encode("utf-8")
+        file.write(_length.pack(len(data)))
+        file.write(data)
+
+    file.write(BINARY_MAGIC)
+    for location_description in location_descriptions:
+        write_string(location_description["name"])
+        write_string(location_description.get("description", ""))
+        connections = location_description.get("connections", {})
+        file.write(_count.pack(len(connections)))
+        for direction, target_name in connections.items():
+            write_string(direction)
+            write_string(target_name)
+        objects = location_description.get("objects", [])
+        file.write(_count.pack(len(objects)))
+        for object_name in objects:
+            write_string(object_name)
+
+
+def read_binary(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    if file.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("Not a binary location description file.")
+
+    def read_exactly(num_bytes: int) -> bytes:
+        data = file.read(num_bytes)
+        if len(data) != num_bytes:
+            raise ValueError("Truncated binary location description file.")
+        return data
+
+    def read_string() -> str:
+        (num_bytes,) = _length.unpack(read_exactly(_length.size))
+        return read_exactly(num_bytes).decode("utf-8")
+
+    def read_count() -> int:
+        return _count.unpack(read_exactly(_count.size))[0]
+
+    while header := file.read(_length.size):
+        (num_bytes,) = _length.unpack(header)
+        location_description: dict[str, Any] = {
+            "name": read_exactly(num_bytes).decode("utf-8"),
+            "description": read_string(),
+        }
+        # Directions are repeated very often, so we intern them.
+        location_description["connections"] = {
+            sys.intern(read_string()): read_string() for _ in range(read_count())
+        }
+        num_objects = read_count()
+        if num_objects:
+            location_description["objects"] = [
+                read_string() for _ in range(num_objects)
+            ]
+        yield location_description
+
+
+def write_location_file(
+    location_descriptions: Iterable[LocationDescription],
+    path: str | PathLike,
+    binary: bool = False,
+):
+    """Write location descriptions to a JSON Lines or binary file."""
+    if binary:
+        with open(path, "wb") as file:
+            write_binary(location_descriptions, file)
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            write_jsonl(location_descriptions, file)
+
+
+def read_location_file(path: str | PathLike) -> Iterator[dict[str, Any]]:
+    """Iterate over the location descriptions in a JSON Lines or binary file.
+
+    The format is determined by the first bytes of the file."""
+    with open(path, "rb") as file:
+        is_binary = file.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    if is_binary:
+        with open(path, "rb") as file:
+            yield from read_binary(file)
+    else:
+        with open(path, encoding="utf-8") as file:
+            yield from read_jsonl(file)
@@ -0,0 +1,114 @@
+from typing import Any, Iterable
+
+from .base_classes import GameObject
+from .compiled_world import CompiledWorld
+from .game_factory import GameFactory
+from .location import Location, LocationDescription
+from .world import World
+
+
+class WorldTemplate:
+    """Parse and validate location descriptions once, create worlds quickly.
+
+    Every call of `create_world()` returns a new `World` whose locations can be
+    changed independently of all other worlds created from the template. The
+    names, descriptions and directions are shared by all these worlds, and so
+    are the objects: each object is created only once per template, just as
+    `GameFactory.create_object()` creates each object only once per factory.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> template = WorldTemplate.from_descriptions(dungeon_locations)
+    >>> world1, world2 = template.create_world(), template.create_world()
+    >>> world1["Vestibule"] is world2["Vestibule"]
+    False
+    >>> world1["Vestibule"]["north"].name
+    'Entrance Hall'
+    >>> world1["Treasure Chamber"].objects == world2["Treasure Chamber"].objects
+    True
+    """
+
+    def __init__(
+        self,
+        compiled_world: CompiledWorld,
+        object_factory: GameFactory | None = None,
+    ):
+        """Create a template for the compiled world.
+
+        The objects of the worlds are those of `compiled_world`, which should
+        have been created by `object_factory`."""
+        self.compiled_world = compiled_world
+        if object_factory is None:
+            object_factory = GameFactory()
+        self.object_factory = object_factory
+        directions = compiled_world.directions
+        direction_ids = compiled_world.direction_ids
+        target_ids = compiled_world.target_ids
+        offsets = compiled_world.offsets
+        self._connections = [
+            tuple(
+                (directions[direction_ids[i]], target_ids[i])
+                for i in range(offsets[location_id], offsets[location_id + 1])
+            )
+            for location_id in range(len(compiled_world))
+        ]
+        self._descriptions = [
+            compiled_world.descriptions[description_id]
+            for description_id in compiled_world.description_ids
+        ]
+        self._objects = [
+            tuple(compiled_world.location_objects(location_id))
+            for location_id in range(len(compiled_world))
+        ]
+
+    @classmethod
+    def from_descriptions(
+        cls,
+        location_descriptions: Iterable[LocationDescription],
+        object_descriptions: dict[str, Any] | None = None,
+        object_classes: dict[str, type] | None = None,
+    ) -> "WorldTemplate":
+        """Create a template from location descriptions in a single pass.
+
+        Raises `ValueError` if a location name is used more than once or if a
+        connection leads to an unknown location, and `KeyError` for unknown
+        objects."""
+        object_factory = GameFactory(object_descriptions, object_classes)
+        compiled_world = CompiledWorld.from_descriptions(
+            location_descriptions, object_factory.create_object
+        )
+        return cls(compiled_world, object_factory)
+
+    @property
+    def objects(self) -> dict[str, GameObject]:
+        """The pool of objects that have been created for this template."""
+        return self.object_factory.objects
+
+    def create_world(self) -> World:
+        locations = [
+            Location._create_unobserved(name, description, list(objects))
+            for name, description, objects in zip(
+                self.compiled_world.names, self._descriptions, self._objects
+            )
+        ]
+        # The locations have neither cached actions nor observers yet, so we
+        # can fill in their connections without notifying anybody.
+        for location, connections in zip(locations, self._connections):
+            location.connections.update(
+                [(direction, locations[target]) for direction, target in connections]
+            )
+        return World(
+            locations={location.name: location for location in locations},
+            initial_location_name=self.compiled_world.initial_location_name,
+        )
+
+    def create_factory(self) -> GameFactory:
+        """Return a `GameFactory` for a new world created from this template.
+
+        The factory uses the object pool of the template."""
+        factory = GameFactory(
+            self.object_factory.object_descriptions,
+            self.object_factory.object_classes,
+        )
+        factory.objects = self.objects
+        factory.world = self.create_world()
+        return factory
@@ -0,0 +1,56 @@
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.game_factory import GameFactory
+
+import pytest
+
+opposite_directions = {
+    "north": "south",
+    "south": "north",
+    "east": "west",
+    "west": "east",
+}
+
+
+@pytest.mark.parametrize("num_locations, width", [(1, None), (10, 3), (1000, None)])
+def test_generates_requested_number_of_locations(num_locations, width):
+    locations = list(generate_locations(num_locations, width=width))
+
+    assert len(locations) == num_locations
+    assert len({location["name"] for location in locations}) == num_locations
+
+
+def test_is_reproducible():
+    assert list(generate_locations(100, seed=1)) == list(
+        generate_locations(100, seed=1)
+    )
+    assert list(generate_locations(100, seed=1)) != list(
+        generate_locations(100, seed=2)
+    )
+
+
+def test_connections_are_symmetric():
+    locations = {
+        location["name"]: location
+        for location in generate_locations(200, width=7, branching=0.5)
+    }
+
+    for name, location in locations.items():
+        for direction, target in location["connections"].items():
+            back = locations[target]["connections"][opposite_directions[direction]]
+            assert back == name
+
+
+def test_all_locations_are_reachable():
+    world = GameFactory().create_world(list(generate_locations(500, branching=0.0)))
+
+    assert len(world.graph.distances_from("Room 0")) == 500
+
+
+def test_object_density():
+    locations = list(generate_locations(1000, object_density=0.5))
+    num_objects = sum(len(location.get("objects", [])) for location in locations)
+
+    assert 400 < num_objects < 600
+    assert {"Torch", "Treasure Chest"} == {
+        name for location in locations for name in location.get("objects", [])
+    }
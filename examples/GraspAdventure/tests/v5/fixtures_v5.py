@@ -1,6 +1,7 @@
-from grasp_adventure.data.locations import simple_locations
+from grasp_adventure.data.locations import dungeon_locations, simple_locations
 from grasp_adventure.v5.game_objects import TreasureChest
 from grasp_adventure.v5.game_factory import GameFactory
+from grasp_adventure.v5.game import Game
 from grasp_adventure.v5.pawn import Pawn
 from grasp_adventure.v5.player import Player
 
@@ -27,6 +28,24 @@ def level():
     return GameFactory().create_world(simple_locations)
 
 
+def create_dungeon_game(select_action=None, seed: int | None = None) -> Game:
+    """Create a game with two players in the dungeon.
+
+    `select_action`, if given, becomes the strategy of both players."""
+    game = GameFactory().create_game(dungeon_locations, ["Player 1", "Player 2"])
+    if select_action is not None:
+        for player in game.players:
+            player.select_action = select_action
+    if seed is not None:
+        game.reseed(seed)
+    return game
+
+
+@pytest.fixture()
+def dungeon_game():
+    return create_dungeon_game()
+
+
 @pytest.fixture()
 def pawn(level):
     return Pawn(location=level["Room 1"])
@@ -0,0 +1,93 @@
+import asyncio
+
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.actions import MoveAction, SkipTurnAction
+from grasp_adventure.v5.async_game import (
+    async_interactive_action_strategy,
+    play_async,
+    run_round_async,
+    select_action_async,
+)
+from grasp_adventure.v5.player import first_action_strategy
+from grasp_adventure.v5.simulation import EventRingBuffer
+from fixtures_v5 import *  # noqa
+
+
+async def slow_strategy(player):
+    await asyncio.sleep(10)
+    return first_action_strategy(player)
+
+
+async def async_first_action_strategy(player):
+    await asyncio.sleep(0)
+    return first_action_strategy(player)
+
+
+def test_select_action_async_with_sync_strategy(player, level):
+    action = asyncio.run(select_action_async(player))
+
+    assert action == MoveAction("north", level["Room 2"])
+
+
+def test_select_action_async_with_timeout(player):
+    player.select_action = slow_strategy
+
+    action = asyncio.run(select_action_async(player, timeout=0.01))
+
+    assert action == SkipTurnAction()
+
+
+def test_run_round_async(dungeon_game):
+    dungeon_game.players[1].select_action = async_first_action_strategy
+    events = EventRingBuffer()
+    dungeon_game.observers.append(events)
+
+    asyncio.run(run_round_async(dungeon_game))
+
+    assert dungeon_game.round_number == 1
+    assert [player.location.name for player in dungeon_game.players] == [
+        "Entrance Hall",
+        "Entrance Hall",
+    ]
+    assert [event.player_name for event in events] == ["Player 1", "Player 2"]
+
+
+def test_slow_player_does_not_block_others(dungeon_game):
+    dungeon_game.players[0].select_action = slow_strategy
+
+    asyncio.run(play_async(dungeon_game, 2, turn_timeout=0.01))
+
+    assert [player.location.name for player in dungeon_game.players] == [
+        "Vestibule",
+        "Dark Corridor",
+    ]
+
+
+def test_decisions_are_gathered_concurrently():
+    async def sleepy_strategy(player):
+        await asyncio.sleep(0.05)
+        return first_action_strategy(player)
+
+    game = GameFactory().create_game(
+        dungeon_locations, [f"Bot {i}" for i in range(20)]
+    )
+    for player in game.players:
+        player.select_action = sleepy_strategy
+
+    async def timed_round():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await run_round_async(game)
+        return loop.time() - start
+
+    assert asyncio.run(timed_round()) < 0.5
+
+
+def test_async_interactive_action_strategy(player, level, monkeypatch, capsys):
+    answers = iter(["x", "3", "2"])
+    monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+
+    action = asyncio.run(async_interactive_action_strategy(player))
+
+    assert action == SkipTurnAction()
+    assert "1: move north to Room 2" in capsys.readouterr().out
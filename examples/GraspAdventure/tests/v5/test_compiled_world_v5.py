@@ -0,0 +1,116 @@
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.actions import InspectAction, MoveAction, SkipTurnAction
+from grasp_adventure.v5.compiled_world import CompiledWorld, LocationView
+from grasp_adventure.v5.game_objects import Torch
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def compiled_world():
+    return CompiledWorld.from_descriptions(dungeon_locations)
+
+
+def test_from_descriptions(compiled_world):
+    assert len(compiled_world) == 5
+    assert compiled_world.initial_location_name == "Vestibule"
+    assert compiled_world.directions == ["north", "west", "east", "south"]
+    assert list(compiled_world.offsets) == [0, 1, 4, 6, 7, 8]
+
+
+def test_from_descriptions_accepts_iterators(compiled_world):
+    world = CompiledWorld.from_descriptions(iter(dungeon_locations))
+    assert list(world.target_ids) == list(compiled_world.target_ids)
+
+
+def test_from_descriptions_with_unknown_location():
+    with pytest.raises(ValueError):
+        CompiledWorld.from_descriptions(
+            [{"name": "Room 1", "connections": {"north": "Nowhere"}}]
+        )
+
+
+def test_from_descriptions_with_duplicate_location():
+    with pytest.raises(ValueError):
+        CompiledWorld.from_descriptions([{"name": "Room 1"}, {"name": "Room 1"}])
+
+
+def test_from_world():
+    world = GameFactory().create_world(dungeon_locations)
+    compiled_world = CompiledWorld.from_world(world)
+
+    for location in world.locations.values():
+        view = compiled_world[location.name]
+        assert view.description == location.description
+        assert {d: loc.name for d, loc in view.connections.items()} == {
+            d: loc.name for d, loc in location.connections.items()
+        }
+
+
+def test_location_view(compiled_world):
+    hall = compiled_world["Entrance Hall"]
+
+    assert isinstance(hall, LocationView)
+    assert hall.name == "Entrance Hall"
+    assert hall["west"] == compiled_world["Dark Corridor"]
+    assert hall["north"] is None
+    assert list(hall.connections) == ["west", "east", "south"]
+
+
+def test_location_view_actions(compiled_world):
+    vestibule = compiled_world["Vestibule"]
+
+    assert vestibule.turn_actions == (
+        MoveAction("north", compiled_world["Entrance Hall"]),
+        SkipTurnAction(),
+    )
+
+
+def test_location_view_actions_include_inspect_actions(compiled_world):
+    world = GameFactory().create_world(dungeon_locations)
+
+    for location in world.locations.values():
+        view = compiled_world[location.name]
+        assert view.objects == location.objects
+        assert [action.description for action in view.turn_actions] == [
+            action.description for action in location.turn_actions
+        ]
+    (chest,) = compiled_world["Treasure Chamber"].objects
+    assert InspectAction(chest) in compiled_world["Treasure Chamber"].turn_actions
+
+
+def test_objects_are_created_once_per_name():
+    created = []
+
+    def create_object(name):
+        created.append(name)
+        return Torch()
+
+    world = CompiledWorld.from_descriptions(
+        [
+            {"name": "Room 1", "objects": ["Torch"]},
+            {"name": "Room 2", "objects": ["Torch", "Other Torch"]},
+        ],
+        create_object,
+    )
+
+    assert created == ["Torch", "Other Torch"]
+    assert world["Room 1"].objects[0] is world["Room 2"].objects[0]
+
+
+def test_from_world_keeps_objects():
+    world = GameFactory().create_world(dungeon_locations)
+    compiled_world = CompiledWorld.from_world(world)
+
+    for location in world.locations.values():
+        objects = compiled_world[location.name].objects
+        assert [id(o) for o in objects] == [id(o) for o in location.objects]
+
+
+def test_player_on_compiled_world(compiled_world):
+    player = Player("The Player", Pawn(compiled_world.initial_location))
+
+    player.take_turn()
+    player.take_turn()
+
+    assert player.location == compiled_world["Dark Corridor"]
+    assert compiled_world.neighbor_ids(player.location.id).tolist() == [4, 1]
@@ -14,6 +14,16 @@ def test_create_object_with_kwargs(a_treasure_chest_description, object_classes)
     assert tc.gold == 100
 
 
+def test_factories_do_not_share_default_objects(a_treasure_chest_description):
+    factory = GameFactory()
+    factory.object_descriptions.update(a_treasure_chest_description)
+    factory.object_classes["Dummy"] = TreasureChest
+
+    other_factory = GameFactory()
+    assert "A Treasure Chest" not in other_factory.object_descriptions
+    assert "Dummy" not in other_factory.object_classes
+
+
 def test_create_world():
     factory = GameFactory()
     world = factory.create_world(simple_locations)
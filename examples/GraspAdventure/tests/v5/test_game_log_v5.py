@@ -0,0 +1,107 @@
+import random
+
+from grasp_adventure.v5.game_log import GameLog, GameRecorder, replay
+from grasp_adventure.v5.player import random_action_strategy
+from fixtures_v5 import *  # noqa
+
+
+def create_game():
+    return create_dungeon_game(random_action_strategy)
+
+
+@pytest.fixture()
+def recorded_game():
+    game = create_game()
+    recorder = GameRecorder(game, seed=42, snapshot_interval=10)
+    random.seed(42)
+    history = []
+    for _ in range(35):
+        game.run_round()
+        history.append([player.location.name for player in game.players])
+    return recorder.log, history
+
+
+def test_recorder_stores_actions_and_snapshots(recorded_game):
+    log, _ = recorded_game
+
+    assert log.seed == 42
+    assert log.num_rounds == 35
+    assert log.num_snapshots == 4
+    assert len(log.actions_in_round(1)) == 2
+
+
+@pytest.mark.parametrize("round_number", [0, 1, 9, 10, 11, 29, 35])
+def test_replay(recorded_game, round_number):
+    log, history = recorded_game
+    game = create_game()
+
+    replay(game, log, round_number)
+
+    expected = history[round_number - 1] if round_number else ["Vestibule"] * 2
+    assert [player.location.name for player in game.players] == expected
+    assert game.round_number == round_number
+
+
+def test_replay_outside_of_log(recorded_game):
+    log, _ = recorded_game
+
+    with pytest.raises(ValueError):
+        replay(create_game(), log, 36)
+
+
+def test_log_round_trip(recorded_game):
+    log, _ = recorded_game
+
+    data = log.to_bytes()
+
+    assert GameLog.from_bytes(data) == log
+    assert len(data) < 400
+
+
+def test_replay_is_consistent_with_recorded_seed(recorded_game):
+    log, history = recorded_game
+    game = create_game()
+    random.seed(log.seed)
+
+    for _ in range(log.num_rounds):
+        game.run_round()
+
+    assert [player.location.name for player in game.players] == history[-1]
+
+
+def test_recorder_uses_seed_of_game():
+    game = create_game()
+    game.reseed(7)
+    recorder = GameRecorder(game)
+    for _ in range(20):
+        game.run_round()
+
+    other_game = create_game()
+    other_game.reseed(recorder.log.seed)
+    for _ in range(20):
+        other_game.run_round()
+
+    assert recorder.log.seed == 7
+    assert [player.location for player in other_game.players] == [
+        other_game.world[player.location.name] for player in game.players
+    ]
+
+
+def test_recorder_follows_players_relocated_by_restore():
+    game = create_game()
+    game.reseed(3)
+    recorder = GameRecorder(game)
+    snapshot = game.snapshot()
+    for _ in range(5):
+        game.run_round()
+    game.restore(snapshot)
+    locations = []
+    for _ in range(5):
+        locations.append([player.location.name for player in game.players])
+        game.run_round()
+
+    log = recorder.log
+    assert log.num_rounds == 10
+    for round_number, names in enumerate(locations, 6):
+        for name, index in zip(names, log.actions_in_round(round_number)):
+            assert index < len(game.world[name].turn_actions)
@@ -0,0 +1,102 @@
+from io import StringIO
+
+from grasp_adventure.v5.actions import SkipTurnAction
+from fixtures_v5 import *  # noqa
+
+
+def locations(game):
+    return [player.location.name for player in game.players]
+
+
+def test_snapshot_and_restore(dungeon_game):
+    dungeon_game.run_round()
+    snapshot = dungeon_game.snapshot()
+    dungeon_game.run_round()
+
+    dungeon_game.restore(snapshot)
+
+    assert dungeon_game.round_number == 1
+    assert locations(dungeon_game) == ["Entrance Hall", "Entrance Hall"]
+
+
+def test_fork_is_independent(dungeon_game):
+    dungeon_game.run_round()
+
+    fork = dungeon_game.fork()
+    fork.run_round()
+
+    assert locations(dungeon_game) == ["Entrance Hall", "Entrance Hall"]
+    assert locations(fork) == ["Dark Corridor", "Dark Corridor"]
+    assert fork.round_number == 2
+    assert dungeon_game.round_number == 1
+
+
+def test_fork_shares_world_and_strategies(dungeon_game):
+    fork = dungeon_game.fork()
+
+    assert fork.world is dungeon_game.world
+    assert fork.players[0].pawn is not dungeon_game.players[0].pawn
+    assert fork.players[0].select_action is dungeon_game.players[0].select_action
+
+
+def test_description(dungeon_game):
+    assert dungeon_game.description == (
+        "Player 1 at Vestibule\n"
+        "Player 2 at Vestibule\n"
+        "Nothing noteworthy is happening in the world.\n"
+    )
+
+
+def test_description_is_cached_until_a_player_moves(dungeon_game):
+    description = dungeon_game.description
+    assert dungeon_game.description is description
+
+    dungeon_game.players[1].select_action = lambda player: SkipTurnAction()
+    dungeon_game.run_round()
+
+    assert dungeon_game.description == (
+        "Player 1 at Entrance Hall\n"
+        "Player 2 at Vestibule\n"
+        "Nothing noteworthy is happening in the world.\n"
+    )
+
+
+def test_description_only_renders_changed_lines(dungeon_game):
+    dungeon_game.description
+    unchanged_line = dungeon_game._description_lines[1]
+
+    dungeon_game.players[0].take_turn()
+    dungeon_game.description
+
+    assert dungeon_game._description_lines[1] is unchanged_line
+
+
+def test_description_follows_added_and_restored_players(dungeon_game):
+    snapshot = dungeon_game.snapshot()
+    dungeon_game.run_round()
+    dungeon_game.description
+    vestibule = dungeon_game.world["Vestibule"]
+    dungeon_game.players.append(Player("Player 3", Pawn(vestibule)))
+
+    assert dungeon_game.description.splitlines()[2] == "Player 3 at Vestibule"
+
+    dungeon_game.players.pop()
+    dungeon_game.restore(snapshot)
+
+    assert dungeon_game.description.splitlines() == [
+        "Player 1 at Vestibule",
+        "Player 2 at Vestibule",
+        "Nothing noteworthy is happening in the world.",
+    ]
+
+
+def test_write_description_into_reused_buffer(dungeon_game):
+    buffer = StringIO()
+    dungeon_game.write_description(buffer)
+    dungeon_game.run_round()
+
+    buffer.seek(0)
+    buffer.truncate()
+    dungeon_game.write_description(buffer)
+
+    assert buffer.getvalue() == dungeon_game.description
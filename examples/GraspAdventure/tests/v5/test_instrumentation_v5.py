@@ -0,0 +1,150 @@
+import asyncio
+from io import StringIO
+
+from grasp_adventure.v5.async_game import run_round_async
+from grasp_adventure.v5.instrumentation import (
+    Instrumentation,
+    Log2Histogram,
+    Profiler,
+)
+from grasp_adventure.v5.player import random_action_strategy
+from fixtures_v5 import *  # noqa
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.calls = []
+
+    def round_started(self, game):
+        self.calls.append(("round_started", game.round_number))
+
+    def round_finished(self, game):
+        self.calls.append(("round_finished", game.round_number))
+
+    def turn_taken(self, player, action, selection_ns, execution_ns):
+        assert selection_ns >= 0 and execution_ns >= 0
+        self.calls.append(("turn_taken", player.name))
+
+
+def test_instrumentation_is_disabled_by_default(dungeon_game):
+    assert dungeon_game.instrumentation is None
+    assert all(player.instrumentation is None for player in dungeon_game.players)
+
+
+def test_hooks_are_called_in_order(dungeon_game):
+    instrumentation = RecordingInstrumentation()
+    dungeon_game.instrument(instrumentation)
+
+    dungeon_game.run_round()
+
+    assert instrumentation.calls == [
+        ("round_started", 1),
+        ("turn_taken", "Player 1"),
+        ("turn_taken", "Player 2"),
+        ("round_finished", 1),
+    ]
+
+
+def test_hooks_are_called_by_async_game(dungeon_game):
+    instrumentation = RecordingInstrumentation()
+    dungeon_game.instrument(instrumentation)
+
+    asyncio.run(run_round_async(dungeon_game))
+
+    assert instrumentation.calls == [
+        ("round_started", 1),
+        ("turn_taken", "Player 1"),
+        ("turn_taken", "Player 2"),
+        ("round_finished", 1),
+    ]
+
+
+def test_instrument_none_disables_hooks(dungeon_game):
+    instrumentation = RecordingInstrumentation()
+    dungeon_game.instrument(instrumentation)
+    dungeon_game.instrument(None)
+
+    dungeon_game.run_round()
+
+    assert instrumentation.calls == []
+
+
+def test_fork_is_not_instrumented(dungeon_game):
+    dungeon_game.instrument(Instrumentation())
+
+    fork = dungeon_game.fork()
+
+    assert fork.instrumentation is None
+    assert all(player.instrumentation is None for player in fork.players)
+
+
+def test_log2_histogram_buckets():
+    histogram = Log2Histogram()
+    for value in [0, 1, 5, 7, 8]:
+        histogram.add(value)
+
+    assert list(histogram) == [(0, 0, 1), (1, 1, 1), (4, 7, 2), (8, 15, 1)]
+    assert histogram.mean == 4.2
+    assert histogram.quantile(1.0) == 15
+
+
+def test_empty_log2_histogram():
+    histogram = Log2Histogram()
+
+    assert histogram.mean == 0.0
+    assert histogram.quantile(0.5) == 0
+    assert list(histogram) == []
+
+
+def test_profiler_histograms(dungeon_game):
+    profiler = Profiler()
+    dungeon_game.instrument(profiler)
+
+    for _ in range(20):
+        dungeon_game.run_round()
+
+    assert profiler.histograms["round"].count == 20
+    assert profiler.histograms["select_action"].count == 40
+    assert profiler.histograms["execute_action"].count == 40
+
+
+def test_profiler_stacks_per_strategy_and_action(dungeon_game):
+    profiler = Profiler()
+    dungeon_game.players[1].select_action = random_action_strategy
+    dungeon_game.instrument(profiler)
+
+    for _ in range(20):
+        dungeon_game.run_round()
+
+    stacks = set(profiler.stack_totals)
+    assert ("run_round", "first_action_strategy") in stacks
+    assert ("run_round", "random_action_strategy") in stacks
+    assert ("run_round", "MoveAction.execute") in stacks
+
+
+def test_folded_stacks_contain_self_time():
+    profiler = Profiler()
+    profiler.stack_totals = {
+        ("run_round",): 100,
+        ("run_round", "first_action_strategy"): 30,
+        ("run_round", "MoveAction.execute"): 20,
+    }
+
+    assert profiler.folded_stacks() == {
+        ("run_round",): 50,
+        ("run_round", "first_action_strategy"): 30,
+        ("run_round", "MoveAction.execute"): 20,
+    }
+
+
+def test_write_folded():
+    profiler = Profiler()
+    profiler.stack_totals = {
+        ("run_round",): 100,
+        ("run_round", "first_action_strategy"): 30,
+    }
+    file = StringIO()
+
+    profiler.write_folded(file)
+
+    assert file.getvalue() == "run_round 70\nrun_round;first_action_strategy 30\n"
@@ -1,4 +1,8 @@
+from dataclasses import fields
+
 from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import InspectAction, MoveAction, SkipTurnAction
+from grasp_adventure.v5.game_objects import Torch
 from grasp_adventure.v5.location import Location
 
 
@@ -17,3 +21,112 @@ def test_connections():
 
     assert room1["north"] == room2
     assert room2["south"] == room1
+
+
+def test_move_actions_are_cached(level):
+    room1 = level["Room 1"]
+
+    assert room1.move_actions == (MoveAction("north", level["Room 2"]),)
+    assert room1.move_actions is room1.move_actions
+    assert room1.turn_actions is room1.turn_actions
+
+
+def test_assigning_connections_invalidates_actions(level):
+    room1 = level["Room 1"]
+    old_actions = room1.turn_actions
+
+    room1.connections = {"east": level["Room 2"]}
+
+    assert room1.turn_actions is not old_actions
+    assert room1.turn_actions == (MoveAction("east", level["Room 2"]), SkipTurnAction())
+
+
+def test_connections_and_objects_are_fields():
+    room2 = Location("Room 2")
+    torch = Torch()
+
+    location = Location("Room 1", connections={"north": room2}, objects=[torch])
+
+    assert location["north"] is room2
+    assert location.objects == [torch]
+    assert "connections=" in repr(location)
+    assert location != Location("Room 1")
+
+
+def test_observers_are_only_notified_of_connection_changes(level):
+    room1 = level["Room 1"]
+    changed = []
+    room1.add_observer(changed.append)
+
+    room1.description = "A dusty room"
+    room1.connections = {}
+
+    assert changed == [room1]
+
+
+def test_from_description_creates_objects():
+    location = Location.from_description(
+        {"name": "Room 1", "objects": ["A Torch"]}, lambda name: Torch()
+    )
+
+    assert location.objects == [Torch()]
+
+
+def test_from_description_without_create_object_ignores_objects():
+    location = Location.from_description({"name": "Room 1", "objects": ["A Torch"]})
+
+    assert location.objects == []
+
+
+def test_turn_actions_include_inspect_actions(level):
+    room1 = level["Room 1"]
+    torch = Torch()
+
+    room1.add_object(torch)
+
+    assert room1.turn_actions == (
+        MoveAction("north", level["Room 2"]),
+        InspectAction(torch),
+        SkipTurnAction(),
+    )
+
+
+def test_removing_object_invalidates_actions(level):
+    room1 = level["Room 1"]
+    torch = Torch()
+    room1.add_object(torch)
+
+    room1.remove_object(torch)
+
+    assert room1.turn_actions == (
+        MoveAction("north", level["Room 2"]),
+        SkipTurnAction(),
+    )
+
+
+def test_object_observers_are_notified(level):
+    room1 = level["Room 1"]
+    changed = []
+    room1.add_object_observer(changed.append)
+
+    room1.objects = [Torch()]
+
+    assert changed == [room1]
+
+
+def test_create_unobserved_is_equivalent_to_init():
+    objects = [Torch()]
+
+    location = Location._create_unobserved("Room 1", "A small room", objects)
+
+    assert vars(location) == vars(Location("Room 1", "A small room", objects=objects))
+
+
+def test_create_unobserved_sets_every_field():
+    location = Location._create_unobserved("Room 1", "", [])
+
+    assert set(vars(location)) == {
+        f"_{f.name}" if f.name in ("connections", "objects") else f.name
+        for f in fields(Location)
+    }
+    assert set(vars(location)) == set(vars(Location("Room 1")))
@@ -0,0 +1,113 @@
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.base_classes import GameObject
+from grasp_adventure.v5.game_objects import Torch
+from grasp_adventure.v5.location import Location
+from grasp_adventure.v5.object_index import ObjectIndex
+from grasp_adventure.v5.player import goal_directed_strategy
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def dungeon():
+    return GameFactory().create_world(dungeon_locations)
+
+
+def test_create_world_creates_objects(dungeon):
+    (chest,) = dungeon["Treasure Chamber"].objects
+
+    assert isinstance(chest, TreasureChest)
+    assert chest.gold == 200
+    assert dungeon["Vestibule"].objects == []
+
+
+def test_create_world_from_stream_creates_objects():
+    world = GameFactory().create_world_from_stream(iter(dungeon_locations))
+
+    assert world.objects_at("Brightly Lit Corridor") == (Torch(),)
+
+
+def test_objects_at(dungeon):
+    assert dungeon.objects_at("Treasure Chamber") == (TreasureChest(gold=200),)
+    assert dungeon.objects_at("Vestibule") == ()
+
+
+def test_locations_containing(dungeon):
+    assert dungeon.locations_containing(Torch) == ["Brightly Lit Corridor"]
+
+
+def test_locations_containing_includes_subclasses(dungeon):
+    assert set(dungeon.locations_containing(GameObject)) == {
+        "Brightly Lit Corridor",
+        "Treasure Chamber",
+    }
+
+
+def test_nearest_object(dungeon):
+    assert dungeon.nearest_object("Vestibule", TreasureChest) == (
+        "Treasure Chamber",
+        3,
+    )
+    assert dungeon.nearest_object("Treasure Chamber", TreasureChest) == (
+        "Treasure Chamber",
+        0,
+    )
+
+
+def test_nearest_object_not_reachable(dungeon):
+    dungeon["Dark Corridor"].connections = {"east": dungeon["Entrance Hall"]}
+
+    assert dungeon.nearest_object("Vestibule", TreasureChest) is None
+
+
+def test_index_follows_changed_objects(dungeon):
+    torch = dungeon["Brightly Lit Corridor"].objects[0]
+    assert dungeon.locations_containing(Torch) == ["Brightly Lit Corridor"]
+
+    dungeon["Brightly Lit Corridor"].remove_object(torch)
+    dungeon["Vestibule"].add_object(torch)
+
+    assert dungeon.locations_containing(Torch) == ["Vestibule"]
+    assert dungeon.nearest_object("Entrance Hall", Torch) == ("Vestibule", 1)
+
+
+def test_cached_location_sets_follow_changed_objects(dungeon):
+    index = dungeon.object_index
+    torches = index.locations_containing_set(Torch)
+    assert index.locations_containing_set(Torch) is torches
+    torch = dungeon["Brightly Lit Corridor"].objects[0]
+
+    dungeon["Brightly Lit Corridor"].remove_object(torch)
+    dungeon["Vestibule"].add_object(torch)
+
+    assert index.locations_containing_set(Torch) == {"Vestibule"}
+
+
+def test_index_counts_several_objects_in_one_location():
+    index = ObjectIndex()
+    location = Location("Room 1", objects=[Torch(), Torch()])
+    index.update_location(location)
+
+    location.objects = [Torch()]
+    index.update_location(location)
+
+    assert index.locations_containing(Torch) == ["Room 1"]
+
+
+def test_player_sees_inspect_actions(dungeon):
+    player = Player("The Hero", Pawn(dungeon["Treasure Chamber"]))
+
+    assert [action.description for action in player.actions] == [
+        "move east to Dark Corridor",
+        "inspect a treasure chest",
+        "wait one turn",
+    ]
+
+
+def test_goal_directed_strategy_with_object_class(dungeon):
+    strategy = goal_directed_strategy(dungeon, TreasureChest)
+    player = Player("The Hero", Pawn(dungeon["Vestibule"]), strategy)
+
+    for _ in range(5):
+        player.take_turn()
+
+    assert player.location == dungeon["Treasure Chamber"]
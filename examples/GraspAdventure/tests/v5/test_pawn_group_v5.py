@@ -0,0 +1,124 @@
+from random import Random
+
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.compiled_world import CompiledWorld
+from grasp_adventure.v5.pawn_group import PawnGroup, TransitionTable
+from grasp_adventure.v5.player import first_action_strategy
+from grasp_adventure.v5.random_streams import RandomStream
+from fixtures_v5 import *  # noqa
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "numpy"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.fixture()
+def dungeon():
+    return GameFactory().create_world(dungeon_locations)
+
+
+@pytest.fixture()
+def transitions(dungeon):
+    return TransitionTable.from_world(dungeon)
+
+
+def test_transition_table_follows_turn_actions(dungeon, transitions):
+    world = transitions.world
+    for location in dungeon.locations.values():
+        location_id = world.location_ids[location.name]
+        start = transitions.offsets[location_id]
+        end = transitions.offsets[location_id + 1]
+        expected = [
+            getattr(action, "target", location).name
+            for action in location.turn_actions
+        ]
+        assert [world.names[i] for i in transitions.targets[start:end]] == expected
+
+
+def test_transition_table_of_compiled_world_includes_inspect_actions():
+    world = CompiledWorld.from_descriptions(dungeon_locations)
+    transitions = TransitionTable.from_compiled_world(world)
+
+    for view in world:
+        assert transitions.num_actions[view.id] == len(view.turn_actions)
+    assert transitions.num_actions[world.location_ids["Treasure Chamber"]] == 3
+
+
+def test_step_first_matches_first_action_strategy(dungeon, transitions, use_numpy):
+    pawns = [Pawn(location) for location in dungeon.locations.values()]
+    group = PawnGroup.from_pawns(transitions, pawns, use_numpy)
+    players = [Player(f"Player {i}", pawn) for i, pawn in enumerate(pawns)]
+
+    for _ in range(3):
+        group.step_first()
+        for player in players:
+            first_action_strategy(player).execute(player)
+
+    assert group.location_names() == [pawn.location.name for pawn in pawns]
+
+
+def test_step_random_only_uses_turn_actions(transitions, use_numpy):
+    group = PawnGroup.at_location(transitions, "Entrance Hall", 1000, use_numpy)
+
+    group.step_random(Random(42))
+
+    counts = group.count_by_location()
+    assert set(counts) == {
+        "Entrance Hall",
+        "Vestibule",
+        "Dark Corridor",
+        "Brightly Lit Corridor",
+    }
+    assert all(150 < count < 350 for count in counts.values())
+
+
+def test_step_random_is_reproducible(transitions, use_numpy):
+    group1 = PawnGroup.at_location(transitions, "Vestibule", 100, use_numpy)
+    group2 = PawnGroup.at_location(transitions, "Vestibule", 100, use_numpy)
+
+    group1.run(10, "random", Random(1))
+    group2.run(10, "random", Random(1))
+
+    assert group1.location_ids == group2.location_ids
+
+
+def test_step_random_accepts_random_stream(transitions, use_numpy):
+    group1 = PawnGroup.at_location(transitions, "Vestibule", 100, use_numpy)
+    group2 = PawnGroup.at_location(transitions, "Vestibule", 100, use_numpy)
+
+    group1.run(10, "random", RandomStream(1))
+    group2.run(10, "random", RandomStream(1))
+
+    assert group1.location_ids == group2.location_ids
+    assert len(group1.count_by_location()) > 1
+
+
+def test_run_with_unknown_strategy_raises_error(transitions):
+    group = PawnGroup.at_location(transitions, "Vestibule", 10)
+
+    with pytest.raises(ValueError):
+        group.run(1, "interactive")
+
+
+def test_update_pawns(dungeon, transitions, use_numpy):
+    pawns = [Pawn(dungeon["Vestibule"]) for _ in range(3)]
+    group = PawnGroup.from_pawns(transitions, pawns, use_numpy)
+
+    group.run(2)
+    group.update_pawns(pawns, dungeon)
+
+    assert all(pawn.location is dungeon["Dark Corridor"] for pawn in pawns)
+
+
+def test_large_group_on_generated_world(use_numpy):
+    world = CompiledWorld.from_descriptions(generate_locations(400))
+    transitions = TransitionTable.from_compiled_world(world)
+    group = PawnGroup.at_location(transitions, "Room 0", 10_000, use_numpy)
+
+    group.run(5, "random", Random(0))
+
+    assert len(group) == 10_000
+    assert sum(group.count_by_location().values()) == 10_000
@@ -1,4 +1,6 @@
 from grasp_adventure.v5.actions import MoveAction, SkipTurnAction
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.player import goal_directed_strategy
 from fixtures_v5 import *  # noqa
 
 
@@ -9,7 +11,7 @@ def test_player_location(player, level):
 def test_actions(player, level):
     actions = player.actions
 
-    assert actions == [MoveAction("north", level["Room 2"]), SkipTurnAction()]
+    assert actions == (MoveAction("north", level["Room 2"]), SkipTurnAction())
 
 
 def test_select_action(player, level):
@@ -31,3 +33,59 @@ def test_perform_wait_action(player, level):
 def test_take_turn(player, level):
     player.take_turn()
     assert player.location == level["Room 2"]
+
+
+def test_actions_are_shared_between_players(player, level):
+    other_player = Player(name="Other Player", pawn=Pawn(location=level["Room 1"]))
+
+    assert other_player.actions is player.actions
+
+
+@pytest.fixture()
+def dungeon():
+    return GameFactory().create_world(dungeon_locations)
+
+
+def test_goal_directed_strategy(dungeon):
+    strategy = goal_directed_strategy(dungeon, "Treasure Chamber")
+    player = Player("The Hero", Pawn(dungeon["Vestibule"]), strategy)
+
+    for _ in range(5):
+        player.take_turn()
+
+    assert player.location == dungeon["Treasure Chamber"]
+    assert player.select_action(player) == SkipTurnAction()
+
+
+def test_goal_directed_strategy_with_several_targets(dungeon):
+    strategy = goal_directed_strategy(
+        dungeon, ["Treasure Chamber", "Brightly Lit Corridor"]
+    )
+    player = Player("The Hero", Pawn(dungeon["Dark Corridor"]), strategy)
+
+    assert player.select_action(player) == MoveAction(
+        "west", dungeon["Treasure Chamber"]
+    )
+
+
+def test_goal_directed_strategy_shares_routing_table(dungeon):
+    strategy = goal_directed_strategy(dungeon, "Treasure Chamber")
+    players = [
+        Player(f"Bot {i}", Pawn(dungeon["Vestibule"]), strategy) for i in range(3)
+    ]
+
+    for player in players:
+        player.take_turn()
+
+    assert len(dungeon.graph._routing_tables) == 1
+
+
+def test_goal_directed_strategy_follows_changed_connections(dungeon):
+    strategy = goal_directed_strategy(dungeon, "Treasure Chamber")
+    player = Player("The Hero", Pawn(dungeon["Vestibule"]), strategy)
+    player.take_turn()
+
+    dungeon["Entrance Hall"].connections = {"down": dungeon["Treasure Chamber"]}
+    player.take_turn()
+
+    assert player.location == dungeon["Treasure Chamber"]
@@ -0,0 +1,113 @@
+import random
+
+from grasp_adventure.v5.game import Game
+from grasp_adventure.v5.player import random_action_strategy
+from grasp_adventure.v5.random_streams import RandomStream, derive_seed, spawn_seeds
+from fixtures_v5 import *  # noqa
+
+
+def create_game(seed=None):
+    return create_dungeon_game(random_action_strategy, seed)
+
+
+def play(game, num_rounds=50):
+    history = []
+    for _ in range(num_rounds):
+        game.run_round()
+        history.append(tuple(player.location.name for player in game.players))
+    return history
+
+
+def test_random_stream_is_reproducible():
+    stream1, stream2 = RandomStream(1), RandomStream(1)
+
+    values = [stream1.random() for _ in range(3000)]
+
+    assert values == [stream2.random() for _ in range(3000)]
+    assert all(0 <= value < 1 for value in values)
+
+
+def test_random_stream_choice_covers_all_elements():
+    stream = RandomStream(3)
+
+    assert {stream.choice("abcd") for _ in range(200)} == set("abcd")
+
+
+def test_random_stream_state():
+    stream = RandomStream(5)
+    for _ in range(10):
+        stream.random()
+    state = stream.getstate()
+    expected = [stream.random() for _ in range(5)]
+
+    stream.setstate(state)
+
+    assert [stream.random() for _ in range(5)] == expected
+    assert stream.getstate() == stream.copy().getstate()
+
+
+def test_derived_seeds_are_distinct():
+    seeds = spawn_seeds(42, 1000)
+
+    assert len(set(seeds)) == 1000
+    assert seeds == spawn_seeds(42, 1000)
+    assert derive_seed(42, "spawn", 0) == seeds[0]
+
+
+def test_game_without_seed():
+    game = create_game()
+
+    assert game.seed is None
+    assert all(player.rng is None for player in game.players)
+
+
+def test_reseed_gives_players_independent_streams():
+    game = create_game(seed=11)
+
+    rng1, rng2 = (player.rng for player in game.players)
+
+    assert game.seed == 11
+    assert [rng1.random() for _ in range(5)] != [rng2.random() for _ in range(5)]
+
+
+def test_seeded_games_are_repeatable():
+    assert play(create_game(seed=3)) == play(create_game(seed=3))
+    assert play(create_game(seed=3)) != play(create_game(seed=4))
+
+
+def test_seeded_games_are_independent_of_global_rng():
+    game = create_game(seed=3)
+    random.seed(0)
+    history = play(game)
+
+    random.seed(1)
+
+    assert play(create_game(seed=3)) == history
+
+
+def test_seed_in_constructor():
+    game = create_game()
+    seeded_game = Game(players=game.players, world=game.world, seed=3)
+
+    assert play(seeded_game) == play(create_game(seed=3))
+
+
+def test_fork_continues_with_same_random_choices():
+    game = create_game(seed=9)
+    play(game, 10)
+
+    fork = game.fork()
+
+    assert fork.seed == 9
+    assert play(fork) == play(game)
+
+
+def test_snapshot_restores_random_streams():
+    game = create_game(seed=9)
+    play(game, 10)
+    snapshot = game.snapshot()
+    expected = play(game)
+
+    game.restore(snapshot)
+
+    assert play(game) == expected
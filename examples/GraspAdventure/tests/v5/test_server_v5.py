@@ -0,0 +1,105 @@
+import asyncio
+
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.compiled_world import CompiledWorld
+from grasp_adventure.v5.server import HELP_TEXT, GameServer, GameSession
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def compiled_world():
+    return CompiledWorld.from_descriptions(dungeon_locations)
+
+
+def test_game_session_look(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+
+    assert session.look().startswith("Player 1 at Vestibule. ")
+
+
+def test_game_session_list_actions(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+
+    assert session.handle_command("actions\n") == "\n".join(
+        f"{i}: {action.description}"
+        for i, action in enumerate(compiled_world["Vestibule"].turn_actions, 1)
+    )
+
+
+def test_game_session_perform_action(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+    target = compiled_world["Vestibule"].move_actions[0].target
+
+    result = session.handle_command("1")
+
+    assert session.player.location == target
+    assert session.game.round_number == 1
+    assert result.startswith(f"Player 1 at {target.name}. ")
+
+
+def test_game_session_invalid_number(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+
+    result = session.handle_command("99")
+
+    assert result.startswith("Please enter a number between 1 and ")
+    assert session.player.location.name == "Vestibule"
+
+
+def test_game_session_digits_that_are_not_numbers(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+
+    result = session.handle_command("\u00b2")
+
+    assert result.startswith("Please enter a number between 1 and ")
+    assert session.player.location.name == "Vestibule"
+
+
+def test_game_session_unknown_command(compiled_world):
+    session = GameSession(compiled_world, "Player 1")
+
+    assert session.handle_command("dance") == HELP_TEXT
+
+
+def test_sessions_share_world(compiled_world):
+    session_1 = GameSession(compiled_world, "Player 1")
+    session_2 = GameSession(compiled_world, "Player 2")
+
+    session_1.handle_command("1")
+
+    assert session_1.game.world is session_2.game.world
+    assert session_2.player.location.name == "Vestibule"
+
+
+async def run_client(port: int, commands: list[str]) -> list[str]:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for command in commands:
+        writer.write(f"{command}\n".encode())
+    await writer.drain()
+    lines = []
+    while line := await reader.readline():
+        lines.append(line.decode().rstrip("\n"))
+    writer.close()
+    return lines
+
+
+def test_server_handles_concurrent_clients(compiled_world):
+    game_server = GameServer(compiled_world)
+
+    async def main():
+        server = await game_server.start()
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(
+                run_client(port, ["1", "quit"]), run_client(port, ["look", "quit"])
+            )
+
+    lines_1, lines_2 = asyncio.run(main())
+
+    target = compiled_world["Vestibule"].move_actions[0].target
+    assert lines_1[0] == "Welcome, Player 1!"
+    assert lines_1[-2].startswith(f"Player 1 at {target.name}. ")
+    assert lines_1[-1] == "Goodbye!"
+    assert lines_2[0] == "Welcome, Player 2!"
+    assert lines_2[-2].startswith("Player 2 at Vestibule. ")
+    assert game_server.sessions == {}
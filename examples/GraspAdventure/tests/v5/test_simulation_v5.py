@@ -0,0 +1,37 @@
+from grasp_adventure.v5.actions import MoveAction
+from grasp_adventure.v5.simulation import EventRingBuffer, RoundEvent, run_headless
+from fixtures_v5 import *  # noqa
+
+
+def test_run_round_does_not_print(dungeon_game, capsys):
+    dungeon_game.run_round()
+
+    assert capsys.readouterr().out == ""
+    assert dungeon_game.round_number == 1
+    assert dungeon_game.players[0].location.name == "Entrance Hall"
+
+
+def test_play_round_prints_description(dungeon_game, capsys):
+    dungeon_game.play_round()
+
+    assert "Player 1 at Entrance Hall" in capsys.readouterr().out
+
+
+def test_run_headless(dungeon_game, capsys):
+    report = run_headless(dungeon_game, 10)
+
+    assert capsys.readouterr().out == ""
+    assert report.num_rounds == 10
+    assert report.rounds_per_second > 0
+    assert dungeon_game.round_number == 10
+
+
+def test_run_headless_records_events(dungeon_game):
+    events = EventRingBuffer(capacity=3)
+    run_headless(dungeon_game, 2, events)
+
+    assert len(events) == 3
+    assert list(events)[-1] == RoundEvent(
+        2, "Player 2", MoveAction("west", dungeon_game.world["Dark Corridor"])
+    )
+    assert dungeon_game.observers == []
@@ -0,0 +1,66 @@
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.tournament import (
+    RunningStatistics,
+    StrategyConfig,
+    play_games,
+    run_tournament,
+)
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def strategy_configs():
+    return [
+        StrategyConfig("First", "first"),
+        StrategyConfig("Random", "random", location="Treasure Chamber"),
+        StrategyConfig("Seeker", "goal", options={"targets": "Treasure Chamber"}),
+    ]
+
+
+def test_running_statistics():
+    stats = RunningStatistics()
+    for value in [1, 2, 3, 4]:
+        stats.add(value)
+
+    assert stats.count == 4
+    assert stats.mean == 2.5
+    assert stats.variance == pytest.approx(5 / 3)
+    assert (stats.min, stats.max) == (1, 4)
+
+
+def test_play_games_in_process(strategy_configs):
+    results = list(
+        play_games(dungeon_locations, strategy_configs, [1, 2], 6, max_workers=0)
+    )
+
+    assert [result.seed for result in results] == [1, 2]
+    first, _, seeker = results[0].player_results
+    assert first.moves == 6
+    assert first.locations_visited == 4
+    assert seeker.final_location == "Treasure Chamber"
+    assert seeker.moves == 3
+
+
+def test_games_are_reproducible(strategy_configs):
+    results = list(
+        play_games(dungeon_locations, strategy_configs, [7, 7], 20, max_workers=0)
+    )
+
+    assert results[0] == results[1]
+
+
+def test_run_tournament_in_worker_processes(strategy_configs):
+    statistics = run_tournament(
+        dungeon_locations, strategy_configs, range(20), 10, max_workers=2
+    )
+    expected = run_tournament(
+        dungeon_locations, strategy_configs, range(20), 10, max_workers=0
+    )
+
+    assert statistics.num_games == 20
+    assert statistics.players["Seeker"]["moves"].mean == 3
+    assert statistics.final_locations == expected.final_locations
+    assert (
+        statistics.players["Random"]["moves"].mean
+        == expected.players["Random"]["moves"].mean
+    )
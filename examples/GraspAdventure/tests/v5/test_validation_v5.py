@@ -0,0 +1,233 @@
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.validation import (
+    InvalidLocationDescriptions,
+    LocationProblem,
+    ValidationCache,
+    content_hash,
+    validate_locations,
+)
+from grasp_adventure.v5.world_loader import write_location_file
+from fixtures_v5 import *  # noqa
+
+
+def test_valid_descriptions_have_no_problems():
+    assert validate_locations(dungeon_locations).problems == ()
+    assert validate_locations(simple_locations).problems == ()
+
+
+def test_generated_worlds_are_valid():
+    result = validate_locations(generate_locations(500, seed=2))
+
+    assert result.is_valid
+    assert result.warnings == ()
+
+
+def test_all_problems_are_reported():
+    result = validate_locations(
+        [
+            {"name": "Room 1", "connections": {"north": "Room 2", "east": "Nowhere"}},
+            {"name": "Room 2", "connections": {"south": "Room 1"}},
+            {"name": "Room 2"},
+            {"description": "A room without a name"},
+            {"name": "Room 3", "connections": {"west": "Room 1"}},
+        ]
+    )
+
+    assert result.errors == (
+        LocationProblem("Room 2", "name is used by more than one location"),
+        LocationProblem("<location 4>", "location has no name"),
+        LocationProblem(
+            "Room 1", "connection 'east' leads to unknown location 'Nowhere'"
+        ),
+    )
+    assert result.warnings == (
+        LocationProblem(
+            "Room 3", "connection 'west' to 'Room 1' has no way back", False
+        ),
+        LocationProblem("Room 3", "no connection leads to this location", False),
+    )
+    assert not result.is_valid
+
+
+def test_malformed_descriptions_are_reported():
+    result = validate_locations(
+        [
+            {"name": "Room 1", "connections": None},
+            {"name": "Room 2", "connections": ["Room 1"]},
+            ["Room 3"],
+            {"name": "Room 4", "description": 4, "connections": {"north": 1}},
+            {"name": "Room 5", "objects": "Torch"},
+            {"name": "Room 6", "objects": ["Torch", None]},
+        ]
+    )
+
+    assert result.errors == (
+        LocationProblem(
+            "Room 1", "connections are not a mapping of directions to names"
+        ),
+        LocationProblem(
+            "Room 2", "connections are not a mapping of directions to names"
+        ),
+        LocationProblem("<location 3>", "description is not a mapping"),
+        LocationProblem("Room 4", "description is not a string"),
+        LocationProblem("Room 4", "connection 'north' to 1 is not a pair of strings"),
+        LocationProblem("Room 5", "objects are not a list of names"),
+        LocationProblem("Room 6", "object None is not a name"),
+    )
+
+
+def test_unknown_objects_are_reported():
+    descriptions = [{"name": "Room 1", "objects": ["Lamp", "Torch"]}]
+
+    assert validate_locations(descriptions).is_valid
+    assert validate_locations(descriptions, {"Torch"}).errors == (
+        LocationProblem("Room 1", "unknown object 'Lamp'"),
+    )
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_create_world_reports_unknown_objects(stream):
+    descriptions = [
+        {"name": "Room 1", "objects": ["Lamp"], "connections": None},
+        {"name": "Room 2", "objects": ["Torch"]},
+    ]
+    factory = GameFactory()
+
+    with pytest.raises(InvalidLocationDescriptions) as error:
+        if stream:
+            factory.create_world_from_stream(iter(descriptions))
+        else:
+            factory.create_world(descriptions)
+
+    assert error.value.problems == (
+        LocationProblem(
+            "Room 1", "connections are not a mapping of directions to names"
+        ),
+        LocationProblem("Room 1", "unknown object 'Lamp'"),
+    )
+
+
+def test_no_locations_is_an_error():
+    result = validate_locations([])
+
+    assert result.errors == (LocationProblem(None, "there are no locations"),)
+
+
+def test_warnings_do_not_make_descriptions_invalid():
+    result = validate_locations(
+        [{"name": "Room 1", "connections": {"north": "Room 2"}}, {"name": "Room 2"}]
+    )
+
+    assert result.is_valid
+    result.raise_for_errors()
+
+
+def test_raise_for_errors():
+    result = validate_locations([{"name": "Room 1"}, {"name": "Room 1"}])
+
+    with pytest.raises(InvalidLocationDescriptions) as error:
+        result.raise_for_errors()
+
+    assert error.value.problems == result.errors
+    assert "Error in 'Room 1': name is used by more than one location" in str(
+        error.value
+    )
+
+
+def test_create_world_reports_unknown_locations():
+    with pytest.raises(InvalidLocationDescriptions) as error:
+        GameFactory().create_world(
+            [{"name": "Room 1", "connections": {"north": "Nowhere"}}]
+        )
+
+    assert error.value.problems == (
+        LocationProblem(
+            "Room 1", "connection 'north' leads to unknown location 'Nowhere'"
+        ),
+    )
+
+
+def test_create_world_from_stream_reports_duplicates():
+    with pytest.raises(InvalidLocationDescriptions):
+        GameFactory().create_world_from_stream(
+            iter([{"name": "Room 1"}, {"name": "Room 1"}])
+        )
+
+
+def test_content_hash_ignores_key_order():
+    reordered = [dict(reversed(list(d.items()))) for d in dungeon_locations]
+
+    assert content_hash(reordered) == content_hash(dungeon_locations)
+    assert content_hash(simple_locations) != content_hash(dungeon_locations)
+
+
+def test_validation_cache_returns_cached_result():
+    cache = ValidationCache()
+
+    result = cache.validate(iter(dungeon_locations))
+
+    assert cache.validate(dungeon_locations) is result
+    assert len(cache) == 1
+
+
+def test_validation_cache_distinguishes_object_names():
+    cache = ValidationCache()
+    descriptions = [{"name": "Room 1", "objects": ["Lamp"]}]
+
+    assert cache.validate(descriptions).is_valid
+    assert not cache.validate(descriptions, {"Torch"}).is_valid
+    assert cache.validate(descriptions, ["Lamp"]).is_valid
+    assert len(cache) == 3
+
+
+def test_validation_cache_distinguishes_key_types():
+    cache = ValidationCache()
+    valid = [{"name": "1", "connections": {"1": "1"}}]
+    invalid = [{"name": "1", "connections": {1: "1"}}]
+
+    assert cache.validate(valid).is_valid
+    assert not cache.validate(invalid).is_valid
+    assert len(cache) == 1
+
+
+def test_validation_cache_validates_descriptions_with_sets():
+    cache = ValidationCache()
+    descriptions = [{"name": "Room 1", "objects": {"Torch"}}]
+
+    assert cache.validate(descriptions).is_valid
+    assert not cache.validate(descriptions, {"Lamp"}).is_valid
+    assert len(cache) == 0
+
+
+def test_validation_cache_is_bounded():
+    cache = ValidationCache()
+    cache.max_size = 2
+
+    for name in ["Room 1", "Room 2", "Room 3"]:
+        cache.validate([{"name": name}])
+
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_validate_file(tmp_path, binary):
+    path = tmp_path / "level.dat"
+    write_location_file(dungeon_locations, path, binary=binary)
+    cache = ValidationCache()
+
+    result = cache.validate_file(path)
+
+    assert result.is_valid
+    assert cache.validate_file(path) is result
+
+
+def test_validate_changed_file(tmp_path):
+    path = tmp_path / "level.jsonl"
+    write_location_file(dungeon_locations, path)
+    cache = ValidationCache()
+    cache.validate_file(path)
+
+    write_location_file(dungeon_locations + [{"name": "Vestibule"}], path)
+
+    assert not cache.validate_file(path).is_valid
@@ -0,0 +1,114 @@
+import os
+import subprocess
+import sys
+
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.location import Location
+from grasp_adventure.v5.world_graph import WorldGraph
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def dungeon():
+    return GameFactory().create_world(dungeon_locations)
+
+
+def test_shortest_path(dungeon):
+    assert dungeon.shortest_path("Treasure Chamber", "Brightly Lit Corridor") == [
+        "Treasure Chamber",
+        "Dark Corridor",
+        "Entrance Hall",
+        "Brightly Lit Corridor",
+    ]
+    assert dungeon.shortest_path("Vestibule", "Vestibule") == ["Vestibule"]
+
+
+def test_shortest_path_for_unknown_location(dungeon):
+    with pytest.raises(KeyError):
+        dungeon.shortest_path("Nowhere", "Vestibule")
+
+
+def test_distances(dungeon):
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+    assert dungeon.all_pairs_distances()["Dark Corridor"] == {
+        "Dark Corridor": 0,
+        "Treasure Chamber": 1,
+        "Entrance Hall": 1,
+        "Brightly Lit Corridor": 2,
+        "Vestibule": 2,
+    }
+
+
+def test_one_way_connections():
+    room1, room2 = Location("Room 1"), Location("Room 2")
+    room1.connections = {"down": room2}
+    graph = WorldGraph([room1, room2])
+
+    assert graph.is_reachable("Room 1", "Room 2")
+    assert not graph.is_reachable("Room 2", "Room 1")
+    assert graph.shortest_path("Room 2", "Room 1") is None
+    assert graph.are_connected("Room 2", "Room 1")
+
+
+def test_connected_components(dungeon):
+    assert dungeon.connected_components() == [set(dungeon.locations)]
+
+
+def test_graph_is_updated_when_connections_change(dungeon):
+    graph = dungeon.graph
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+
+    dungeon["Vestibule"].connections = {"west": dungeon["Treasure Chamber"]}
+
+    assert dungeon.graph is graph
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 1
+    assert dungeon.distance("Vestibule", "Entrance Hall") == 3
+    assert set(graph.predecessors["Entrance Hall"]) == {
+        "Dark Corridor",
+        "Brightly Lit Corridor",
+    }
+
+
+def test_components_are_updated_when_connections_change(dungeon):
+    assert len(dungeon.connected_components()) == 1
+
+    GameFactory._build_connections_for_all_locations(
+        dungeon.locations,
+        [
+            {"name": "Vestibule"},
+            {"name": "Entrance Hall", "connections": {"east": "Brightly Lit Corridor"}},
+        ],
+    )
+
+    assert sorted(map(sorted, dungeon.connected_components())) == [
+        ["Brightly Lit Corridor", "Dark Corridor", "Entrance Hall", "Treasure Chamber"],
+        ["Vestibule"],
+    ]
+
+
+_ROUTING_SCRIPT = """
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.game_factory import GameFactory
+
+world = GameFactory().create_world(list(generate_locations(400, branching=0.5)))
+table = world.graph.routing_table(["Room 399", "Room 0"])
+print(sorted(table.items()))
+"""
+
+
+def test_routing_table_does_not_depend_on_hash_seed():
+    import grasp_adventure
+
+    src_dir = os.path.dirname(os.path.dirname(grasp_adventure.__file__))
+    outputs = set()
+    for hash_seed in ["1", "3"]:
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=src_dir)
+        result = subprocess.run(
+            [sys.executable, "-c", _ROUTING_SCRIPT],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        outputs.add(result.stdout)
+    assert len(outputs) == 1
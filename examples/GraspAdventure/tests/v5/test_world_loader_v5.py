@@ -0,0 +1,93 @@
+from io import BytesIO, StringIO
+
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.validation import InvalidLocationDescriptions
+from grasp_adventure.v5.world_loader import (
+    read_binary,
+    read_jsonl,
+    read_location_file,
+    write_binary,
+    write_jsonl,
+    write_location_file,
+)
+from fixtures_v5 import *  # noqa
+
+
+def connection_names(world):
+    return {
+        name: {d: target.name for d, target in location.connections.items()}
+        for name, location in world.locations.items()
+    }
+
+
+def test_jsonl_round_trip():
+    file = StringIO()
+    write_jsonl(dungeon_locations, file)
+    file.seek(0)
+
+    assert list(read_jsonl(file)) == dungeon_locations
+
+
+def test_binary_round_trip():
+    locations = list(generate_locations(50, object_density=0.5))
+    file = BytesIO()
+    write_binary(locations, file)
+    file.seek(0)
+
+    assert list(read_binary(file)) == locations
+
+
+def test_read_binary_rejects_other_files():
+    with pytest.raises(ValueError):
+        list(read_binary(BytesIO(b'{"name": "Room 1"}\n')))
+
+
+def test_read_binary_detects_truncated_files():
+    file = BytesIO()
+    write_binary(simple_locations, file)
+
+    with pytest.raises(ValueError):
+        list(read_binary(BytesIO(file.getvalue()[:-3])))
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_read_location_file(tmp_path, binary):
+    path = tmp_path / "locations.dat"
+    write_location_file(dungeon_locations, path, binary=binary)
+
+    assert list(read_location_file(path)) == dungeon_locations
+
+
+def test_create_world_from_stream():
+    expected = GameFactory().create_world(dungeon_locations)
+    world = GameFactory().create_world_from_stream(iter(dungeon_locations))
+
+    assert world.initial_location_name == "Vestibule"
+    assert connection_names(world) == connection_names(expected)
+    assert list(world["Entrance Hall"].connections) == ["west", "east", "south"]
+
+
+def test_create_world_from_stream_with_unknown_location():
+    with pytest.raises(InvalidLocationDescriptions):
+        GameFactory().create_world_from_stream(
+            [{"name": "Room 1", "connections": {"north": "Nowhere"}}]
+        )
+
+
+def test_create_world_from_stream_twice_raises_error():
+    factory = GameFactory()
+    factory.create_world_from_stream(simple_locations)
+    with pytest.raises(ValueError):
+        factory.create_world_from_stream(simple_locations)
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_load_world(tmp_path, binary):
+    path = tmp_path / "locations.dat"
+    write_location_file(generate_locations(100), path, binary=binary)
+
+    world = GameFactory().load_world(path)
+
+    assert len(world.locations) == 100
+    assert len(world.graph.distances_from("Room 0")) == 100
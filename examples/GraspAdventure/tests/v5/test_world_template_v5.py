@@ -0,0 +1,83 @@
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.data.world_generator import generate_locations
+from grasp_adventure.v5.world_template import WorldTemplate
+from fixtures_v5 import *  # noqa
+
+
+@pytest.fixture()
+def template():
+    return WorldTemplate.from_descriptions(dungeon_locations)
+
+
+def connection_names(world):
+    return {
+        name: {
+            direction: target.name
+            for direction, target in location.connections.items()
+        }
+        for name, location in world.locations.items()
+    }
+
+
+def test_create_world_matches_game_factory(template):
+    expected = GameFactory().create_world(dungeon_locations)
+
+    world = template.create_world()
+
+    assert world.initial_location_name == expected.initial_location_name
+    assert connection_names(world) == connection_names(expected)
+    for name, location in world.locations.items():
+        assert location.description == expected[name].description
+        assert location.objects == expected[name].objects
+        assert [action.description for action in location.turn_actions] == [
+            action.description for action in expected[name].turn_actions
+        ]
+
+
+def test_worlds_are_independent(template):
+    world1 = template.create_world()
+    world2 = template.create_world()
+
+    world1["Vestibule"].connections = {}
+
+    assert world2["Vestibule"]["north"] is world2["Entrance Hall"]
+    assert world1.distance("Vestibule", "Entrance Hall") is None
+    assert world2.distance("Vestibule", "Entrance Hall") == 1
+
+
+def test_worlds_share_strings_and_objects(template):
+    world1 = template.create_world()
+    world2 = template.create_world()
+
+    assert world1["Vestibule"].description is world2["Vestibule"].description
+    assert (
+        world1["Treasure Chamber"].objects[0] is world2["Treasure Chamber"].objects[0]
+    )
+    assert set(template.objects) == {"Torch", "Treasure Chest"}
+
+
+def test_invalid_descriptions_are_rejected_once():
+    with pytest.raises(ValueError):
+        WorldTemplate.from_descriptions(
+            [{"name": "Room 1", "connections": {"north": "Room 2"}}]
+        )
+    with pytest.raises(KeyError):
+        WorldTemplate.from_descriptions([{"name": "Room 1", "objects": ["Sword"]}])
+
+
+def test_create_factory(template):
+    factory = template.create_factory()
+
+    player = factory.create_player("The Hero")
+
+    assert player.location is factory.world["Vestibule"]
+    assert factory.objects is template.objects
+
+
+def test_template_from_generator():
+    template = WorldTemplate.from_descriptions(generate_locations(100, seed=3))
+
+    world = template.create_world()
+
+    assert len(world.locations) == 100
+    assert world.initial_location_name == "Room 0"
@@ -0,0 +1,29 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_PATH = Path(__file__).parents[1] / "benchmarks" / "version_benchmark.py"
+
+
+@pytest.fixture(scope="module")
+def version_benchmark():
+    spec = importlib.util.spec_from_file_location("version_benchmark", BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_all_adapters_run(version_benchmark):
+    results = version_benchmark.run_benchmarks(
+        version_benchmark.VERSIONS, version_benchmark.SCENARIOS, repeat=1, number=4
+    )
+
+    assert list(results) == version_benchmark.VERSIONS
+    assert list(results["v1"]) == ["create_world"]
+    assert list(results["v3c"]) == ["create_world", "move"]
+    assert list(results["v5"]) == version_benchmark.SCENARIOS
+    for scenarios in results.values():
+        for result in scenarios.values():
+            assert result["seconds"] > 0
+            assert result["bytes"] >= 0
@@ -1,5 +1,7 @@
-﻿from dataclasses import dataclass, field
-from typing import Optional
+﻿from dataclasses import dataclass, field, replace
+from heapq import merge
+from itertools import islice
+from typing import Iterator, Optional
 
 @dataclass
 class Recipe:
@@ -12,10 +14,58 @@ class Recipe:
 @dataclass
 class RecipeBook:
     recipes: list[Recipe] = field(default_factory=list)
+    _ingredient_index: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _rating_index: dict[Optional[int], list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _num_indexed: int = field(default=0, init=False, repr=False, compare=False)
 
     def add_recipe(self, recipe: Recipe):
         self.recipes.append(recipe)
 
+    def remove_recipe(self, recipe: Recipe):
+        self.recipes.remove(recipe)
+        self.recipes_changed()
+
+    def replace_recipe(self, old_recipe: Recipe, new_recipe: Recipe):
+        self.recipes[self.recipes.index(old_recipe)] = new_recipe
+        self.recipes_changed()
+
+    def update_recipe(self, recipe: Recipe, **changes):
+        """Change attributes of a recipe in this book, e.g., its rating.
+
+        >>> book = RecipeBook([Recipe("Omelette", ["egg"], "...", 4)])
+        >>> book.update_recipe(book.recipes[0], rating=5)
+        >>> [r.name for r in book.query().with_rating(5)]
+        ['Omelette']
+        """
+        for name, value in changes.items():
+            setattr(recipe, name, value)
+        self.recipes_changed()
+
+    def recipes_changed(self):
+        """Discard the indices used by `query()`.
+
+        This happens automatically when recipes are removed, replaced or
+        updated with the methods of this class. Recipes appended to `recipes`
+        are indexed by the next query, and if the list has shrunk the indices
+        are rebuilt; call this method after replacing an element of `recipes`
+        or modifying one of the recipes directly."""
+        self._ingredient_index.clear()
+        self._rating_index.clear()
+        self._num_indexed = 0
+
+    def query(self) -> "RecipeQuery":
+        """Return a lazy query over all recipes in this book.
+
+        >>> book = RecipeBook([Recipe("Omelette", ["egg"], "...", 4)])
+        >>> [r.name for r in book.query().with_ingredient("egg").rating_at_least(4)]
+        ['Omelette']
+        """
+        return RecipeQuery(self)
+
     def get_recipe_by_name(self, name: str) -> Recipe:
         for recipe in self.recipes:
             if recipe.name == name:
@@ -41,4 +91,119 @@ class RecipeBook:
         for recipe in self.recipes:
             if recipe.rating is None or recipe.rating >= min_rating:
                 result.append(recipe)
-        return result
\ No newline at end of file
+        return result
+
+    def _update_indices(self):
+        """Index every recipe that has not been indexed so far.
+
+        If the list has shrunk since the last update we start over."""
+        recipes = self.recipes
+        if self._num_indexed > len(recipes):
+            self.recipes_changed()
+        for position in range(self._num_indexed, len(recipes)):
+            self._index_recipe(position, recipes[position])
+        self._num_indexed = len(recipes)
+
+    def _index_recipe(self, position: int, recipe: Recipe):
+        for ingredient in set(recipe.ingredients):
+            self._ingredient_index.setdefault(ingredient, []).append(position)
+        self._rating_index.setdefault(recipe.rating, []).append(position)
+
+
+@dataclass(frozen=True)
+class RecipeQuery:
+    """A composable, lazily evaluated query over a `RecipeBook`.
+
+    Every method returns a new query, so partial queries can be shared. The
+    recipes are only looked up when the query is iterated; they are returned in
+    the order in which they were added to the book. The query uses the indices
+    of the book, which see recipes appended to or removed from `recipes`; other
+    changes must be announced with `RecipeBook.recipes_changed()`.
+
+    >>> book = RecipeBook([
+    ...     Recipe("Omelette", ["egg", "butter"], "...", 4),
+    ...     Recipe("Pancakes", ["egg", "flour", "milk"], "...", 5),
+    ...     Recipe("Toast", ["bread", "butter"], "...", 3),
+    ... ])
+    >>> eggs = book.query().with_ingredient("egg")
+    >>> [r.name for r in eggs.rating_at_least(5)]
+    ['Pancakes']
+    >>> [r.name for r in book.query().with_ingredient("butter").limit(1)]
+    ['Omelette']
+    >>> [r.name for r in book.query().offset(1).limit(1)]
+    ['Pancakes']
+    """
+
+    book: RecipeBook
+    ingredients: tuple[str, ...] = ()
+    rating: Optional[int] = None
+    min_rating: Optional[int] = None
+    num_skipped: int = 0
+    max_results: Optional[int] = None
+
+    def with_ingredient(self, ingredient: str) -> "RecipeQuery":
+        return replace(self, ingredients=(*self.ingredients, ingredient))
+
+    def with_rating(self, rating: int) -> "RecipeQuery":
+        return replace(self, rating=rating)
+
+    def rating_at_least(self, min_rating: int) -> "RecipeQuery":
+        """Restrict the query to recipes with at least `min_rating`.
+
+        As for `RecipeBook.get_recipes_above_rating()` unrated recipes are
+        included in the result."""
+        if self.min_rating is not None:
+            min_rating = max(min_rating, self.min_rating)
+        return replace(self, min_rating=min_rating)
+
+    def offset(self, num_recipes: int) -> "RecipeQuery":
+        return replace(self, num_skipped=num_recipes)
+
+    def limit(self, num_recipes: int) -> "RecipeQuery":
+        return replace(self, max_results=num_recipes)
+
+    def __iter__(self) -> Iterator[Recipe]:
+        recipes = self.book.recipes
+        matches = (
+            recipes[position]
+            for position in self._candidate_positions()
+            # The list may shrink while the query is iterated.
+            if position < len(recipes) and self._matches(recipes[position])
+        )
+        stop = None
+        if self.max_results is not None:
+            stop = self.num_skipped + self.max_results
+        return islice(matches, self.num_skipped, stop)
+
+    def _candidate_positions(self) -> Iterator[int]:
+        """Pick the most selective index that applies to this query.
+
+        Every index yields positions in ascending order; if no index applies we
+        have to scan all recipes."""
+        self.book._update_indices()
+        candidates: list[list[int]] = [
+            self.book._ingredient_index.get(ingredient, [])
+            for ingredient in self.ingredients
+        ]
+        if self.rating is not None:
+            candidates.append(self.book._rating_index.get(self.rating, []))
+        if candidates:
+            return iter(min(candidates, key=len))
+        if self.min_rating is not None:
+            return merge(
+                *(
+                    positions
+                    for rating, positions in self.book._rating_index.items()
+                    if rating is None or rating >= self.min_rating
+                )
+            )
+        return iter(range(len(self.book.recipes)))
+
+    def _matches(self, recipe: Recipe) -> bool:
+        if self.rating is not None and recipe.rating != self.rating:
+            return False
+        if self.min_rating is not None and not (
+            recipe.rating is None or recipe.rating >= self.min_rating
+        ):
+            return False
+        return all(ingredient in recipe.ingredients for ingredient in self.ingredients)
@@ -60,3 +60,95 @@ def test_get_recipes_above_rating(recipe1, recipe2, recipe_book):
     assert recipe_book.get_recipes_above_rating(4) == [recipe1, recipe2]
     assert recipe_book.get_recipes_above_rating(5) == [recipe2]
     assert recipe_book.get_recipes_above_rating(6) == []
+
+
+def test_query_without_restrictions(recipe1, recipe2, recipe_book):
+    assert list(recipe_book.query()) == [recipe1, recipe2]
+
+
+def test_query_combines_restrictions(recipe1, recipe2, recipe_book):
+    query = recipe_book.query().with_ingredient("ingredient 1")
+    assert list(query.rating_at_least(5)) == [recipe2]
+    assert list(query.with_ingredient("my ingredient 2")) == [recipe1]
+    assert list(query.with_rating(4).with_ingredient("your ingredient 2")) == []
+
+
+def test_query_with_limit_and_offset(recipe1, recipe2, recipe_book):
+    assert list(recipe_book.query().limit(1)) == [recipe1]
+    assert list(recipe_book.query().offset(1).limit(1)) == [recipe2]
+    assert list(recipe_book.query().offset(2)) == []
+
+
+def test_query_is_lazy(recipe_book):
+    recipe_book.recipes.extend(
+        Recipe(f"Recipe {i}", ["ingredient 1"], "...", 3) for i in range(100_000)
+    )
+    recipe_book.recipes_changed()
+    recipes = iter(recipe_book.query().with_ingredient("ingredient 1").limit(20))
+    assert next(recipes).name == "My Recipe"
+
+
+def test_query_sees_added_recipes(recipe_book):
+    assert list(recipe_book.query().with_rating(3)) == []
+    new_recipe = Recipe("New Recipe", ["ingredient 1"], "...", 3)
+    recipe_book.add_recipe(new_recipe)
+    assert list(recipe_book.query().with_rating(3)) == [new_recipe]
+
+
+def test_query_sees_removed_and_replaced_recipes(recipe1, recipe2, recipe_book):
+    assert list(recipe_book.query().with_ingredient("ingredient 1")) == [
+        recipe1,
+        recipe2,
+    ]
+    recipe_book.remove_recipe(recipe1)
+    new_recipe = Recipe("New Recipe", ["x"], "...", 3)
+    recipe_book.replace_recipe(recipe2, new_recipe)
+    assert list(recipe_book.query().with_ingredient("ingredient 1")) == []
+    assert list(recipe_book.query().with_ingredient("x")) == [new_recipe]
+    assert list(recipe_book.query().with_rating(3)) == [new_recipe]
+
+
+def test_query_sees_updated_recipes(recipe1, recipe2, recipe_book):
+    assert list(recipe_book.query().with_rating(5)) == [recipe2]
+    recipe_book.update_recipe(recipe1, rating=5, ingredients=["x"])
+    assert list(recipe_book.query().with_rating(5)) == [recipe1, recipe2]
+    assert list(recipe_book.query().with_ingredient("x")) == [recipe1]
+    assert list(recipe_book.query().with_ingredient("my ingredient 2")) == []
+
+
+def test_query_sees_announced_direct_changes(recipe_book):
+    assert list(recipe_book.query().with_rating(5)) == [recipe_book.recipes[1]]
+    recipe_book.recipes.pop(0)
+    new_recipe = Recipe("New Recipe", ["x"], "...", 3)
+    recipe_book.recipes.append(new_recipe)
+    recipe_book.recipes[0].rating = 3
+    recipe_book.recipes_changed()
+    assert list(recipe_book.query().with_rating(3)) == [
+        recipe_book.recipes[0],
+        new_recipe,
+    ]
+    assert list(recipe_book.query().with_ingredient("x")) == [new_recipe]
+
+
+def test_query_sees_unannounced_appends_and_removals(recipe1, recipe2, recipe_book):
+    assert list(recipe_book.query().with_ingredient("x")) == []
+    new_recipe = Recipe("New Recipe", ["x"], "...", 3)
+    recipe_book.recipes.append(new_recipe)
+    assert list(recipe_book.query().with_ingredient("x")) == [new_recipe]
+    recipe_book.recipes.pop()
+    recipe_book.recipes.pop()
+    assert list(recipe_book.query().with_ingredient("x")) == []
+    assert list(recipe_book.query().with_rating(5)) == []
+    assert list(recipe_book.query()) == [recipe1]
+
+
+def test_get_recipes_see_direct_changes(recipe1, recipe2, recipe_book):
+    assert recipe_book.get_recipes_by_rating(3) == []
+    recipe_book.recipes.pop(0)
+    new_recipe = Recipe("New Recipe", ["x"], "...", 3)
+    recipe_book.recipes.append(new_recipe)
+    recipe2.rating = 4
+    assert recipe_book.get_recipes_by_rating(3) == [new_recipe]
+    assert recipe_book.get_recipes_by_rating(4) == [recipe2]
+    assert recipe_book.get_recipes_with_ingredient("x") == [new_recipe]
+    assert recipe_book.get_recipes_above_rating(4) == [recipe2]
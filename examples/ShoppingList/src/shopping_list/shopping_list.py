@@ -2,7 +2,7 @@ from dataclasses import dataclass, field  # noqa
 from typing import Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class ShoppingListItem:
     product: str
     price: float
@@ -4,3 +4,8 @@ from shopping_list import ShoppingListItem
 def test_default_args():
     item = ShoppingListItem("Coffee", 1.99)
     assert item.amount == 1
+
+
+def test_items_have_no_dict():
+    item = ShoppingListItem("Coffee", 1.99)
+    assert not hasattr(item, "__dict__")
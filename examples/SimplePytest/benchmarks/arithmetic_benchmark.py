@@ -0,0 +1,67 @@
+"""Compare the scalar and vectorized arithmetic functions on large inputs.
+
+Run from the project root with
+
+    python benchmarks/arithmetic_benchmark.py --size 10000000
+"""
+
+import argparse
+from array import array
+from random import Random
+from time import perf_counter
+
+from simple_pytest import arithmetic, vectorized
+
+
+def make_signal(size, seed=0):
+    rng = Random(seed)
+    return array("d", (rng.uniform(-1.0, 1.0) for _ in range(size)))
+
+
+def time_call(fun, *args):
+    start = perf_counter()
+    fun(*args)
+    return perf_counter() - start
+
+
+def scalar_loop(fun):
+    def loop(*signals):
+        return [fun(*values) for values in zip(*signals)]
+
+    return loop
+
+
+def run_benchmark(size):
+    x = make_signal(size, seed=1)
+    y = make_signal(size, seed=2)
+    t = make_signal(size, seed=3)
+    cases = {
+        "sign": (x,),
+        "lerp": (x, y, t),
+        "negate": (x,),
+        "my_abs": (x,),
+    }
+    print(f"{'function':<8} {'scalar [s]':>12} {'vectorized [s]':>15} {'speedup':>9}")
+    for name, args in cases.items():
+        scalar_time = time_call(scalar_loop(getattr(arithmetic, name)), *args)
+        vectorized_time = time_call(getattr(vectorized, name), *args)
+        speedup = scalar_time / vectorized_time
+        print(
+            f"{name:<8} {scalar_time:>12.3f} {vectorized_time:>15.3f} "
+            f"{speedup:>8.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark scalar vs. vectorized arithmetic functions"
+    )
+    parser.add_argument(
+        "-n", "--size", type=int, default=10_000_000, help="number of samples"
+    )
+    args = parser.parse_args()
+    run_benchmark(args.size)
+
+
+if __name__ == "__main__":
+    main()
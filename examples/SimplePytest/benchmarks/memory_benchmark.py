@@ -0,0 +1,70 @@
+"""Compare memory usage and attribute access of dict-based and slotted objects.
+
+`MyDataType` uses `__slots__`; `DictMyDataType` stores the same attributes in a
+per-instance `__dict__`. Run from the project root with
+
+    python benchmarks/memory_benchmark.py --count 1000000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from simple_pytest.my_data_type import MyDataType
+
+
+class DictMyDataType:
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+def bytes_per_instance(cls, count):
+    # Allocate the values and the list holding the instances before tracing so
+    # that only the memory used by the instances themselves is measured.
+    values = list(range(count))
+    instances = [None] * count
+    tracemalloc.start()
+    try:
+        for i, value in enumerate(values):
+            instances[i] = cls(value, value)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / count
+
+
+def access_time_ns(cls, number):
+    instance = cls(2, 3)
+    total = timeit.timeit("obj.a + obj.b", globals={"obj": instance}, number=number)
+    return total / number * 1e9
+
+
+def run_benchmark(count, number):
+    print(f"{'layout':<8} {'bytes/instance':>15} {'access [ns]':>12}")
+    for name, cls in [("dict", DictMyDataType), ("slots", MyDataType)]:
+        size = bytes_per_instance(cls, count)
+        access_time = access_time_ns(cls, number)
+        print(f"{name:<8} {size:>15.1f} {access_time:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark dict-based vs. slotted MyDataType instances"
+    )
+    parser.add_argument(
+        "-c", "--count", type=int, default=1_000_000, help="number of instances"
+    )
+    parser.add_argument(
+        "-n",
+        "--number",
+        type=int,
+        default=10_000_000,
+        help="number of attribute accesses to time",
+    )
+    args = parser.parse_args()
+    run_benchmark(args.count, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""A struct-of-arrays collection of `MyDataType` values.
+
+Like `simple_pytest.vectorized` this module needs NumPy, which can be installed
+with
+
+    pip install simple-pytest[vectorized]
+"""
+
+import sys
+from typing import Iterable
+
+from .my_data_type import MyDataType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+DEFAULT_CHUNK_SIZE = 1 << 14
+
+
+class MyDataTypeArray:
+    """Store the attributes `a` and `b` of many `MyDataType` values in two
+    contiguous arrays and compute the results for all of them at once."""
+
+    def __init__(self, a, b):
+        if np is None:
+            raise ImportError("MyDataTypeArray requires NumPy to be installed.")
+        self.a = np.ascontiguousarray(a)
+        self.b = np.ascontiguousarray(b)
+        if self.a.shape != self.b.shape or self.a.ndim != 1:
+            raise ValueError(
+                "a and b must be one-dimensional and have the same length, "
+                f"got shapes {self.a.shape} and {self.b.shape}."
+            )
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[MyDataType]) -> "MyDataTypeArray":
+        objects = list(objects)
+        return cls([obj.a for obj in objects], [obj.b for obj in objects])
+
+    def __len__(self):
+        return len(self.a)
+
+    def __getitem__(self, index) -> MyDataType:
+        return MyDataType(self.a[index].item(), self.b[index].item())
+
+    def compute_result(self):
+        return self.a + self.b * 2
+
+    def compute_another_result(self):
+        return 2 * self.a + self.b
+
+    def compute_results(self):
+        """Return both results for all elements as array of shape (2, len(self))."""
+        results = np.empty((2, len(self)), np.result_type(self.a, self.b, 2))
+        np.multiply(self.b, 2, out=results[0])
+        results[0] += self.a
+        np.multiply(self.a, 2, out=results[1])
+        results[1] += self.b
+        return results
+
+    def print_results(self, file=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Print both results for every element, one element per line.
+
+        The output is identical to calling `MyDataType.print_results()` for each
+        element, but it is formatted and written in chunks of `chunk_size`
+        lines."""
+        if file is None:
+            file = sys.stdout
+        results = self.compute_results()
+        for start in range(0, len(self), chunk_size):
+            chunk = results[:, start : start + chunk_size].tolist()
+            file.write(
+                "".join(
+                    f"The results are: {result}, {another_result}.\n"
+                    for result, another_result in zip(*chunk)
+                )
+            )
@@ -0,0 +1,105 @@
+"""Vectorized versions of the functions in `simple_pytest.arithmetic`.
+
+The functions accept scalars, sequences, objects supporting the buffer protocol
+and NumPy arrays. Their arguments are broadcast against each other, and they
+return NumPy arrays (or NumPy scalars for scalar arguments), just like NumPy's
+ufuncs do.
+
+NumPy is an optional dependency; install it with
+
+    pip install simple-pytest[vectorized]
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _as_array(x):
+    if np is None:
+        raise ImportError("The vectorized functions require NumPy to be installed.")
+    return np.asarray(x)
+
+
+def sign(x):
+    """Compute the sign of each element of x."""
+    x = _as_array(x)
+    return np.sign(x)
+
+
+def lerp(x, y, t, out=None):
+    """Linearly interpolate between x and y, element by element.
+
+    If `out` is given the result is written into it (see `lerp_into()`) and
+    `out` is returned."""
+    if out is not None:
+        return lerp_into(x, y, t, out)
+    x, y, t = _as_array(x), _as_array(y), _as_array(t)
+    return (1 - t) * x + t * y
+
+
+def lerp_into(x, y, t, out, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write the linear interpolation between x and y into the array `out`.
+
+    `out` must be a writable NumPy array or an object supporting the buffer
+    protocol (e.g., an `array.array`) with a floating point element type; other
+    objects raise a `TypeError`, since the result could not be seen through
+    them. The arguments are broadcast to the shape of `out`, therefore `t` can
+    be a single value or contain one value per element. The computation is
+    performed in chunks of `chunk_size` rows, reusing a single scratch buffer.
+    Apart from this buffer no memory is allocated, so `x`, `y`, `t` and `out`
+    may be memory-mapped arrays that are much larger than the available memory.
+
+    The result is computed as `(1 - t) * x + t * y`, i.e., it is identical to the
+    result of `simple_pytest.arithmetic.lerp()`.
+    """
+    result = _as_writable_array(out)
+    x, y, t = (np.broadcast_to(_as_array(arg), result.shape) for arg in (x, y, t))
+    if result.ndim == 0:
+        _lerp_chunk(x, y, t, result, np.empty_like(result))
+        return out
+    scratch = np.empty((min(chunk_size, len(result)), *result.shape[1:]), result.dtype)
+    for start in range(0, len(result), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        num_rows = len(result[chunk])
+        _lerp_chunk(x[chunk], y[chunk], t[chunk], result[chunk], scratch[:num_rows])
+    return out
+
+
+def _as_writable_array(out):
+    if np is None:
+        raise ImportError("The vectorized functions require NumPy to be installed.")
+    if not isinstance(out, np.ndarray):
+        try:
+            out = np.asarray(memoryview(out))
+        except TypeError:
+            raise TypeError(
+                f"out must be an array or a buffer, not {type(out).__name__}"
+            ) from None
+    if not out.flags.writeable:
+        raise TypeError("out must be writable")
+    if not np.issubdtype(out.dtype, np.floating):
+        raise TypeError(f"out must have a floating point type, not {out.dtype}")
+    return out
+
+
+def _lerp_chunk(x, y, t, out, scratch):
+    np.subtract(1, t, out=scratch)
+    np.multiply(scratch, x, out=scratch)
+    np.multiply(t, y, out=out)
+    np.add(out, scratch, out=out)
+
+
+def negate(x):
+    """Return the negative value of each element of x."""
+    x = _as_array(x)
+    return np.negative(x)
+
+
+def my_abs(x):
+    """Return the absolute value of each element of x."""
+    x = _as_array(x)
+    return np.absolute(x)
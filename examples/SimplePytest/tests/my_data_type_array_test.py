@@ -0,0 +1,57 @@
+from io import StringIO
+
+import pytest
+
+from simple_pytest.my_data_type import MyDataType
+from simple_pytest.my_data_type_array import MyDataTypeArray
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture()
+def my_data_type_array():
+    return MyDataTypeArray([2, 1, 0], [3, -1, 5])
+
+
+def test_from_objects():
+    unit = MyDataTypeArray.from_objects([MyDataType(2, 3), MyDataType(1, -1)])
+    assert unit.a.tolist() == [2, 1]
+    assert unit.b.tolist() == [3, -1]
+
+
+def test_arrays_must_have_same_length():
+    with pytest.raises(ValueError):
+        MyDataTypeArray([1, 2], [1])
+
+
+def test_len_and_getitem(my_data_type_array):
+    assert len(my_data_type_array) == 3
+    item = my_data_type_array[0]
+    assert (item.a, item.b) == (2, 3)
+
+
+def test_compute_result(my_data_type_array):
+    assert my_data_type_array.compute_result().tolist() == [8, -1, 10]
+
+
+def test_compute_another_result(my_data_type_array):
+    assert my_data_type_array.compute_another_result().tolist() == [7, 1, 5]
+
+
+def test_compute_results(my_data_type_array):
+    assert my_data_type_array.compute_results().tolist() == [[8, -1, 10], [7, 1, 5]]
+
+
+def test_print_results_matches_scalar_version(my_data_type_array, capsys):
+    for i in range(len(my_data_type_array)):
+        my_data_type_array[i].print_results()
+    expected = capsys.readouterr().out
+
+    my_data_type_array.print_results(chunk_size=2)
+    assert capsys.readouterr().out == expected
+
+
+def test_print_results_to_file(my_data_type_array):
+    file = StringIO()
+    my_data_type_array.print_results(file)
+    assert file.getvalue().splitlines()[0] == "The results are: 8, 7."
@@ -29,3 +29,9 @@ def test_compute_another_result_with_fixture(my_data_type):
 def test_print_results(my_data_type, capsys):
     my_data_type.print_results()
     assert capsys.readouterr().out.strip() == "The results are: 8, 7."
+
+
+def test_instances_have_no_dict(my_data_type):
+    assert not hasattr(my_data_type, "__dict__")
+    with pytest.raises(AttributeError):
+        my_data_type.c = 1
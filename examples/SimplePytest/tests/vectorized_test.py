@@ -0,0 +1,108 @@
+from array import array
+
+import pytest
+
+from simple_pytest import arithmetic, vectorized
+from simple_pytest.vectorized import lerp, lerp_into, my_abs, negate, sign
+
+np = pytest.importorskip("numpy")
+
+
+def test_sign():
+    assert sign([2, -2, 0]).tolist() == [1, -1, 0]
+
+
+def test_sign_for_scalar():
+    assert sign(-2) == arithmetic.sign(-2)
+
+
+def test_negate():
+    assert negate([2, -2]).tolist() == [-2, 2]
+
+
+def test_my_abs():
+    assert my_abs([2, -2, 0]).tolist() == [2, 2, 0]
+
+
+def test_functions_accept_buffers():
+    assert my_abs(array("d", [1.5, -2.5])).tolist() == [1.5, 2.5]
+
+
+@pytest.mark.parametrize(
+    "function, args",
+    [(sign, [1]), (negate, [1]), (my_abs, [1]), (lerp, [1, 3, 0.5])],
+)
+def test_functions_require_numpy(function, args, monkeypatch):
+    monkeypatch.setattr(vectorized, "np", None)
+    with pytest.raises(ImportError):
+        function(*args)
+
+
+class TestLerp:
+    def test_for_scalar_arguments(self):
+        assert lerp(1, 3, 0.5) == arithmetic.lerp(1, 3, 0.5)
+
+    def test_broadcasts_t(self):
+        assert lerp(1, 3, [0, 0.5, 1]).tolist() == [1, 2, 3]
+
+    def test_broadcasts_boundaries(self):
+        result = lerp([[0], [10]], [1, 2], 0.5)
+        assert result.tolist() == [[0.5, 1.0], [5.5, 6.0]]
+
+    def test_agrees_with_scalar_version(self):
+        x = np.linspace(-5, 5, 11)
+        t = np.linspace(0, 1, 11)
+        expected = [arithmetic.lerp(xi, 2 * xi, ti) for xi, ti in zip(x, t)]
+        assert lerp(x, 2 * x, t).tolist() == expected
+
+
+class TestLerpInto:
+    def test_writes_into_out(self):
+        out = np.empty(3)
+        result = lerp(1, 3, [0, 0.5, 1], out=out)
+        assert result is out
+        assert out.tolist() == [1, 2, 3]
+
+    def test_with_per_element_t_in_several_chunks(self):
+        x = np.arange(10.0)
+        t = np.linspace(0, 1, 10)
+        out = np.empty(10)
+        lerp_into(x, 2 * x, t, out, chunk_size=3)
+        assert out.tolist() == lerp(x, 2 * x, t).tolist()
+
+    def test_with_multidimensional_out(self):
+        out = np.empty((3, 2))
+        lerp_into([0, 10], [1, 20], [[0], [0.5], [1]], out, chunk_size=2)
+        assert out.tolist() == [[0, 10], [0.5, 15], [1, 20]]
+
+    def test_with_scalar_out(self):
+        out = np.empty(())
+        lerp_into(1, 3, 0.5, out)
+        assert out == 2
+
+    def test_with_memory_mapped_arrays(self, tmp_path):
+        x = np.memmap(tmp_path / "x.dat", np.float64, "w+", shape=(1000,))
+        x[:] = np.arange(1000)
+        out = np.memmap(tmp_path / "out.dat", np.float64, "w+", shape=(1000,))
+        lerp_into(x, 0, 0.5, out, chunk_size=128)
+        out.flush()
+        result = np.memmap(tmp_path / "out.dat", np.float64, "r", shape=(1000,))
+        assert result.tolist() == (np.arange(1000) / 2).tolist()
+
+    def test_writes_into_buffer(self):
+        out = array("d", [0.0, 0.0])
+        assert lerp_into([0, 2], [2, 4], 0.5, out) is out
+        assert out.tolist() == [1, 3]
+
+    @pytest.mark.parametrize(
+        "out", [[0.0, 0.0], (0.0, 0.0), b"\0" * 16, np.zeros(2, int)]
+    )
+    def test_rejects_unusable_out(self, out):
+        with pytest.raises(TypeError):
+            lerp_into([0, 2], [2, 4], 0.5, out)
+
+    def test_rejects_read_only_out(self):
+        out = np.zeros(2)
+        out.flags.writeable = False
+        with pytest.raises(TypeError):
+            lerp_into([0, 2], [2, 4], 0.5, out)
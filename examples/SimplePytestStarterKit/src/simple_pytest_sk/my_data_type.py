@@ -1,4 +1,6 @@
 class MyDataType:
+    __slots__ = ("a", "b")
+
     def __init__(self, a, b):
         self.a = a
         self.b = b